@@ -1,6 +1,7 @@
 # __init__.py
 
-from .cell import Cell
+from .cell import Cell, measure_cell_bytes
 from .board import Board
+from .array_board import ArrayBoard
 from .game import Game
 from .gui import MinesweeperGUI
@@ -0,0 +1,628 @@
+# array_board.py
+
+import numpy as np  # NumPy provides the compact state planes
+from mem679_minesweeper.adjacency import count_adjacent_mines, neighborhood_region
+from mem679_minesweeper.placement import (
+    resolve_rng, safe_zone_indices, sample_mine_indices,
+)
+
+
+class ArrayCell:
+    """
+    A lightweight view of a single cell stored in an ArrayBoard.
+
+    The view owns no state of its own: every attribute is read from, and every
+    mutation is written to, the NumPy planes of the board it belongs to. It offers
+    the same attributes and methods as Cell so that Game, the GUI and the tests can
+    treat both engines alike.
+
+    Attributes:
+        board (ArrayBoard): The board holding the cell state.
+        x (int): The row index of the cell on the board.
+        y (int): The column index of the cell on the board.
+    """
+
+    __slots__ = ('board', 'x', 'y')
+
+    def __init__(self, board, x, y):
+        """
+        Initializes a view of the cell at (x, y) on the given board.
+
+        Args:
+            board (ArrayBoard): The board holding the cell state.
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+        """
+        self.board = board
+        self.x = x
+        self.y = y
+
+    @property
+    def is_mine(self):
+        """bool: Indicates whether the cell contains a mine."""
+        return bool(self.board.mines[self.x, self.y])
+
+    @property
+    def is_revealed(self):
+        """bool: Indicates whether the cell has been revealed."""
+        return bool(self.board.revealed[self.x, self.y])
+
+    @property
+    def is_flagged(self):
+        """bool: Indicates whether the cell has been flagged by the player."""
+        return bool(self.board.flagged[self.x, self.y])
+
+    @property
+    def adjacent_mines(self):
+        """int: The number of mines adjacent to this cell."""
+        return int(self.board.adjacent[self.x, self.y])
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, count):
+        self.board.adjacent[self.x, self.y] = count
+
+    def reveal(self):
+        """
+        Reveals the cell if it is not flagged and not already revealed.
+
+        Returns:
+            bool: True if the cell was successfully revealed, False otherwise.
+        """
+        board = self.board
+        if not board.flagged[self.x, self.y] and not board.revealed[self.x, self.y]:
+            board.revealed[self.x, self.y] = True
+            if not board.mines[self.x, self.y]:
+                board.revealed_safe += 1  # Keep the board's counter in step
+            return True  # Cell was successfully revealed
+        return False  # Cell could not be revealed
+
+    def conceal(self):
+        """
+        Covers the cell again if it has been revealed, e.g. when a move is undone.
+
+        Returns:
+            bool: True if the cell was covered, False if it was not revealed.
+        """
+        board = self.board
+        if board.revealed[self.x, self.y]:
+            board.revealed[self.x, self.y] = False
+            if not board.mines[self.x, self.y]:
+                board.revealed_safe -= 1  # Keep the board's counter in step
+            return True
+        return False
+
+    def toggle_flag(self):
+        """
+        Toggles the flagged state of the cell unless it has already been revealed.
+        """
+        self.board.toggle_flag(self.x, self.y)
+
+    def set_mine(self):
+        """
+        Sets the cell to contain a mine.
+        """
+        self.board._set_mine(self.x, self.y, True)
+
+    def clear_mine(self):
+        """
+        Removes the mine from the cell, if it has one.
+        """
+        self.board._set_mine(self.x, self.y, False)
+
+    def set_adjacent_mines(self, count):
+        """
+        Sets the number of adjacent mines for the cell.
+
+        Args:
+            count (int): The number of mines adjacent to this cell.
+        """
+        self.adjacent_mines = count
+
+
+class ArrayGridRow:
+    """
+    A read-only sequence of ArrayCell views for one row of an ArrayBoard.
+
+    Attributes:
+        board (ArrayBoard): The board the row belongs to.
+        x (int): The row index.
+    """
+
+    __slots__ = ('board', 'x')
+
+    def __init__(self, board, x):
+        """
+        Initializes the row view.
+
+        Args:
+            board (ArrayBoard): The board the row belongs to.
+            x (int): The row index.
+        """
+        self.board = board
+        self.x = x
+
+    def __len__(self):
+        return self.board.columns
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.board.columns:
+            raise IndexError('column index out of range')
+        return ArrayCell(self.board, self.x, y)
+
+    def __iter__(self):
+        for y in range(self.board.columns):
+            yield ArrayCell(self.board, self.x, y)
+
+
+class ArrayGrid:
+    """
+    A read-only, list-of-lists style view over the cells of an ArrayBoard.
+
+    It lets code written against ``board.grid[x][y]`` run unchanged on the array
+    engine. Views are created on access and are not cached.
+
+    Attributes:
+        board (ArrayBoard): The board the grid belongs to.
+    """
+
+    __slots__ = ('board',)
+
+    def __init__(self, board):
+        """
+        Initializes the grid view.
+
+        Args:
+            board (ArrayBoard): The board the grid belongs to.
+        """
+        self.board = board
+
+    def __len__(self):
+        return self.board.rows
+
+    def __getitem__(self, x):
+        if not 0 <= x < self.board.rows:
+            raise IndexError('row index out of range')
+        return ArrayGridRow(self.board, x)
+
+    def __iter__(self):
+        for x in range(self.board.rows):
+            yield ArrayGridRow(self.board, x)
+
+
+class ArrayBoard:
+    """
+    Represents the game board for Minesweeper using compact NumPy state planes.
+
+    ArrayBoard is a drop-in alternative to Board. Instead of one Cell object per
+    position it keeps the whole board state in five arrays of shape
+    ``(rows, columns)``, costing five bytes per cell. This makes very large custom
+    boards practical. Cell-level access is still available through ``grid``,
+    which hands out ArrayCell views on demand.
+
+    Attributes:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        total_mines (int): Total number of mines to be placed on the board.
+        mines (numpy.ndarray): Boolean plane, True where a cell contains a mine.
+        revealed (numpy.ndarray): Boolean plane, True where a cell has been revealed.
+        flagged (numpy.ndarray): Boolean plane, True where a cell has been flagged.
+        adjacent (numpy.ndarray): uint8 plane with the number of adjacent mines.
+        grid (ArrayGrid): List-of-lists style view of the cells.
+        mines_placed (bool): Flag indicating whether mines have been placed on the
+            board.
+        safe_zone (str or array-like): Cells kept free of mines around the first click,
+            see safe_zone_indices.
+        seed (int or None): Seed the layout was drawn from, None if an RNG object
+            was supplied. The same seed and first click give the same layout on
+            every engine.
+        rng: Source of randomness used for mine placement.
+        mine_indices (numpy.ndarray): Sorted linear indices ``x * columns + y`` of the
+            cells that hold a mine.
+        mine_count (int): Number of cells that currently hold a mine.
+        revealed_safe (int): Number of revealed cells that are not mines.
+        flags_placed (int): Number of flagged cells.
+        flagged_neighbors (numpy.ndarray): uint8 plane with the number of flagged
+            neighbours of each cell.
+
+    The planes should be changed through the board methods or the cell views,
+    which keep the running counters up to date.
+    """
+
+    def __init__(self, rows, columns, mines, safe_zone='cell', seed=None, rng=None):
+        """
+        Initializes the ArrayBoard with the given dimensions and number of mines.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines to be placed on the board.
+            safe_zone (str or array-like): Cells kept free of mines around the first
+                click: 'cell', '3x3' or a boolean mask, see safe_zone_indices.
+            seed (int, optional): Seed for mine placement. A fresh one is drawn when
+                neither seed nor rng is given.
+            rng (optional): Source of randomness used instead of a seed, see
+                resolve_rng.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.total_mines = mines
+        self.safe_zone = safe_zone
+        self.seed, self.rng = resolve_rng(seed, rng)  # Randomness for placement
+        # Allocate the state planes, one byte per cell each
+        self.mines = np.zeros((rows, columns), dtype=bool)
+        self.revealed = np.zeros((rows, columns), dtype=bool)
+        self.flagged = np.zeros((rows, columns), dtype=bool)
+        self.adjacent = np.zeros((rows, columns), dtype=np.uint8)
+        self.flagged_neighbors = np.zeros((rows, columns), dtype=np.uint8)
+        self.grid = ArrayGrid(self)  # Cell views for Cell-style access
+        self.mines_placed = False  # Flag to check if mines are placed
+        # Mine index and running counters that make win and flag checks constant-time
+        self.mine_indices = np.zeros(0, dtype=np.int64)
+        self.revealed_safe = 0
+        self.flags_placed = 0
+
+    @property
+    def mine_count(self):
+        """
+        int: Number of cells that currently hold a mine.
+        """
+        return len(self.mine_indices)
+
+    @property
+    def remaining_mines(self):
+        """
+        int: Number of mines not yet accounted for by a flag. Negative when the
+        player has placed more flags than there are mines.
+        """
+        return self.total_mines - self.flags_placed
+
+    def _set_mine(self, x, y, is_mine):
+        """
+        Adds or removes the mine at (x, y) and updates the counters.
+
+        Adjacency counts are not touched; callers recompute them afterwards.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+            is_mine (bool): True to place a mine, False to remove it.
+        """
+        if self.mines[x, y] == is_mine:
+            return  # Nothing changes
+        self.mines[x, y] = is_mine
+        # Keep the mine index sorted
+        index = x * self.columns + y
+        position = np.searchsorted(self.mine_indices, index)
+        if is_mine:
+            self.mine_indices = np.insert(self.mine_indices, position, index)
+            delta = 1
+        else:
+            self.mine_indices = np.delete(self.mine_indices, position)
+            delta = -1
+        if self.revealed[x, y]:
+            self.revealed_safe -= delta  # The cell stopped or started being safe
+
+    def place_mines(self, exclude_x, exclude_y, safe_zone=None):
+        """
+        Places mines randomly on the board, excluding the cell at
+        (exclude_x, exclude_y).
+
+        Positions are drawn directly by sample_mine_indices, so placement costs
+        O(mines) rather than O(rows * columns).
+
+        Args:
+            exclude_x (int): The row index of the cell to exclude from mine
+                placement.
+            exclude_y (int): The column index of the cell to exclude from mine
+                placement.
+            safe_zone (str or array-like, optional): Cells kept free of mines around
+                the excluded cell, see safe_zone_indices. Defaults to the board's
+                safe_zone.
+        """
+        excluded = safe_zone_indices(
+            self.rows, self.columns, exclude_x, exclude_y,
+            self.safe_zone if safe_zone is None else safe_zone,
+        )
+        picks = np.array(
+            sample_mine_indices(self.rows * self.columns, self.total_mines, excluded,
+                                self.rng),
+            dtype=np.int64,
+        )
+        self.mines.reshape(-1)[picks] = True
+        self.mine_indices = np.union1d(self.mine_indices, picks)  # Sorted mine index
+
+        # Calculate the number of adjacent mines for each cell
+        self._calculate_adjacent_mines()
+        self.mines_placed = True  # Set the flag indicating mines have been placed
+
+    def _calculate_adjacent_mines(self, region=None):
+        """
+        Calculates the number of adjacent mines for the cells of a region.
+
+        Args:
+            region (tuple, optional): Half-open bounds ``(x0, x1, y0, y1)`` of the cells
+                to recompute, e.g. after mines were moved. Defaults to the whole board.
+        """
+        if region is None:
+            region = (0, self.rows, 0, self.columns)
+        x0, x1, y0, y1 = region
+        counts = count_adjacent_mines(self.mines, (x0, x1, y0, y1))
+        counts *= ~self.mines[x0:x1, y0:y1]  # Mine cells do not carry a count
+        self.adjacent[x0:x1, y0:y1] = counts
+
+    def move_mine(self, from_x, from_y, to_x, to_y):
+        """
+        Moves a mine to another cell and updates the affected adjacency counts.
+
+        Only the 3x3 neighbourhoods of the two cells are recomputed.
+
+        Args:
+            from_x (int): The row index of the cell holding the mine.
+            from_y (int): The column index of the cell holding the mine.
+            to_x (int): The row index of the cell receiving the mine.
+            to_y (int): The column index of the cell receiving the mine.
+        """
+        self._set_mine(from_x, from_y, False)
+        self._set_mine(to_x, to_y, True)
+        for x, y in ((from_x, from_y), (to_x, to_y)):
+            self._calculate_adjacent_mines(
+                neighborhood_region(x, y, self.rows, self.columns))
+
+    def _neighbors(self, x, y):
+        """
+        Yields the in-bounds neighbours of the cell at (x, y).
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Yields:
+            tuple: The (row, column) of each neighbouring cell.
+        """
+        for nx in range(max(x - 1, 0), min(x + 2, self.rows)):
+            for ny in range(max(y - 1, 0), min(y + 2, self.columns)):
+                if nx != x or ny != y:
+                    yield nx, ny
+
+    def _flat_planes(self):
+        """
+        Returns flat memoryviews over the mine, revealed, flagged and adjacency planes.
+
+        Indexing a memoryview by a linear index is considerably cheaper than
+        indexing a 2D NumPy array by coordinates, which matters in per-cell loops.
+
+        Returns:
+            tuple: Memoryviews over (mines, revealed, flagged, adjacent).
+        """
+        return (
+            memoryview(self.mines.reshape(-1)),
+            memoryview(self.revealed.reshape(-1)),
+            memoryview(self.flagged.reshape(-1)),
+            memoryview(self.adjacent.reshape(-1)),
+        )
+
+    def _flat_neighbors(self, index):
+        """
+        Returns the linear indices of the in-bounds neighbours of a cell.
+
+        Args:
+            index (int): The linear index of the cell.
+
+        Returns:
+            list of int: The linear indices of the neighbouring cells.
+        """
+        columns = self.columns
+        x, y = divmod(index, columns)
+        y_lo, y_hi = max(y - 1, 0), min(y + 2, columns)
+        result = []
+        for nx in range(max(x - 1, 0), min(x + 2, self.rows)):
+            base = nx * columns
+            for ny in range(y_lo, y_hi):
+                if nx != x or ny != y:
+                    result.append(base + ny)
+        return result
+
+    def reveal_cell(self, x, y):
+        """
+        Reveals the cell at (x, y). If the cell has zero adjacent mines, the whole
+        opening around it is revealed as well.
+
+        The opening is expanded iteratively with an explicit frontier of linear
+        indices. A cell is revealed at the moment it is pushed, so no cell is pushed
+        twice and there is no depth limit.
+
+        Args:
+            x (int): The row index of the cell to reveal.
+            y (int): The column index of the cell to reveal.
+
+        Returns:
+            set of tuple: The (row, column) of every cell revealed by this call.
+        """
+        start = x * self.columns + y
+        opened = self._flood_reveal(start)
+        # Only the starting cell of an opening can be a mine
+        triggered = 1 if opened and self.mines.flat[start] else 0
+        self.revealed_safe += len(opened) - triggered
+        return {divmod(index, self.columns) for index in opened}
+
+    def _flood_reveal(self, start):
+        """
+        Reveals the cell at a linear index and expands the opening around it.
+
+        Args:
+            start (int): The linear index of the cell to reveal.
+
+        Returns:
+            list of int: The linear indices of the cells revealed.
+        """
+        mines, revealed, flagged, adjacent = self._flat_planes()
+        if flagged[start] or revealed[start]:
+            return []  # Flagged and already revealed cells are left alone
+        revealed[start] = True
+        opened = [start]
+        if mines[start] or adjacent[start]:
+            return opened  # Only empty cells open their neighbourhood
+        frontier = [start]
+        while frontier:
+            for index in self._flat_neighbors(frontier.pop()):
+                if revealed[index] or flagged[index] or mines[index]:
+                    continue
+                revealed[index] = True
+                opened.append(index)
+                if adjacent[index] == 0:
+                    frontier.append(index)  # Keep expanding through empty cells
+        return opened
+
+    def is_mine(self, x, y):
+        """
+        Checks whether the cell at (x, y) holds a mine, using the mine index.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell holds a mine, False otherwise.
+        """
+        index = x * self.columns + y
+        position = np.searchsorted(self.mine_indices, index)
+        return bool(position < len(self.mine_indices)
+                    and self.mine_indices[position] == index)
+
+    def mine_positions(self):
+        """
+        Lists the positions of all mines in row-major order, using the mine index.
+
+        Returns:
+            list of tuple: The (row, column) of every mine.
+        """
+        columns = self.columns
+        return [divmod(index, columns) for index in self.mine_indices.tolist()]
+
+    def toggle_flag(self, x, y):
+        """
+        Toggles a flag on the cell at (x, y).
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+        """
+        if self.revealed[x, y]:
+            return  # Revealed cells cannot be flagged
+        flagged = not self.flagged[x, y]
+        self.flagged[x, y] = flagged
+        self.flags_placed += 1 if flagged else -1
+        # Every neighbour gains or loses one flagged neighbour
+        block = self.flagged_neighbors[max(x - 1, 0):x + 2, max(y - 1, 0):y + 2]
+        if flagged:
+            block += 1
+            self.flagged_neighbors[x, y] -= 1  # The cell is not its own neighbour
+        else:
+            self.flagged_neighbors[x, y] += 1  # Offset first so it never underflows
+            block -= 1
+
+    def is_win(self):
+        """
+        Checks if the player has won the game.
+
+        The player wins when all non-mine cells have been revealed. The check compares
+        the running count of revealed safe cells with the number of safe cells, so it
+        takes constant time.
+
+        Returns:
+            bool: True if the player has won, False otherwise.
+        """
+        return self.revealed_safe == self.rows * self.columns - self.mine_count
+
+    def is_lost(self):
+        """
+        Checks whether a mine has been revealed, i.e. the game on this board was lost.
+
+        Only the cells in the mine index are visited.
+
+        Returns:
+            bool: True if a mine is revealed, False otherwise.
+        """
+        return bool(self.revealed.reshape(-1)[self.mine_indices].any())
+
+    def reveal_all_mines(self):
+        """
+        Reveals all unflagged mines on the board.
+
+        Only the cells in the mine index are visited.
+
+        Returns:
+            list of int: The sorted linear indices of the mines revealed by this call;
+            flagged and already revealed mines are left out.
+        """
+        revealed = self.revealed.reshape(-1)
+        flagged = self.flagged.reshape(-1)
+        covered = ~revealed[self.mine_indices] & ~flagged[self.mine_indices]
+        newly = self.mine_indices[covered]
+        revealed[newly] = True
+        return newly.tolist()
+
+    def set_revealed(self, indices, revealed):
+        """
+        Reveals or covers cells given by linear index, without flood filling.
+
+        Used to undo and redo moves; flagged cells are not revealed. The cells are
+        updated in one vectorized assignment.
+
+        Args:
+            indices (iterable of int): Linear indices ``x * columns + y`` of the cells.
+            revealed (bool): True to reveal the cells, False to cover them.
+        """
+        plane = self.revealed.reshape(-1)
+        indices = np.fromiter(indices, dtype=np.int64)
+        changed = plane[indices] != revealed
+        if revealed:
+            changed &= ~self.flagged.reshape(-1)[indices]
+        indices = indices[changed]
+        plane[indices] = revealed
+        safe = len(indices) - int(np.count_nonzero(self.mines.reshape(-1)[indices]))
+        self.revealed_safe += safe if revealed else -safe
+
+    def chord_cell(self, x, y):
+        """
+        Performs the chording action on the cell at (x, y).
+
+        Chording reveals all adjacent unrevealed cells if the number of adjacent flags
+        equals the number of adjacent mines.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            bool: True if a mine was revealed during chording (game over), False
+                otherwise.
+        """
+        mine_triggered, _ = self.chord_reveal(x, y)
+        return mine_triggered
+
+    def chord_reveal(self, x, y):
+        """
+        Performs the chording action on the cell at (x, y) and reports what it revealed.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            tuple: ``(mine_triggered, revealed)`` where mine_triggered is True if a mine
+            was revealed and revealed is the set of (row, column) cells revealed.
+        """
+        revealed = set()
+        if not self.revealed[x, y] or self.mines[x, y]:
+            return False, revealed  # Cannot chord on unrevealed or mine cells
+
+        if self.flagged_neighbors[x, y] != self.adjacent[x, y]:
+            return False, revealed  # Flags do not match the cell's number
+
+        for nx, ny in self._neighbors(x, y):
+            if not self.flagged[nx, ny] and not self.revealed[nx, ny]:
+                revealed |= self.reveal_cell(nx, ny)
+                if self.mines[nx, ny]:
+                    return True, revealed  # Mine revealed during chording, game over
+        return False, revealed  # Chording action completed without hitting a mine
@@ -0,0 +1,474 @@
+# benchmark.py
+
+import argparse  # Command-line interface of the benchmark runner
+import json  # Baselines are stored as JSON
+import sys  # Exit status for the command line
+import time  # Wall-clock timing of the operations
+import tracemalloc  # Peak memory of the operations
+from mem679_minesweeper.game import ENGINES  # Board engines, selected by name
+from mem679_minesweeper.simulation import play_game  # Plays the solver-driven games
+from mem679_minesweeper.solver import solver_strategy  # Drives the solver games
+
+# Board sizes as (rows, columns), from the beginner board to a giant custom board
+SIZES = [(9, 9), (16, 30), (100, 100), (500, 500), (1000, 1000), (2000, 2000)]
+
+# Mine densities: roughly beginner, intermediate and expert
+DENSITIES = [0.12, 0.16, 0.21]
+
+# Format version of the baseline files
+BASELINE_VERSION = 1
+
+
+def _mines(rows, columns, density):
+    """
+    Returns the number of mines for a density, leaving room for a 3x3 safe zone.
+
+    Args:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        density (float): Fraction of the cells that hold a mine.
+
+    Returns:
+        int: The number of mines.
+    """
+    return min(round(rows * columns * density), rows * columns - 9)
+
+
+def _new_board(engine, rows, columns, mines, seed, placed=True):
+    """
+    Builds a board whose first click is the centre cell, with a 3x3 safe zone.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed for mine placement.
+        placed (bool): Place the mines as well.
+
+    Returns:
+        Board or ArrayBoard: The board.
+    """
+    board = ENGINES[engine](rows, columns, mines, safe_zone='3x3', seed=seed)
+    if placed:
+        board.place_mines(rows // 2, columns // 2)
+    return board
+
+
+def _bench_init(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of board construction.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Builds a board without mines.
+    """
+    return lambda: ENGINES[engine](rows, columns, mines, safe_zone='3x3', seed=seed)
+
+
+def _bench_place_mines(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of mine placement, including the adjacency counts.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Places the mines for a first click at the centre.
+    """
+    board = _new_board(engine, rows, columns, mines, seed, placed=False)
+    return lambda: board.place_mines(rows // 2, columns // 2)
+
+
+def _bench_calculate_adjacent_mines(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of recomputing the adjacency counts of the whole board.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Recomputes the counts of a board with mines placed.
+    """
+    board = _new_board(engine, rows, columns, mines, seed)
+    return board._calculate_adjacent_mines
+
+
+def _bench_reveal_opening(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of the first click, opening the area around the centre.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Reveals the centre cell and its opening.
+    """
+    board = _new_board(engine, rows, columns, mines, seed)
+    return lambda: board.reveal_cell(rows // 2, columns // 2)
+
+
+def _bench_chord_cell(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of a chord on a number at the border of the opening.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Chords the number, whose adjacent mines are flagged.
+    """
+    board = _new_board(engine, rows, columns, mines, seed)
+    x, y = rows // 2, columns // 2
+    for cx, cy in sorted(board.reveal_cell(x, y)):
+        neighbors = [
+            (nx, ny)
+            for nx in range(max(cx - 1, 0), min(cx + 2, rows))
+            for ny in range(max(cy - 1, 0), min(cy + 2, columns))
+        ]
+        # A number with a covered safe neighbour gives the chord something to open
+        if any(not board.grid[nx][ny].is_revealed and not board.is_mine(nx, ny)
+               for nx, ny in neighbors):
+            x, y = cx, cy
+            for nx, ny in neighbors:
+                if board.is_mine(nx, ny):
+                    board.toggle_flag(nx, ny)
+            break
+    return lambda: board.chord_cell(x, y)
+
+
+def _bench_is_win(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of the win check after the first click.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Checks whether the game is won.
+    """
+    board = _new_board(engine, rows, columns, mines, seed)
+    board.reveal_cell(rows // 2, columns // 2)
+    return board.is_win
+
+
+def _bench_reveal_all_mines(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of uncovering every mine at the end of a lost game.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Reveals all the mines.
+    """
+    board = _new_board(engine, rows, columns, mines, seed)
+    return board.reveal_all_mines
+
+
+def _bench_solver_game(engine, rows, columns, mines, seed):
+    """
+    Sets up the benchmark of a full game played by the solver.
+
+    Args:
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+
+    Returns:
+        callable: Plays a game, guessing by mine probability when stuck.
+    """
+    return lambda: play_game(solver_strategy, rows, columns, mines, seed, engine=engine,
+                             safe_zone='3x3')
+
+
+# Benchmarked operations. Each entry builds the state an operation needs, untimed,
+# and returns a callable that performs the operation once
+OPERATIONS = {
+    'init': _bench_init,
+    'place_mines': _bench_place_mines,
+    'calculate_adjacent_mines': _bench_calculate_adjacent_mines,
+    'reveal_opening': _bench_reveal_opening,
+    'chord_cell': _bench_chord_cell,
+    'is_win': _bench_is_win,
+    'reveal_all_mines': _bench_reveal_all_mines,
+    'solver_game': _bench_solver_game,
+}
+
+
+def measure(operation, engine, rows, columns, mines, seed=0, repeat=3):
+    """
+    Measures the time and peak memory of one operation.
+
+    The time is the best of repeat runs, each on freshly built state. The peak
+    memory is traced in a separate run, since tracing slows the code down.
+
+    Args:
+        operation (str): Name of the operation, one of the keys of OPERATIONS.
+        engine (str): Name of the board engine, see ENGINES.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple: ``(seconds, peak_bytes)`` for the operation.
+    """
+    setup = OPERATIONS[operation]
+    seconds = float('inf')
+    for _ in range(repeat):
+        run = setup(engine, rows, columns, mines, seed)
+        start = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    run = setup(engine, rows, columns, mines, seed)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak_bytes
+
+
+def result_key(result):
+    """
+    Returns the key identifying a measurement in a baseline.
+
+    Args:
+        result (dict): A measurement as produced by run_benchmarks.
+
+    Returns:
+        str: The key, e.g. ``'cell/16x30/0.21/place_mines'``.
+    """
+    size = f"{result['rows']}x{result['columns']}"
+    return f"{result['engine']}/{size}/{result['density']}/{result['operation']}"
+
+
+def run_benchmarks(sizes=SIZES, densities=DENSITIES, engines=tuple(ENGINES),
+                   operations=tuple(OPERATIONS), repeat=3, solver_cells=10000, seed=0,
+                   report=None):
+    """
+    Measures every operation over the matrix of engines, sizes and densities.
+
+    Args:
+        sizes (list of tuple): The (rows, columns) to measure.
+        densities (list of float): The mine densities to measure.
+        engines (iterable of str): The board engines to measure.
+        operations (iterable of str): The operations to measure, see OPERATIONS.
+        repeat (int): Number of timed runs per measurement.
+        solver_cells (int): Largest board, in cells, on which full solver-driven
+            games are played; they take much longer than the other operations.
+        seed (int): Seed of the boards.
+        report (callable, optional): Called with each measurement as it completes,
+            e.g. to print progress.
+
+    Returns:
+        list of dict: One measurement per combination, with the keys engine, rows,
+        columns, density, mines, operation, seconds and peak_bytes.
+    """
+    results = []
+    for engine in engines:
+        for rows, columns in sizes:
+            for density in densities:
+                mines = _mines(rows, columns, density)
+                for operation in operations:
+                    if operation == 'solver_game' and rows * columns > solver_cells:
+                        continue
+                    seconds, peak_bytes = measure(operation, engine, rows, columns,
+                                                  mines, seed, repeat)
+                    result = {
+                        'engine': engine, 'rows': rows, 'columns': columns,
+                        'density': density, 'mines': mines, 'operation': operation,
+                        'seconds': seconds, 'peak_bytes': peak_bytes,
+                    }
+                    results.append(result)
+                    if report is not None:
+                        report(result)
+    return results
+
+
+def save_baseline(results, path):
+    """
+    Writes measurements to a JSON baseline file.
+
+    Args:
+        results (list of dict): Measurements from run_benchmarks.
+        path (str): Path of the baseline file.
+    """
+    baseline = {
+        'version': BASELINE_VERSION,
+        'results': {
+            result_key(result): {
+                'seconds': result['seconds'], 'peak_bytes': result['peak_bytes'],
+            }
+            for result in results
+        },
+    }
+    with open(path, 'w') as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    Reads a JSON baseline file.
+
+    Args:
+        path (str): Path of the baseline file.
+
+    Returns:
+        dict: The baseline measurements keyed by result_key.
+
+    Raises:
+        ValueError: If the file has an unsupported version.
+    """
+    with open(path) as handle:
+        baseline = json.load(handle)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')!r}")
+    return baseline['results']
+
+
+def find_regressions(results, baseline, threshold=0.2, min_seconds=1e-4):
+    """
+    Compares measurements with a baseline and lists those that got worse.
+
+    Args:
+        results (list of dict): Measurements from run_benchmarks.
+        baseline (dict): Baseline measurements from load_baseline.
+        threshold (float): Relative increase that counts as a regression, e.g. 0.2
+            for 20% slower or bigger.
+        min_seconds (float): Times below this are too noisy to compare.
+
+    Returns:
+        list of dict: One entry per regression, with the keys key, metric,
+        baseline, current and ratio.
+    """
+    regressions = []
+    for result in results:
+        key = result_key(result)
+        if key not in baseline:
+            continue  # New measurement, nothing to compare with
+        for metric in ('seconds', 'peak_bytes'):
+            before, after = baseline[key][metric], result[metric]
+            if metric == 'seconds' and max(before, after) < min_seconds:
+                continue
+            if before and after > before * (1 + threshold):
+                regressions.append({
+                    'key': key, 'metric': metric, 'baseline': before,
+                    'current': after, 'ratio': after / before,
+                })
+    return regressions
+
+
+def _parse_size(text):
+    """
+    Parses a board size written as ``ROWSxCOLUMNS``.
+
+    Args:
+        text (str): The size, e.g. '16x30'.
+
+    Returns:
+        tuple: The (rows, columns).
+    """
+    rows, columns = text.lower().split('x')
+    return int(rows), int(columns)
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line.
+
+    Example::
+
+        python -m mem679_minesweeper.benchmark --sizes 9x9,100x100 --save base.json
+        python -m mem679_minesweeper.benchmark --sizes 9x9,100x100 --compare base.json
+
+    Args:
+        argv (list of str, optional): The arguments, defaults to sys.argv.
+
+    Returns:
+        int: 0 on success, 1 if regressions were found.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Minesweeper engine.')
+    parser.add_argument('--sizes', default=','.join(f'{r}x{c}' for r, c in SIZES),
+                        help='comma-separated board sizes, e.g. 9x9,100x100')
+    parser.add_argument('--densities', default=','.join(map(str, DENSITIES)),
+                        help='comma-separated mine densities')
+    parser.add_argument('--engines', default=','.join(ENGINES),
+                        help='comma-separated engines')
+    parser.add_argument('--operations', default=','.join(OPERATIONS),
+                        help='comma-separated operations')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timed runs per measurement')
+    parser.add_argument('--solver-cells', type=int, default=10000,
+                        help='largest board, in cells, for solver-driven games')
+    parser.add_argument('--save', help='write the results as a baseline file')
+    parser.add_argument('--compare', help='compare the results with a baseline file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative increase that counts as a regression')
+    args = parser.parse_args(argv)
+
+    def report(result):
+        print(f"{result_key(result):<50} {result['seconds'] * 1000:>12.3f} ms"
+              f" {result['peak_bytes'] / 1024:>12.1f} KiB", flush=True)
+
+    results = run_benchmarks(
+        sizes=[_parse_size(size) for size in args.sizes.split(',')],
+        densities=[float(density) for density in args.densities.split(',')],
+        engines=args.engines.split(','),
+        operations=args.operations.split(','),
+        repeat=args.repeat,
+        solver_cells=args.solver_cells,
+        report=report,
+    )
+    if args.save:
+        save_baseline(results, args.save)
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['key']} {regression['metric']}: "
+                  f"{regression['baseline']:.6g} -> {regression['current']:.6g} "
+                  f"(x{regression['ratio']:.2f})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
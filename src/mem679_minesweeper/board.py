@@ -1,7 +1,11 @@
 # board.py
 
-import random  # Import the random module for shuffling and random selection
+import numpy as np  # NumPy holds the mine mask for vectorized counting
 from mem679_minesweeper.cell import Cell  # Import the Cell class from the src.cell module
+from mem679_minesweeper.adjacency import count_adjacent_mines, neighborhood_region
+from mem679_minesweeper.placement import (
+    resolve_rng, safe_zone_indices, sample_mine_indices,
+)
 
 class Board:
     """
@@ -16,9 +20,31 @@ class Board:
         total_mines (int): Total number of mines to be placed on the board.
         grid (list of list of Cell): 2D list representing the grid of cells.
         mines_placed (bool): Flag indicating whether mines have been placed on the board.
+        safe_zone (str or array-like): Cells kept free of mines around the first click,
+            see safe_zone_indices.
+        seed (int or None): Seed the layout was drawn from, None if an RNG object
+            was supplied. The same seed and first click give the same layout on
+            every engine.
+        rng: Source of randomness used for mine placement.
+        mine_indices (set of int): Linear indices ``x * columns + y`` of the cells
+            that hold a mine.
+        mines (numpy.ndarray): Boolean plane of shape ``(rows, columns)``, True
+            where a cell holds a mine; the mine index in NumPy form.
+        revealed (numpy.ndarray): Boolean plane, True where a cell is revealed.
+        flagged (numpy.ndarray): Boolean plane, True where a cell is flagged.
+        mine_count (int): Number of cells that currently hold a mine.
+        revealed_safe (int): Number of revealed cells that are not mines.
+        flags_placed (int): Number of flagged cells.
+        flagged_neighbors (bytearray): Number of flagged neighbours of each cell,
+            indexed by ``x * columns + y``.
+
+    The counters and planes are kept up to date by the cells themselves, which
+    notify the board whenever they are revealed, flagged or get a mine. This
+    makes is_win, remaining_mines and the chording precheck constant-time, and
+    lets whole-board passes read the planes instead of visiting every cell.
     """
 
-    def __init__(self, rows, columns, mines):
+    def __init__(self, rows, columns, mines, safe_zone='cell', seed=None, rng=None):
         """
         Initializes the Board with the given dimensions and number of mines.
 
@@ -26,118 +52,231 @@ class Board:
             rows (int): Number of rows in the board.
             columns (int): Number of columns in the board.
             mines (int): Number of mines to be placed on the board.
+            safe_zone (str or array-like): Cells kept free of mines around the first
+                click: 'cell', '3x3' or a boolean mask, see safe_zone_indices.
+            seed (int, optional): Seed for mine placement. A fresh one is drawn when
+                neither seed nor rng is given.
+            rng (optional): Source of randomness used instead of a seed, see
+                resolve_rng.
         """
         self.rows = rows
         self.columns = columns
         self.total_mines = mines
-        # Create a grid of Cell objects
-        self.grid = [[Cell(x, y) for y in range(columns)] for x in range(rows)]
+        self.safe_zone = safe_zone
+        self.seed, self.rng = resolve_rng(seed, rng)  # Randomness for placement
+        # Create a grid of Cell objects that report their changes to this board
+        self.grid = [[Cell(x, y, self) for y in range(columns)] for x in range(rows)]
         self.mines_placed = False  # Flag to check if mines are placed
+        # Mine index and running counters, updated through the cell notifications below
+        self.mine_indices = set()
+        self.mines = np.zeros((rows, columns), dtype=bool)
+        self.revealed = np.zeros((rows, columns), dtype=bool)
+        self.flagged = np.zeros((rows, columns), dtype=bool)
+        self.revealed_safe = 0
+        self.flags_placed = 0
+        self.flagged_neighbors = bytearray(rows * columns)
+
+    @property
+    def mine_count(self):
+        """
+        int: Number of cells that currently hold a mine.
+        """
+        return len(self.mine_indices)
+
+    @property
+    def remaining_mines(self):
+        """
+        int: Number of mines not yet accounted for by a flag. Negative when the
+        player has placed more flags than there are mines.
+        """
+        return self.total_mines - self.flags_placed
+
+    def _on_reveal(self, cell):
+        """
+        Updates the counters after a cell has been revealed or covered again.
+
+        Args:
+            cell (Cell): The cell that was revealed or covered.
+        """
+        self.revealed[cell.x, cell.y] = cell.is_revealed
+        if not cell.is_mine:
+            self.revealed_safe += 1 if cell.is_revealed else -1
+
+    def _on_flag(self, cell):
+        """
+        Updates the counters after the flag on a cell has been toggled.
 
-    def place_mines(self, exclude_x, exclude_y):
+        Args:
+            cell (Cell): The cell whose flag changed.
+        """
+        delta = 1 if cell.is_flagged else -1
+        self.flags_placed += delta
+        self.flagged[cell.x, cell.y] = cell.is_flagged
+        # Every neighbour gains or loses one flagged neighbour
+        x, y = cell.x, cell.y
+        for nx in range(max(x - 1, 0), min(x + 2, self.rows)):
+            base = nx * self.columns
+            for ny in range(max(y - 1, 0), min(y + 2, self.columns)):
+                if nx != x or ny != y:
+                    self.flagged_neighbors[base + ny] += delta
+
+    def _on_mine(self, cell):
+        """
+        Updates the counters after a mine has been added to or removed from a cell.
+
+        Args:
+            cell (Cell): The cell whose mine state changed.
+        """
+        index = cell.x * self.columns + cell.y
+        self.mines[cell.x, cell.y] = cell.is_mine
+        if cell.is_mine:
+            self.mine_indices.add(index)
+            delta = 1
+        else:
+            self.mine_indices.discard(index)
+            delta = -1
+        if cell.is_revealed:
+            self.revealed_safe -= delta  # The cell stopped or started being safe
+
+    def place_mines(self, exclude_x, exclude_y, safe_zone=None):
         """
         Places mines randomly on the board, excluding the cell at (exclude_x, exclude_y).
 
         This method ensures that the first cell revealed by the player is never a mine,
         enhancing gameplay by avoiding immediate game over on the first click.
+        Positions are drawn directly by sample_mine_indices, so placement costs
+        O(mines) rather than O(rows * columns).
 
         Args:
             exclude_x (int): The row index of the cell to exclude from mine placement.
             exclude_y (int): The column index of the cell to exclude from mine placement.
+            safe_zone (str or array-like, optional): Cells kept free of mines around the
+                excluded cell, see safe_zone_indices. Defaults to the board's safe_zone.
         """
-        # Generate all possible cell positions
-        all_positions = [(x, y) for x in range(self.rows) for y in range(self.columns)]
-        # Create a list of positions to exclude from mine placement
-        exclude_positions = [(exclude_x, exclude_y)]
-
-        # Optionally exclude adjacent cells to the first click to make the game easier
-        # Uncomment the following block to exclude adjacent cells
-        # for dx in (-1, 0, 1):
-        #     for dy in (-1, 0, 1):
-        #         nx, ny = exclude_x + dx, exclude_y + dy
-        #         if 0 <= nx < self.rows and 0 <= ny < self.columns:
-        #             exclude_positions.append((nx, ny))
-
-        # Create a list of available positions for mine placement, excluding the specified cells
-        available_positions = [pos for pos in all_positions if pos not in exclude_positions]
-        mines_to_place = self.total_mines
-
-        # Randomly shuffle the available positions
-        random.shuffle(available_positions)
-        # Place mines on the board
-        for _ in range(mines_to_place):
-            x, y = available_positions.pop()
+        # Work out which cells must stay free of mines
+        excluded = safe_zone_indices(
+            self.rows, self.columns, exclude_x, exclude_y,
+            self.safe_zone if safe_zone is None else safe_zone,
+        )
+        # Place mines on the drawn positions
+        cells = self.rows * self.columns
+        for index in sample_mine_indices(cells, self.total_mines, excluded, self.rng):
+            x, y = divmod(index, self.columns)
             self.grid[x][y].set_mine()  # Set the cell at (x, y) as a mine
 
         # Calculate the number of adjacent mines for each cell
         self._calculate_adjacent_mines()
         self.mines_placed = True  # Set the flag indicating mines have been placed
 
-    def _calculate_adjacent_mines(self):
+    def _calculate_adjacent_mines(self, region=None):
         """
         Calculates and sets the number of adjacent mines for each cell on the board.
 
-        This method iterates over all cells and, for those that are not mines,
-        counts the number of neighboring cells that are mines.
+        The counts for the whole region are computed at once by
+        count_adjacent_mines over the board's mine plane, so only writing the
+        counts into the cells visits every cell in Python. Only cells that are not
+        mines receive a count.
+
+        Args:
+            region (tuple, optional): Half-open bounds ``(x0, x1, y0, y1)`` of the cells
+                to recompute, e.g. after mines were moved. Defaults to the whole board.
         """
-        for x in range(self.rows):
-            for y in range(self.columns):
-                cell = self.grid[x][y]
+        if region is None:
+            region = (0, self.rows, 0, self.columns)
+        x0, x1, y0, y1 = region
+        # The mine plane of the region plus its one-cell border
+        mx0, my0 = max(x0 - 1, 0), max(y0 - 1, 0)
+        mask = self.mines[mx0:min(x1 + 1, self.rows), my0:min(y1 + 1, self.columns)]
+        # Count over the mask, shifting the region into mask coordinates
+        counts = count_adjacent_mines(mask, (x0 - mx0, x1 - mx0, y0 - my0, y1 - my0))
+        for x, row_counts in zip(range(x0, x1), counts.tolist()):
+            row = self.grid[x]
+            for y, count in zip(range(y0, y1), row_counts):
+                cell = row[y]
                 if not cell.is_mine:
-                    # Count the number of adjacent mines for this cell
-                    count = self._count_adjacent_mines(x, y)
                     cell.set_adjacent_mines(count)  # Set the count in the cell
 
-    def _count_adjacent_mines(self, x, y):
+    def move_mine(self, from_x, from_y, to_x, to_y):
         """
-        Counts the number of mines adjacent to the cell at (x, y).
+        Moves a mine to another cell and updates the affected adjacency counts.
 
-        Args:
-            x (int): The row index of the cell.
-            y (int): The column index of the cell.
+        Only the 3x3 neighbourhoods of the two cells are recomputed.
 
-        Returns:
-            int: The number of adjacent mines.
-        """
-        count = 0
-        # Iterate over all neighboring positions including diagonals
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                nx, ny = x + dx, y + dy  # Neighboring cell coordinates
-                # Skip the cell itself
-                if dx == 0 and dy == 0:
-                    continue
-                # Check if neighboring coordinates are within bounds
-                if (0 <= nx < self.rows) and (0 <= ny < self.columns):
-                    if self.grid[nx][ny].is_mine:
-                        count += 1  # Increment count if neighbor is a mine
-        return count
+        Args:
+            from_x (int): The row index of the cell holding the mine.
+            from_y (int): The column index of the cell holding the mine.
+            to_x (int): The row index of the cell receiving the mine.
+            to_y (int): The column index of the cell receiving the mine.
+        """
+        self.grid[from_x][from_y].clear_mine()
+        self.grid[to_x][to_y].set_mine()
+        self.grid[to_x][to_y].set_adjacent_mines(0)  # Mine cells do not carry a count
+        for x, y in ((from_x, from_y), (to_x, to_y)):
+            self._calculate_adjacent_mines(
+                neighborhood_region(x, y, self.rows, self.columns))
 
     def reveal_cell(self, x, y):
         """
-        Reveals the cell at (x, y). If the cell has zero adjacent mines, recursively reveals neighboring cells.
+        Reveals the cell at (x, y). If the cell has zero adjacent mines, the whole
+        opening around it is revealed as well.
+
+        The opening is expanded iteratively with an explicit frontier rather than by
+        recursion, so its size is not bounded by the interpreter's recursion limit.
+        A cell is revealed at the moment it is pushed onto the frontier, which
+        guarantees that no cell is pushed twice.
 
         Args:
             x (int): The row index of the cell to reveal.
             y (int): The column index of the cell to reveal.
+
+        Returns:
+            set of tuple: The (row, column) of every cell revealed by this call.
         """
         cell = self.grid[x][y]
-        if cell.reveal():
-            # If the cell was successfully revealed and has zero adjacent mines
-            if cell.adjacent_mines == 0 and not cell.is_mine:
-                # Recursively reveal adjacent cells
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        nx, ny = x + dx, y + dy
-                        # Skip the cell itself
-                        if dx == 0 and dy == 0:
-                            continue
-                        # Check if neighboring coordinates are within bounds
-                        if (0 <= nx < self.rows) and (0 <= ny < self.columns):
-                            neighbor = self.grid[nx][ny]
-                            if not neighbor.is_revealed and not neighbor.is_mine:
-                                # Recursively reveal neighbor
-                                self.reveal_cell(nx, ny)
+        if not cell.reveal():
+            return set()  # Flagged or already revealed cells are left alone
+        revealed = {(x, y)}
+        if cell.is_mine or cell.adjacent_mines != 0:
+            return revealed  # Only empty cells open their neighbourhood
+
+        frontier = [(x, y)]
+        while frontier:
+            cx, cy = frontier.pop()
+            # Visit the in-bounds neighbours of the current empty cell
+            for nx in range(max(cx - 1, 0), min(cx + 2, self.rows)):
+                row = self.grid[nx]
+                for ny in range(max(cy - 1, 0), min(cy + 2, self.columns)):
+                    neighbor = row[ny]
+                    # reveal() refuses flagged and already revealed cells,
+                    # including the current cell itself
+                    if neighbor.is_mine or not neighbor.reveal():
+                        continue
+                    revealed.add((nx, ny))
+                    if neighbor.adjacent_mines == 0:
+                        frontier.append((nx, ny))  # Keep expanding through empty cells
+        return revealed
+
+    def is_mine(self, x, y):
+        """
+        Checks whether the cell at (x, y) holds a mine, using the mine index.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell holds a mine, False otherwise.
+        """
+        return x * self.columns + y in self.mine_indices
+
+    def mine_positions(self):
+        """
+        Lists the positions of all mines in row-major order, using the mine index.
+
+        Returns:
+            list of tuple: The (row, column) of every mine.
+        """
+        return [divmod(index, self.columns) for index in sorted(self.mine_indices)]
 
     def toggle_flag(self, x, y):
         """
@@ -154,27 +293,63 @@ class Board:
         """
         Checks if the player has won the game.
 
-        The player wins when all non-mine cells have been revealed.
+        The player wins when all non-mine cells have been revealed. The check compares
+        the running count of revealed safe cells with the number of safe cells, so it
+        takes constant time.
 
         Returns:
             bool: True if the player has won, False otherwise.
         """
-        for row in self.grid:
-            for cell in row:
-                if not cell.is_mine and not cell.is_revealed:
-                    return False  # There are still non-mine cells to reveal
-        return True  # All non-mine cells have been revealed
+        return self.revealed_safe == self.rows * self.columns - self.mine_count
+
+    def is_lost(self):
+        """
+        Checks whether a mine has been revealed, i.e. the game on this board was lost.
+
+        Only the cells in the mine index are visited.
+
+        Returns:
+            bool: True if a mine is revealed, False otherwise.
+        """
+        columns = self.columns
+        return any(self.grid[index // columns][index % columns].is_revealed
+                   for index in self.mine_indices)
 
     def reveal_all_mines(self):
         """
         Reveals all mines on the board.
 
         This method is typically called when the game is over to display all mine locations.
+        Only the cells in the mine index are visited.
+
+        Returns:
+            list of int: The sorted linear indices of the mines revealed by this call;
+            flagged and already revealed mines are left out.
+        """
+        revealed = []
+        for index in sorted(self.mine_indices):
+            x, y = divmod(index, self.columns)
+            if self.grid[x][y].reveal():
+                revealed.append(index)
+        return revealed
+
+    def set_revealed(self, indices, revealed):
         """
-        for row in self.grid:
-            for cell in row:
-                if cell.is_mine:
-                    cell.reveal()
+        Reveals or covers cells given by linear index, without flood filling.
+
+        Used to undo and redo moves; flagged cells are not revealed.
+
+        Args:
+            indices (iterable of int): Linear indices ``x * columns + y`` of the cells.
+            revealed (bool): True to reveal the cells, False to cover them.
+        """
+        columns = self.columns
+        for index in indices:
+            cell = self.grid[index // columns][index % columns]
+            if revealed:
+                cell.reveal()
+            else:
+                cell.conceal()
 
     def chord_cell(self, x, y):
         """
@@ -190,38 +365,38 @@ class Board:
         Returns:
             bool: True if a mine was revealed during chording (game over), False otherwise.
         """
+        mine_triggered, _ = self.chord_reveal(x, y)
+        return mine_triggered
+
+    def chord_reveal(self, x, y):
+        """
+        Performs the chording action on the cell at (x, y) and reports what it revealed.
+
+        Empty neighbours open their whole area through reveal_cell. Chording stops at
+        the first mine it reveals.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            tuple: ``(mine_triggered, revealed)`` where mine_triggered is True if a mine
+            was revealed and revealed is the set of (row, column) cells revealed.
+        """
+        revealed = set()
         cell = self.grid[x][y]
         if not cell.is_revealed or cell.is_mine:
-            return False  # Cannot chord on unrevealed or mine cells
-
-        # Count flagged adjacent cells
-        flagged_count = 0
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                nx, ny = x + dx, y + dy
-                # Skip the cell itself
-                if dx == 0 and dy == 0:
-                    continue
-                if (0 <= nx < self.rows) and (0 <= ny < self.columns):
-                    neighbor = self.grid[nx][ny]
-                    if neighbor.is_flagged:
-                        flagged_count += 1
+            return False, revealed  # Cannot chord on unrevealed or mine cells
 
-        if flagged_count == cell.adjacent_mines:
+        # Compare the running flagged-neighbour count with the cell's number
+        if self.flagged_neighbors[x * self.columns + y] == cell.adjacent_mines:
             # Reveal all adjacent unflagged and unrevealed cells
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    nx, ny = x + dx, y + dy
-                    # Skip the cell itself
-                    if dx == 0 and dy == 0:
-                        continue
-                    if (0 <= nx < self.rows) and (0 <= ny < self.columns):
-                        neighbor = self.grid[nx][ny]
-                        if not neighbor.is_flagged and not neighbor.is_revealed:
-                            neighbor.reveal()
-                            if neighbor.is_mine:
-                                return True  # Mine revealed during chording, game over
-                            elif neighbor.adjacent_mines == 0:
-                                # Recursively reveal neighboring cells with zero adjacent mines
-                                self.reveal_cell(nx, ny)
-        return False  # Chording action completed without hitting a mine
+            for nx in range(max(x - 1, 0), min(x + 2, self.rows)):
+                for ny in range(max(y - 1, 0), min(y + 2, self.columns)):
+                    neighbor = self.grid[nx][ny]
+                    if neighbor.is_flagged or neighbor.is_revealed:
+                        continue  # Also skips the cell itself
+                    revealed |= self.reveal_cell(nx, ny)
+                    if neighbor.is_mine:
+                        return True, revealed  # Mine revealed while chording
+        return False, revealed  # Chording action completed without hitting a mine
@@ -0,0 +1,104 @@
+# changes.py
+
+# Bits of the one-byte cell state carried by a ChangeSet. The upper four bits
+# hold the number of adjacent mines, which is only meaningful once revealed
+REVEALED = 0x01
+FLAGGED = 0x02
+MINE = 0x04
+ADJACENT_SHIFT = 4
+
+# Game statuses reported by Game.status and in status transitions
+PLAYING = 'playing'
+WON = 'won'
+LOST = 'lost'
+
+
+def cell_state(cell):
+    """
+    Packs the visible state of a cell into one byte.
+
+    The mine bit is only set for revealed cells, so a change set never gives
+    away where the covered mines are.
+
+    Args:
+        cell (Cell or ArrayCell): The cell.
+
+    Returns:
+        int: The state byte, see REVEALED, FLAGGED, MINE and ADJACENT_SHIFT.
+    """
+    if cell.is_revealed:
+        if cell.is_mine:
+            return REVEALED | MINE
+        return REVEALED | (cell.adjacent_mines << ADJACENT_SHIFT)
+    return FLAGGED if cell.is_flagged else 0
+
+
+class ChangeSet:
+    """
+    The cells changed by one move and the game-status transition it caused.
+
+    Change sets are built by Game and handed to its subscribers, so renderers,
+    bots and recorders can update in time proportional to the number of changed
+    cells instead of rescanning the grid.
+
+    Attributes:
+        action (str): The move, one of 'reveal', 'flag' or 'chord', or 'undo' and
+            'redo' for the changes made by History.
+        x (int): The row index of the cell the move was made on.
+        y (int): The column index of the cell the move was made on.
+        indices (list of int): Sorted linear indices ``x * columns + y`` of the
+            changed cells.
+        states (bytes): The new state of each changed cell, see cell_state.
+        status (tuple or None): ``(before, after)`` game statuses if the move
+            changed the status, e.g. ended the game, else None.
+        exploded (int or None): Linear index of the mine that ended the game, if
+            the move lost it.
+    """
+
+    __slots__ = ('action', 'x', 'y', 'indices', 'states', 'status', 'exploded')
+
+    def __init__(self, action, x, y, indices, states, status=None, exploded=None):
+        """
+        Initializes the change set.
+
+        Args:
+            action (str): The move.
+            x (int): The row index of the cell the move was made on.
+            y (int): The column index of the cell the move was made on.
+            indices (list of int): Sorted linear indices of the changed cells.
+            states (bytes): The new state of each changed cell.
+            status (tuple, optional): The status transition, if any.
+            exploded (int, optional): Linear index of the mine that ended the game.
+        """
+        self.action = action
+        self.x = x
+        self.y = y
+        self.indices = indices
+        self.states = states
+        self.status = status
+        self.exploded = exploded
+
+    def __len__(self):
+        """
+        Returns the number of changed cells.
+
+        Returns:
+            int: The number of changed cells.
+        """
+        return len(self.indices)
+
+    def positions(self, columns):
+        """
+        Returns the (row, column) of the changed cells.
+
+        Args:
+            columns (int): Number of columns in the board.
+
+        Returns:
+            list of tuple: The positions, in the order of indices.
+        """
+        return [divmod(index, columns) for index in self.indices]
+
+    def __repr__(self):
+        return (f"ChangeSet({self.action!r}, {self.x}, {self.y}, {len(self)} cells,"
+                f" status={self.status!r})")
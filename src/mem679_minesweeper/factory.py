@@ -0,0 +1,180 @@
+# factory.py
+
+import queue  # Bounded queues of ready boards, one per preset
+import threading  # The boards are generated on a background thread
+from mem679_minesweeper.game import ENGINES  # Board engines, selected by name
+
+# Standard difficulty presets as (rows, columns, mines)
+PRESETS = {
+    'beginner': (9, 9, 10),
+    'intermediate': (16, 16, 40),
+    'expert': (16, 30, 99),
+}
+
+
+def lay_out(board):
+    """
+    Places the mines of a board around a uniformly random anchor cell.
+
+    The anchor is drawn from the board's own source of randomness, so a seeded
+    board always gets the same layout, e.g. when a replay is verified.
+
+    Args:
+        board (Board or ArrayBoard): A board without mines.
+
+    Returns:
+        Board or ArrayBoard: The board, ready for relocate_safe_zone.
+    """
+    # A uniformly drawn anchor keeps every cell equally likely to hold a mine
+    anchor = divmod(board.rng.randrange(board.rows * board.columns), board.columns)
+    board.place_mines(*anchor, safe_zone='cell')
+    return board
+
+
+class BoardFactory:
+    """
+    Pre-generates boards with their mines placed so that starting a game is instant.
+
+    A background thread keeps a bounded queue of ready boards for every preset.
+    The layouts are drawn before the first click is known: each board is laid out
+    around a random anchor cell, which makes the layout uniform over all cells, and
+    the first click later moves any mines out of its safe zone with
+    relocate_safe_zone. A single queue per preset therefore serves every click
+    position. When a queue is empty, or the size is not a preset, the board is
+    built on the spot.
+
+    Layouts generated for no-guess games depend on the exact first click and are
+    not pooled.
+
+    Attributes:
+        engine (str): Name of the board engine, see ENGINES.
+        safe_zone (str or array-like): Safe zone of the boards handed out.
+        capacity (int): Number of ready boards kept per preset.
+    """
+
+    def __init__(self, presets=PRESETS.values(), capacity=2, engine='cell',
+                 safe_zone='cell'):
+        """
+        Initializes the factory. Call start to begin generating in the background.
+
+        Args:
+            presets (iterable of tuple): The (rows, columns, mines) to pre-generate.
+            capacity (int): Number of ready boards kept per preset.
+            engine (str): Name of the board engine, see ENGINES.
+            safe_zone (str or array-like): Safe zone of the boards handed out.
+        """
+        self.engine = engine
+        self.safe_zone = safe_zone
+        self.capacity = capacity
+        self._queues = {}
+        self._wanted = threading.Event()  # Set whenever a queue may need refilling
+        self._stopping = threading.Event()
+        self._thread = None
+        for preset in presets:
+            self.add_preset(*preset)
+
+    def add_preset(self, rows, columns, mines):
+        """
+        Starts pre-generating boards of the given size.
+
+        Every preset keeps up to capacity boards alive for the life of the factory,
+        so only sizes that are played often, such as the difficulty presets, are
+        worth adding.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines on the board.
+        """
+        self._queues.setdefault((rows, columns, mines), queue.Queue(self.capacity))
+        self._wanted.set()
+
+    def build(self, rows, columns, mines):
+        """
+        Builds one board with its mines laid out around a random anchor cell.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines on the board.
+
+        Returns:
+            Board or ArrayBoard: A board with mines placed, ready for relocation.
+        """
+        board = ENGINES[self.engine](rows, columns, mines, safe_zone=self.safe_zone)
+        return lay_out(board)
+
+    def take(self, rows, columns, mines):
+        """
+        Hands out a ready board, building one on the spot if none is queued.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines on the board.
+
+        Returns:
+            Board or ArrayBoard: A board with mines placed, to be passed to Game.
+        """
+        pending = self._queues.get((rows, columns, mines))
+        if pending is not None:
+            try:
+                board = pending.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self._wanted.set()  # Replace the board just taken
+                return board
+        return self.build(rows, columns, mines)
+
+    def ready(self, rows, columns, mines):
+        """
+        Returns the number of boards queued for a preset.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines on the board.
+
+        Returns:
+            int: The number of ready boards.
+        """
+        pending = self._queues.get((rows, columns, mines))
+        return pending.qsize() if pending is not None else 0
+
+    def _fill(self):
+        """
+        Keeps the queues full until the factory is stopped; runs on the background
+        thread.
+        """
+        while not self._stopping.is_set():
+            self._wanted.clear()
+            built = False
+            for preset, pending in list(self._queues.items()):
+                if self._stopping.is_set():
+                    return
+                if not pending.full():
+                    pending.put(self.build(*preset))
+                    built = True
+            if not built:
+                self._wanted.wait()  # Sleep until a board is taken or a preset added
+
+    def start(self):
+        """
+        Starts generating boards on a daemon thread.
+        """
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._fill, name='board-factory',
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread, waiting for the board being built.
+        """
+        if self._thread is not None:
+            self._stopping.set()
+            self._wanted.set()
+            self._thread.join()
+            self._thread = None
@@ -1,6 +1,30 @@
 # game.py
 
+import os  # Sizes the worker pool of the no-guess search
 from mem679_minesweeper.board import Board  # Import the Board class from the src.board module
+from mem679_minesweeper.array_board import ArrayBoard  # The NumPy-backed board engine
+from mem679_minesweeper.placement import relocate_safe_zone  # Clears prepared openings
+from mem679_minesweeper.changes import (  # Move deltas
+    LOST, PLAYING, WON, ChangeSet, cell_state,
+)
+
+# Board engines that a Game can run on, selected by name
+ENGINES = {
+    'cell': Board,        # One Cell object per position
+    'array': ArrayBoard,  # Compact NumPy state planes
+}
+
+# Move names accepted by Game.play and the methods they call
+MOVES = {
+    'reveal': 'reveal_cell',
+    'flag': 'toggle_flag',
+    'chord': 'chord_cell',
+}
+
+# Bounds of the no-guess search run by the first click, which waits for it
+NO_GUESS_TIMEOUT = 5.0  # Seconds before falling back to a random layout
+NO_GUESS_ATTEMPTS = 1000  # Layouts tried before falling back
+NO_GUESS_WORKERS = min(4, os.cpu_count() or 1)  # Worker processes of the search
 
 class Game:
     """
@@ -11,13 +35,27 @@ class Game:
     as well as checking for win or loss conditions.
 
     Attributes:
-        board (Board): The game board containing cells.
+        board (Board or ArrayBoard): The game board containing cells.
         game_over (bool): Indicates if the game has ended.
         win (bool): Indicates if the player has won the game.
         first_click (bool): Indicates if the next move is the first click.
+        no_guess (bool): Indicates if the layout is generated so that it can be
+            cleared from the first click without guessing. Cleared by the first
+            click if no such layout was found in time and a random one was placed.
+        prepared (bool): Indicates if the board was handed in with its mines
+            already laid out, e.g. by a BoardFactory.
+        instrumentation (Instrumentation or None): Records the timing of the game's
+            operations when given.
+        elapsed_time (float): Seconds played, kept up to date by the front end and
+            stored in save files.
+
+    Every move that changes the board is reported to the callbacks registered
+    with subscribe as a ChangeSet holding only the changed cells.
     """
 
-    def __init__(self, rows=16, columns=16, mines=40):
+    def __init__(self, rows=16, columns=16, mines=40, engine='cell', safe_zone=None,
+                 seed=None, rng=None, no_guess=False, board=None,
+                 instrumentation=None):
         """
         Initializes a new game with the specified board size and number of mines.
 
@@ -25,12 +63,155 @@ class Game:
             rows (int): Number of rows in the board.
             columns (int): Number of columns in the board.
             mines (int): Number of mines to be placed on the board.
+            engine (str): Name of the board engine, one of the keys of ENGINES.
+                'cell' uses the Cell-object Board, 'array' the NumPy ArrayBoard.
+            safe_zone (str or array-like, optional): Cells kept free of mines around
+                the first click: 'cell', '3x3' or a boolean mask, see
+                safe_zone_indices. Defaults to '3x3' for no-guess games, else 'cell'.
+            seed (int, optional): Seed for mine placement, making the layout
+                reproducible for a given first click.
+            rng (optional): Source of randomness used instead of a seed, e.g. a
+                random.Random or numpy.random.Generator.
+            no_guess (bool): Generate a layout that the logic-only solver clears from
+                the first click, see generate_no_guess. The search is bounded by
+                NO_GUESS_TIMEOUT and NO_GUESS_ATTEMPTS; when it fails, the first
+                click places a random layout instead and clears no_guess.
+            board (Board or ArrayBoard, optional): A prepared board to play on instead
+                of a new one; the size, engine and placement arguments are then
+                ignored. If its mines are already placed, the first click moves them
+                out of its safe zone, see relocate_safe_zone. A board with revealed
+                cells, e.g. a reopened MappedBoard, resumes past its first click, and
+                as lost if one of its mines is revealed.
+            instrumentation (Instrumentation, optional): Records counters, latencies and
+                flood-fill sizes of this game. Without it the game runs uninstrumented
+                at no extra cost.
+
+        Raises:
+            ValueError: If the engine name is unknown.
         """
-        # Initialize the game board with the given dimensions and mines
-        self.board = Board(rows, columns, mines)
+        if board is not None:
+            self.board = board  # Play on the prepared board
+        elif engine not in ENGINES:
+            raise ValueError(f"Unknown board engine: {engine!r}")
+        else:
+            if safe_zone is None:
+                # Solvable layouts are far more common with an opening around the click
+                safe_zone = '3x3' if no_guess else 'cell'
+            # Initialize the game board with the given dimensions and mines
+            self.board = ENGINES[engine](rows, columns, mines, safe_zone=safe_zone,
+                                         seed=seed, rng=rng)
         self.game_over = False  # Flag to indicate if the game has ended
         self.win = False        # Flag to indicate if the player has won
         self.first_click = True  # Flag to check if it's the first click
+        if board is not None and board.revealed_safe:
+            # A board already in play resumes where it was left; a revealed mine
+            # means the game was lost
+            self.first_click = False
+            self.win = board.is_win()
+            self.game_over = self.win or board.is_lost()
+        self.no_guess = no_guess  # Flag to generate a board solvable without guessing
+        # Flag for a layout made in advance
+        self.prepared = board is not None and board.mines_placed
+        self.instrumentation = instrumentation
+        self.elapsed_time = 0  # Seconds played, set by the front end
+        self._subscribers = []  # Callbacks receiving a ChangeSet per move
+        if instrumentation is not None:
+            instrumentation.attach(self)  # Wrap the timed methods of this game only
+
+    @property
+    def status(self):
+        """
+        str: The game status, one of PLAYING, WON or LOST.
+        """
+        if not self.game_over:
+            return PLAYING
+        return WON if self.win else LOST
+
+    def subscribe(self, callback):
+        """
+        Registers a callback that receives a ChangeSet after every move that changes
+        the board or the game status.
+
+        Args:
+            callback (callable): Called with the ChangeSet.
+
+        Returns:
+            callable: The callback, for unsubscribe.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """
+        Removes a callback registered with subscribe.
+
+        Args:
+            callback (callable): The callback to remove.
+        """
+        self._subscribers.remove(callback)
+
+    def _publish(self, action, x, y, revealed, extra=(), exploded=None, before=PLAYING):
+        """
+        Sends the changes made by a move to the subscribers.
+
+        Nothing is computed when there are no subscribers, and nothing is sent when
+        the move changed neither a cell nor the game status.
+
+        Args:
+            action (str): The move.
+            x (int): The row index of the cell the move was made on.
+            y (int): The column index of the cell the move was made on.
+            revealed (set of tuple): The (row, column) of the cells changed by the move.
+            extra (iterable of int): Linear indices of further changed cells, e.g. the
+                mines uncovered at game over.
+            exploded (tuple, optional): The (row, column) of the mine that lost the
+                game.
+            before (str): The game status before the move.
+        """
+        if not self._subscribers:
+            return
+        after = self.status
+        if not (revealed or extra or after != before):
+            return
+        grid = self.board.grid
+        columns = self.board.columns
+        indices = sorted({cx * columns + cy for cx, cy in revealed}.union(extra))
+        states = bytes(cell_state(grid[index // columns][index % columns])
+                       for index in indices)
+        change = ChangeSet(
+            action, x, y, indices, states,
+            status=(before, after) if after != before else None,
+            exploded=None if exploded is None else exploded[0] * columns + exploded[1],
+        )
+        for callback in list(self._subscribers):
+            callback(change)
+
+    def _place_mines(self, x, y):
+        """
+        Places the mines for a first click at (x, y), unless the board already has them.
+
+        Prepared boards instead have their mines moved out of the click's safe zone.
+
+        Args:
+            x (int): The row index of the first click.
+            y (int): The column index of the first click.
+        """
+        if self.prepared:
+            relocate_safe_zone(self.board, x, y)  # Keep the first click safe
+            return
+        if self.board.mines_placed:
+            return  # The layout was provided in advance
+        if self.no_guess:
+            # Imported here because the generator itself plays games
+            from mem679_minesweeper.no_guess import place_no_guess_mines
+            try:
+                place_no_guess_mines(self.board, x, y, workers=NO_GUESS_WORKERS,
+                                     max_attempts=NO_GUESS_ATTEMPTS,
+                                     timeout=NO_GUESS_TIMEOUT)
+                return
+            except TimeoutError:
+                self.no_guess = False  # Fall back to a random layout
+        self.board.place_mines(x, y)
 
     def reveal_cell(self, x, y):
         """
@@ -43,33 +224,59 @@ class Game:
         Args:
             x (int): The row index of the cell.
             y (int): The column index of the cell.
+
+        Returns:
+            set of tuple: The (row, column) of every cell revealed by this move. Mines
+            uncovered because the game was lost are not included.
         """
         if self.game_over:
-            return  # Do nothing if the game is over
+            return set()  # Do nothing if the game is over
 
         if self.first_click:
             # On the first click, place the mines, avoiding the first clicked cell
-            self.board.place_mines(x, y)
+            self._place_mines(x, y)
             self.first_click = False
 
         cell = self.board.grid[x][y]
 
         if cell.is_flagged:
-            return  # Do nothing if the cell is flagged
+            return set()  # Do nothing if the cell is flagged
 
         if cell.is_mine:
             # If the cell is a mine, reveal it and end the game with a loss
-            cell.reveal()
-            self.board.reveal_all_mines()  # Reveal all mines on the board
+            revealed = {(x, y)} if cell.reveal() else set()
+            mines = self.board.reveal_all_mines()  # Reveal all mines on the board
             self.game_over = True
             self.win = False
+            self._publish('reveal', x, y, revealed, mines, exploded=(x, y))
         else:
             # If the cell is not a mine, reveal it and potentially reveal adjacent cells
-            self.board.reveal_cell(x, y)
+            revealed = self.board.reveal_cell(x, y)
             if self.board.is_win():
                 # Check if the player has revealed all non-mine cells and won the game
                 self.game_over = True
                 self.win = True
+            self._publish('reveal', x, y, revealed)
+        return revealed
+
+    def play(self, action, x, y):
+        """
+        Performs a move given by name, as produced by bots and recorded games.
+
+        Args:
+            action (str): One of the keys of MOVES: 'reveal', 'flag' or 'chord'.
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            The return value of the corresponding method.
+
+        Raises:
+            ValueError: If the action is unknown.
+        """
+        if action not in MOVES:
+            raise ValueError(f"Unknown move: {action!r}")
+        return getattr(self, MOVES[action])(x, y)
 
     def toggle_flag(self, x, y):
         """
@@ -81,16 +288,23 @@ class Game:
         Args:
             x (int): The row index of the cell.
             y (int): The column index of the cell.
+
+        Returns:
+            set of tuple: ``{(x, y)}`` if the flag changed, else an empty set.
         """
         if self.game_over:
-            return  # Do nothing if the game is over
+            return set()  # Do nothing if the game is over
 
         if self.first_click:
             # Allow flagging before the first click reveals a cell
-            self.board.place_mines(x, y)
+            self._place_mines(x, y)
             self.first_click = False
 
+        if self.board.grid[x][y].is_revealed:
+            return set()  # Revealed cells cannot be flagged
         self.board.toggle_flag(x, y)  # Toggle the flag state of the cell
+        self._publish('flag', x, y, {(x, y)})
+        return {(x, y)}
 
     def chord_cell(self, x, y):
         """
@@ -102,20 +316,29 @@ class Game:
         Args:
             x (int): The row index of the cell.
             y (int): The column index of the cell.
+
+        Returns:
+            set of tuple: The (row, column) of every cell revealed by this move. Mines
+            uncovered because the game was lost are not included.
         """
         if self.game_over or self.first_click:
-            return  # Do nothing if the game is over or if it's the first click
+            return set()  # Do nothing if the game is over or if it's the first click
 
         # Perform chording action on the cell
-        mine_triggered = self.board.chord_cell(x, y)
+        mine_triggered, revealed = self.board.chord_reveal(x, y)
 
         if mine_triggered:
             # If a mine is triggered during chording, reveal all mines and end the game with a loss
-            self.board.reveal_all_mines()
+            mines = self.board.reveal_all_mines()
             self.game_over = True
             self.win = False
+            # Chording stops at the first mine it reveals
+            exploded = next(cell for cell in revealed if self.board.is_mine(*cell))
+            self._publish('chord', x, y, revealed, mines, exploded)
         else:
             if self.board.is_win():
                 # Check if the player has revealed all non-mine cells and won the game
                 self.game_over = True
                 self.win = True
+            self._publish('chord', x, y, revealed)
+        return revealed
@@ -1,8 +1,13 @@
 # gui.py
 
+import json
+import os
 import pygame
 import sys
 from mem679_minesweeper.game import Game  # Import the Game class from the src package
+from mem679_minesweeper.factory import BoardFactory  # Boards made in the background
+from mem679_minesweeper.instrumentation import Instrumentation  # Opt-in move timing
+from mem679_minesweeper.history import History  # Undo and redo of the moves
 
 # Define colors used in the game (RGB values)
 WHITE = (255, 255, 255)
@@ -22,6 +27,24 @@ MARGIN = 2
 MIN_WINDOW_WIDTH = 400
 MIN_WINDOW_HEIGHT = 500
 
+# Largest window, used when the size of the display is unknown
+MAX_WINDOW_WIDTH = 1280
+MAX_WINDOW_HEIGHT = 800
+
+# Cell sizes in pixels that the board can be zoomed to
+ZOOM_LEVELS = (6, 10, 14, 20, 30, 40, 60)
+
+# Event posted once a second while the game clock runs, to refresh the timer
+CLOCK_EVENT = pygame.USEREVENT + 1
+
+# Direction in which the arrow keys pan the board view
+PAN_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+
 class InputBox:
     """
     A class representing an input box for user text input.
@@ -107,6 +130,222 @@ class InputBox:
         """
         return int(self.text) if self.text.isdigit() else None
 
+class TileAtlas:
+    """
+    All cell tiles of one cell size, pre-rendered side by side on a single surface.
+
+    The tiles are the covered cell, the flag, the mine, the exploded mine and the
+    revealed cells showing 0 to 8 adjacent mines. Cells are drawn by blitting an
+    area of the atlas, so numbers are never rendered again while playing.
+
+    Attributes:
+        cell_size (int): Width and height of a tile in pixels.
+        surface (pygame.Surface): The atlas.
+        areas (dict): The area of each tile on the atlas, keyed by 'covered',
+            'flag', 'mine', 'exploded' or the number of adjacent mines.
+    """
+
+    KEYS = ('covered', 'flag', 'mine', 'exploded', 0, 1, 2, 3, 4, 5, 6, 7, 8)
+
+    def __init__(self, cell_size, font):
+        """
+        Render the tiles.
+
+        Args:
+            cell_size (int): Width and height of a tile in pixels.
+            font (pygame.font.Font): The font of the numbers.
+        """
+        self.cell_size = cell_size
+        self.surface = pygame.Surface((cell_size * len(self.KEYS), cell_size))
+        self.areas = {}
+        for i, key in enumerate(self.KEYS):
+            rect = pygame.Rect(i * cell_size, 0, cell_size, cell_size)
+            self.areas[key] = rect
+            self.draw_tile(key, rect, font)
+
+    def draw_tile(self, key, rect, font):
+        """
+        Draw one tile on the atlas.
+
+        Args:
+            key: The tile, one of KEYS.
+            rect (pygame.Rect): Where to draw it on the atlas.
+            font (pygame.font.Font): The font of the numbers.
+        """
+        size = self.cell_size
+        if key in ('mine', 'exploded'):
+            # Draw a mine; the one that ended the game gets a yellow border
+            pygame.draw.rect(self.surface, RED, rect)
+            pygame.draw.circle(self.surface, BLACK, rect.center, size // 2 - 4)
+            if key == 'exploded':
+                pygame.draw.rect(self.surface, YELLOW, rect, 2)
+        elif key in ('covered', 'flag'):
+            # Draw an unrevealed cell
+            pygame.draw.rect(self.surface, DARK_GRAY, rect)
+            if key == 'flag':
+                pygame.draw.polygon(
+                    self.surface, RED,
+                    [
+                        (rect.left + size // 2, rect.top + size // 4),
+                        (rect.left + 3 * size // 4, rect.top + size // 2),
+                        (rect.left + size // 2, rect.top + 3 * size // 4),
+                        (rect.left + size // 4, rect.top + size // 2)
+                    ]
+                )
+        else:
+            # Draw a revealed cell with the number of adjacent mines
+            pygame.draw.rect(self.surface, GRAY, rect)
+            if key > 0:
+                text_surface = font.render(str(key), True, BLUE)
+                self.surface.blit(text_surface,
+                                  text_surface.get_rect(center=rect.center))
+
+
+class Viewport:
+    """
+    The part of the board shown in the window, with pan and zoom.
+
+    Positions on the board are measured in pixels at the current cell size, and
+    the viewport shows the rectangle of that size starting at (x, y). Drawing and
+    hit-testing go through the viewport, so they only ever touch the cells inside
+    the visible rectangle, whatever the size of the board.
+
+    Attributes:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        width (int): Width of the view in pixels.
+        height (int): Height of the view in pixels.
+        cell_size (int): Current width and height of a cell in pixels.
+        x (int): Board pixel shown at the left edge of the view.
+        y (int): Board pixel shown at the top edge of the view.
+    """
+
+    def __init__(self, rows, columns, width, height, cell_size=CELL_SIZE):
+        """
+        Initialize the viewport at the top-left corner of the board.
+
+        Args:
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            width (int): Width of the view in pixels.
+            height (int): Height of the view in pixels.
+            cell_size (int): Initial cell size in pixels.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.x = 0
+        self.y = 0
+
+    @property
+    def pitch(self):
+        """int: Distance in pixels between the starts of neighbouring cells."""
+        return self.cell_size + MARGIN
+
+    def clamp(self):
+        """
+        Keep the view inside the board.
+        """
+        board_width = self.columns * self.pitch + MARGIN
+        board_height = self.rows * self.pitch + MARGIN
+        self.x = max(0, min(self.x, board_width - self.width))
+        self.y = max(0, min(self.y, board_height - self.height))
+
+    def visible_range(self):
+        """
+        Get the cells at least partly inside the view.
+
+        Returns:
+            tuple: Half-open bounds ``(row0, row1, col0, col1)``.
+        """
+        pitch = self.pitch
+        return (
+            self.y // pitch, min((self.y + self.height) // pitch + 1, self.rows),
+            self.x // pitch, min((self.x + self.width) // pitch + 1, self.columns),
+        )
+
+    def cell_rect(self, row, col):
+        """
+        Get the rectangle of a cell in view coordinates.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            pygame.Rect: The rectangle of the cell.
+        """
+        return pygame.Rect(
+            col * self.pitch + MARGIN - self.x,
+            row * self.pitch + MARGIN - self.y,
+            self.cell_size,
+            self.cell_size
+        )
+
+    def cell_at(self, px, py):
+        """
+        Find the cell under a point of the view.
+
+        Args:
+            px (int): The x-coordinate in the view.
+            py (int): The y-coordinate in the view.
+
+        Returns:
+            tuple or None: The (row, column) of the cell, or None if the point is
+            outside the view or the board.
+        """
+        if not (0 <= px < self.width and 0 <= py < self.height):
+            return None
+        row, col = (py + self.y) // self.pitch, (px + self.x) // self.pitch
+        if 0 <= row < self.rows and 0 <= col < self.columns:
+            return row, col
+        return None
+
+    def pan(self, dx, dy):
+        """
+        Move the view over the board.
+
+        Args:
+            dx (int): Pixels to move right.
+            dy (int): Pixels to move down.
+
+        Returns:
+            bool: True if the view moved.
+        """
+        before = self.x, self.y
+        self.x += dx
+        self.y += dy
+        self.clamp()
+        return (self.x, self.y) != before
+
+    def zoom(self, steps, px, py):
+        """
+        Change the cell size by a number of ZOOM_LEVELS, keeping the board point
+        under (px, py) in place.
+
+        Args:
+            steps (int): Levels to zoom in, negative to zoom out.
+            px (int): The x-coordinate in the view to zoom around.
+            py (int): The y-coordinate in the view to zoom around.
+
+        Returns:
+            bool: True if the cell size changed.
+        """
+        levels = sorted(set(ZOOM_LEVELS) | {self.cell_size})
+        index = max(0, min(levels.index(self.cell_size) + steps, len(levels) - 1))
+        if levels[index] == self.cell_size:
+            return False
+        # Board point under the cursor, in cells, before and after the change
+        bx, by = (px + self.x) / self.pitch, (py + self.y) / self.pitch
+        self.cell_size = levels[index]
+        self.x = round(bx * self.pitch - px)
+        self.y = round(by * self.pitch - py)
+        self.clamp()
+        return True
+
+
 class MinesweeperGUI:
     """
     A class representing the graphical user interface for Minesweeper.
@@ -115,9 +354,9 @@ class MinesweeperGUI:
         game (Game): The Minesweeper game logic.
         screen (pygame.Surface): The main display surface.
         font (pygame.font.Font): The font used for rendering text.
-        clock (pygame.time.Clock): The game clock to control frame rate.
         running (bool): Indicates whether the game loop is running.
         timer_started (bool): Indicates whether the timer has started.
+        clock_running (bool): Indicates whether CLOCK_EVENT is being posted.
         start_time (int): The time when the timer started.
         elapsed_time (int): The elapsed time in seconds.
         difficulty_selected (bool): Indicates if a difficulty level has been selected.
@@ -127,11 +366,27 @@ class MinesweeperGUI:
         rows (int): Number of rows in the game board.
         columns (int): Number of columns in the game board.
         mines (int): Number of mines in the game board.
+        factory (BoardFactory): Pre-generates the boards of the difficulty presets.
+        instrumentation (Instrumentation or None): Records the timing of every game
+            played, when enabled.
+        board_surface (pygame.Surface): Persistent image of the board; only the
+            cells that changed are redrawn on it.
+        dirty (set): The (row, column) of the cells to redraw on the next frame.
+        full_redraw (bool): Indicates if the whole window must be redrawn.
+        atlases (dict): Pre-rendered cell tiles, one TileAtlas per cell size.
+        viewport (Viewport or None): The visible part of the board.
+        exploded (set): The (row, column) of the mine that ended the game, if lost.
+        history (History or None): Undo and redo of the current game's moves.
     """
 
-    def __init__(self):
+    def __init__(self, instrumentation=None):
         """
         Initialize the Minesweeper GUI.
+
+        Args:
+            instrumentation (Instrumentation, optional): Records the timing of every
+                game played; its snapshot is written to stderr on exit. F9 switches
+                the profiler on and off during a game.
         """
         pygame.init()
         self.game = None  # Will initialize later based on difficulty
@@ -139,52 +394,90 @@ class MinesweeperGUI:
         self.screen = pygame.display.set_mode((MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT))
         pygame.display.set_caption('Minesweeper')
         self.font = pygame.font.SysFont('arial', 24)  # Default font for menus
-        self.clock = pygame.time.Clock()
         self.running = True  # Main loop control
         self.timer_started = False
+        self.clock_running = False
         self.start_time = 0
         self.elapsed_time = 0
         self.difficulty_selected = False  # Flag to check if the game has started
         self.customizing = False  # Flag for custom difficulty input mode
         self.input_boxes = []  # Stores input boxes for custom difficulty
         self.error_message = ''  # Error message display
+        self.factory = BoardFactory()  # Boards are ready before a game is started
+        self.factory.start()
+        self.instrumentation = instrumentation
+        self.board_surface = None  # Created when a game starts
+        self.dirty = set()
+        self.full_redraw = True
+        self._status = None  # Status line content last drawn
+        self.atlases = {}
+        self.viewport = None
+        self.exploded = set()
+        self.history = None
+        self.labels = {}  # Rendered text surfaces, keyed by text and color
 
     def run(self):
         """
         The main game loop. Handles switching between menus and game states.
+
+        The loop is event-driven: it sleeps in pygame.event.wait until there is
+        input, or until the once-a-second CLOCK_EVENT while the game clock runs,
+        and only then handles the events and redraws. An idle or minimized window
+        therefore uses essentially no CPU, and a click is handled as soon as it
+        arrives rather than on the next frame tick.
         """
+        self.draw_screen()
         while self.running:
-            self.clock.tick(30)  # Limit the frame rate to 30 FPS
+            # Sleep until something happens, then take everything that queued up
+            events = [pygame.event.wait()]
+            events.extend(pygame.event.get())
             if not self.difficulty_selected:
                 if self.customizing:
                     # Handle custom difficulty menu
-                    self.handle_custom_menu_events()
-                    self.show_custom_menu()
+                    self.handle_custom_menu_events(events)
                 else:
                     # Handle start menu
-                    self.handle_start_menu_events()
-                    self.show_start_menu()
+                    self.handle_start_menu_events(events)
             else:
-                # Handle game events and rendering
-                self.handle_events()
-                self.draw_board()
+                # Handle game events
+                self.handle_events(events)
                 self.update_timer()
-            # Update the display
-            pygame.display.flip()
+            if self.running:
+                self.draw_screen()
         # Quit the game when the main loop ends
+        self.factory.stop()
+        if self.instrumentation is not None:
+            self.log_instrumentation()
         pygame.quit()
         sys.exit()
 
-    def handle_start_menu_events(self):
+    def draw_screen(self):
+        """
+        Draw the current menu, or the changed parts of the game board.
+        """
+        if not self.difficulty_selected:
+            if self.customizing:
+                self.show_custom_menu()
+            else:
+                self.show_start_menu()
+            # Update the display
+            pygame.display.flip()
+        else:
+            self.draw_board()  # Updates only the changed parts of the display
+
+    def handle_start_menu_events(self, events=None):
         """
         Handle events in the start menu, such as difficulty selection.
+
+        Args:
+            events (list, optional): The events to handle, by default those queued.
         """
-        for event in pygame.event.get():
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False  # Exit the game
                 return
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 # Define difficulty buttons with their properties
                 buttons = [
                     {"label": "Beginner", "rect": pygame.Rect(125, 100, 150, 50), "rows": 9, "cols": 9, "mines": 10},
@@ -211,7 +504,7 @@ class MinesweeperGUI:
         """
         self.screen.fill(BLACK)
         # Render the title text
-        title_text = self.font.render("Select Difficulty", True, WHITE)
+        title_text = self.render_text("Select Difficulty", WHITE)
         title_rect = title_text.get_rect(center=(200, 50))
         self.screen.blit(title_text, title_rect)
 
@@ -226,7 +519,7 @@ class MinesweeperGUI:
         # Draw buttons and their labels
         for button in buttons:
             pygame.draw.rect(self.screen, DARK_GRAY, button["rect"])
-            label = self.font.render(button["label"], True, WHITE)
+            label = self.render_text(button["label"], WHITE)
             label_rect = label.get_rect(center=button["rect"].center)
             self.screen.blit(label, label_rect)
 
@@ -242,11 +535,14 @@ class MinesweeperGUI:
         ]
         self.error_message = ''  # Clear any previous error messages
 
-    def handle_custom_menu_events(self):
+    def handle_custom_menu_events(self, events=None):
         """
         Handle events in the custom difficulty menu, including input and submission.
+
+        Args:
+            events (list, optional): The events to handle, by default those queued.
         """
-        for event in pygame.event.get():
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False  # Exit the game
                 return
@@ -254,7 +550,7 @@ class MinesweeperGUI:
             for box in self.input_boxes:
                 box["box"].handle_event(event)
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 # Define the submit button
                 submit_button_rect = pygame.Rect(125, 300, 150, 50)
                 if submit_button_rect.collidepoint(mouse_pos):
@@ -283,7 +579,7 @@ class MinesweeperGUI:
         """
         self.screen.fill(BLACK)
         # Render the title text
-        title_text = self.font.render("Custom Difficulty", True, WHITE)
+        title_text = self.render_text("Custom Difficulty", WHITE)
         title_rect = title_text.get_rect(center=(200, 50))
         self.screen.blit(title_text, title_rect)
 
@@ -295,7 +591,7 @@ class MinesweeperGUI:
         ]
         # Draw labels next to input boxes
         for label in labels:
-            label_surface = self.font.render(label["text"], True, WHITE)
+            label_surface = self.render_text(label["text"], WHITE)
             self.screen.blit(label_surface, label["pos"])
 
         # Draw input boxes
@@ -305,13 +601,13 @@ class MinesweeperGUI:
         # Draw the submit button
         submit_button_rect = pygame.Rect(125, 300, 150, 50)
         pygame.draw.rect(self.screen, DARK_GRAY, submit_button_rect)
-        submit_text = self.font.render("Start Game", True, WHITE)
+        submit_text = self.render_text("Start Game", WHITE)
         submit_text_rect = submit_text.get_rect(center=submit_button_rect.center)
         self.screen.blit(submit_text, submit_text_rect)
 
         # Display error message if any
         if self.error_message:
-            error_text = self.font.render(self.error_message, True, RED)
+            error_text = self.render_text(self.error_message, RED)
             self.screen.blit(error_text, (100, 370))
 
     def start_game(self, rows, cols, mines):
@@ -323,15 +619,23 @@ class MinesweeperGUI:
             cols (int): Number of columns in the game board.
             mines (int): Number of mines to place on the board.
         """
-        # Initialize the game logic
-        self.game = Game(rows=rows, columns=cols, mines=mines)
+        # Initialize the game logic on a pre-generated board; only the difficulty
+        # presets are pooled, custom sizes are built on the spot
+        self.game = Game(board=self.factory.take(rows, cols, mines),
+                         instrumentation=self.instrumentation)
+        self.history = History(self.game)  # Journal the moves for Ctrl+Z and Ctrl+Y
+        self.game.subscribe(self.apply_changes)  # Redraw only the changed cells
         self.rows = rows
         self.columns = cols
         self.mines = mines
 
-        # Calculate the window size based on board dimensions
-        window_width = cols * (CELL_SIZE + MARGIN) + MARGIN
-        window_height = rows * (CELL_SIZE + MARGIN) + MARGIN + 100  # Extra space for UI elements
+        # Calculate the window size based on board dimensions, but no larger than
+        # the display; bigger boards are shown through a scrollable viewport
+        max_width, max_height = self.max_window_size()
+        view_width = min(cols * (CELL_SIZE + MARGIN) + MARGIN, max_width)
+        view_height = min(rows * (CELL_SIZE + MARGIN) + MARGIN, max_height - 100)
+        window_width = view_width
+        window_height = view_height + 100  # Extra space for UI elements
 
         # Ensure the window is at least the minimum size
         window_width = max(window_width, MIN_WINDOW_WIDTH)
@@ -339,31 +643,73 @@ class MinesweeperGUI:
 
         # Set up the display with the new window size
         self.screen = pygame.display.set_mode((window_width, window_height))
+        self.viewport = Viewport(rows, cols, view_width, view_height)
         # Adjust font size based on cell size
         self.font = pygame.font.SysFont('arial', CELL_SIZE // 2)
+        self.labels.clear()  # Labels were rendered with the menu font
         self.difficulty_selected = True  # Game has started
         self.timer_started = False
         self.elapsed_time = 0
+        # Persistent image of the view, fully drawn on the first frame
+        self.board_surface = pygame.Surface((view_width, view_height))
+        self.dirty = set()
+        self.exploded = set()
+        self.full_redraw = True
 
-    def handle_events(self):
+    def handle_events(self, events=None):
         """
         Handle events during the game, including user input and game logic.
+
+        Args:
+            events (list, optional): The events to handle, by default those queued.
         """
-        for event in pygame.event.get():
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False  # Exit the game
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.toggle_profiling()
+
+            elif (event.type == pygame.KEYDOWN
+                  and event.key in (pygame.K_z, pygame.K_y)
+                  and event.mod & pygame.KMOD_CTRL):
+                # Ctrl+Z undoes the last move and Ctrl+Y redoes it
+                if event.key == pygame.K_z:
+                    self.history.undo()
+                else:
+                    self.history.redo()
+
+            elif event.type == pygame.KEYDOWN and event.key in PAN_KEYS:
+                # Arrow keys scroll the view by a quarter of its size
+                dx, dy = PAN_KEYS[event.key]
+                if self.viewport.pan(dx * self.viewport.width // 4,
+                                     dy * self.viewport.height // 4):
+                    self.full_redraw = True
+
+            elif event.type == pygame.MOUSEWHEEL:
+                # The wheel zooms around the mouse pointer
+                if self.viewport.zoom(event.y, *pygame.mouse.get_pos()):
+                    self.full_redraw = True
+
+            elif event.type == pygame.MOUSEMOTION and event.buttons[1]:
+                # Dragging with the middle button pans the view
+                if self.viewport.pan(-event.rel[0], -event.rel[1]):
+                    self.full_redraw = True
+
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.full_redraw = True  # The window contents were lost
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 3):
+                mouse_x, mouse_y = event.pos
 
                 if not self.game.game_over:
                     # Game is ongoing
-                    if mouse_y < self.rows * (CELL_SIZE + MARGIN) + MARGIN:
+                    if mouse_y < self.viewport.height:
                         # Click is within the game board area
-                        col = mouse_x // (CELL_SIZE + MARGIN)
-                        row = mouse_y // (CELL_SIZE + MARGIN)
+                        target = self.viewport.cell_at(mouse_x, mouse_y)
 
-                        if 0 <= row < self.rows and 0 <= col < self.columns:
+                        if target is not None:
+                            row, col = target
                             # Check for modifier keys
                             modifiers = pygame.key.get_mods()
                             if event.button == 1:  # Left click
@@ -375,15 +721,13 @@ class MinesweeperGUI:
                                     self.game.reveal_cell(row, col)
                                     if not self.timer_started:
                                         # Start the timer on first action
-                                        self.timer_started = True
-                                        self.start_time = pygame.time.get_ticks()
+                                        self.start_timer()
                             elif event.button == 3:  # Right click
                                 # Toggle a flag on the cell
                                 self.game.toggle_flag(row, col)
                                 if not self.timer_started:
                                     # Start the timer on first action
-                                    self.timer_started = True
-                                    self.start_time = pygame.time.get_ticks()
+                                    self.start_timer()
                     else:
                         # Check if reset button is clicked
                         reset_button_rect = pygame.Rect(
@@ -400,60 +744,121 @@ class MinesweeperGUI:
                     if home_button_rect.collidepoint(mouse_x, mouse_y):
                         self.reset_game()
 
-    def draw_board(self):
+    def apply_changes(self, change):
         """
-        Render the game board, cells, and UI elements on the screen.
+        Schedule the cells changed by a move for redrawing; subscribed to the game.
+
+        Args:
+            change (ChangeSet): The cells changed by the move, including the mines
+                uncovered when it lost the game.
+        """
+        self.dirty.update(change.positions(self.columns))
+        if change.exploded is not None:
+            self.exploded = {divmod(change.exploded, self.columns)}
+        elif change.status is not None:
+            # A won game shows its covered mines, which the change set leaves out
+            self.dirty.update(self.game.board.mine_positions())
+            if not self.game.game_over:
+                # An undone ending resumes the game and its clock
+                self.exploded = set()
+                if self.timer_started and not self.clock_running:
+                    self.start_time = pygame.time.get_ticks() - self.elapsed_time * 1000
+                    pygame.time.set_timer(CLOCK_EVENT, 1000)
+                    self.clock_running = True
+
+    def max_window_size(self):
+        """
+        Get the largest window that fits on the display.
+
+        Returns:
+            tuple: The maximum (width, height) in pixels.
+        """
+        sizes = pygame.display.get_desktop_sizes()
+        if sizes and min(sizes[0]) > 0:
+            width, height = sizes[0]
+            # Leave room for the window decorations and task bars
+            return (max(width - 100, MIN_WINDOW_WIDTH),
+                    max(height - 100, MIN_WINDOW_HEIGHT))
+        return MAX_WINDOW_WIDTH, MAX_WINDOW_HEIGHT
+
+    @property
+    def atlas(self):
+        """TileAtlas: The tiles at the viewport's cell size, rendered on first use."""
+        size = self.viewport.cell_size
+        if size not in self.atlases:
+            font = pygame.font.SysFont('arial', max(size // 2, 6))
+            self.atlases[size] = TileAtlas(size, font)
+        return self.atlases[size]
+
+    def render_text(self, text, color):
+        """
+        Render text with the current font, reusing surfaces rendered before.
+
+        Args:
+            text (str): The text to render.
+            color (tuple): The RGB color of the text.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        surface = self.labels.get((text, color))
+        if surface is None:
+            if len(self.labels) >= 256:
+                self.labels.clear()  # Keep the cache small, e.g. with a running timer
+            surface = self.labels[text, color] = self.font.render(text, True, color)
+        return surface
+
+    def tile_key(self, row, col):
+        """
+        Get the atlas tile that shows a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            The key of the tile in the atlas, see TileAtlas.
+        """
+        cell = self.game.board.grid[row][col]
+        if cell.is_mine and (
+                cell.is_revealed or (self.game.game_over and not cell.is_flagged)):
+            # Mines are shown once revealed, including the covered ones after game over
+            return 'exploded' if (row, col) in self.exploded else 'mine'
+        if cell.is_revealed:
+            return cell.adjacent_mines
+        return 'flag' if cell.is_flagged else 'covered'
+
+    def draw_cells(self, cells):
+        """
+        Draw cells on the board surface in one batch of atlas blits.
+
+        Cells outside the viewport are skipped.
+
+        Args:
+            cells (iterable of tuple): The (row, column) of the cells.
+
+        Returns:
+            list of pygame.Rect: The rectangles that were drawn, clipped to the view.
+        """
+        row0, row1, col0, col1 = self.viewport.visible_range()
+        cells = [(row, col) for row, col in cells
+                 if row0 <= row < row1 and col0 <= col < col1]
+        atlas = self.atlas
+        view = self.board_surface.get_rect()
+        rects = [self.viewport.cell_rect(row, col) for row, col in cells]
+        self.board_surface.blits(
+            [(atlas.surface, rect, atlas.areas[self.tile_key(row, col)])
+             for (row, col), rect in zip(cells, rects)],
+            doreturn=False,
+        )
+        return [rect.clip(view) for rect in rects]
+
+    def draw_status(self):
+        """
+        Draw the timer, mine counter, buttons and game over message over the board.
         """
-        self.screen.fill(BLACK)
-        # Draw each cell on the board
-        for row in range(self.rows):
-            for col in range(self.columns):
-                cell = self.game.board.grid[row][col]
-                rect = pygame.Rect(
-                    col * (CELL_SIZE + MARGIN) + MARGIN,
-                    row * (CELL_SIZE + MARGIN) + MARGIN,
-                    CELL_SIZE,
-                    CELL_SIZE
-                )
-                if cell.is_revealed:
-                    if cell.is_mine:
-                        # Draw a mine
-                        pygame.draw.rect(self.screen, RED, rect)
-                        pygame.draw.circle(
-                            self.screen, BLACK,
-                            rect.center, CELL_SIZE // 2 - 4
-                        )
-                    else:
-                        # Draw a revealed cell
-                        pygame.draw.rect(self.screen, GRAY, rect)
-                        if cell.adjacent_mines > 0:
-                            # Draw the number of adjacent mines
-                            text_surface = self.font.render(str(cell.adjacent_mines), True, BLUE)
-                            text_rect = text_surface.get_rect(center=rect.center)
-                            self.screen.blit(text_surface, text_rect)
-                else:
-                    # Draw an unrevealed cell
-                    pygame.draw.rect(self.screen, DARK_GRAY, rect)
-                    if cell.is_flagged:
-                        # Draw a flag
-                        pygame.draw.polygon(
-                            self.screen, RED,
-                            [
-                                (rect.left + CELL_SIZE // 2, rect.top + CELL_SIZE // 4),
-                                (rect.left + 3 * CELL_SIZE // 4, rect.top + CELL_SIZE // 2),
-                                (rect.left + CELL_SIZE // 2, rect.top + 3 * CELL_SIZE // 4),
-                                (rect.left + CELL_SIZE // 4, rect.top + CELL_SIZE // 2)
-                            ]
-                        )
-                    elif self.game.game_over and cell.is_mine:
-                        # Reveal mines after game over
-                        pygame.draw.rect(self.screen, RED, rect)
-                        pygame.draw.circle(
-                            self.screen, BLACK,
-                            rect.center, CELL_SIZE // 2 - 4
-                        )
-        # Draw timer and buttons
         self.draw_timer()
+        self.draw_mine_counter()
         if self.game.game_over:
             # Draw "Home" button and game over message
             self.draw_home_button()
@@ -462,13 +867,79 @@ class MinesweeperGUI:
             # Draw "Reset" button during the game
             self.draw_reset_button()
 
+    def draw_board(self):
+        """
+        Render the changed parts of the game board and UI elements on the screen.
+
+        The view of the board is kept on a persistent surface. Only the visible
+        cells reported as changed by the game are redrawn, and only their
+        rectangles, plus the status area when its content changed, are sent to the
+        display. A frame in which nothing changed costs next to nothing, and a full
+        redraw after panning or zooming touches only the visible cells.
+        """
+        status_rect = pygame.Rect(0, self.screen.get_height() - 120,
+                                  self.screen.get_width(), 120)
+        status = (self.elapsed_time, self.game.board.remaining_mines,
+                  self.game.game_over)
+
+        if self.full_redraw:
+            # Draw every visible cell, e.g. when the game starts or the view moved
+            row0, row1, col0, col1 = self.viewport.visible_range()
+            self.board_surface.fill(BLACK)
+            self.draw_cells([(row, col) for row in range(row0, row1)
+                             for col in range(col0, col1)])
+            self.screen.fill(BLACK)
+            self.screen.blit(self.board_surface, (0, 0))
+            self.draw_status()
+            pygame.display.flip()
+            self.full_redraw = False
+            self.dirty.clear()
+            self._status = status
+            return
+
+        rects = self.draw_cells(list(self.dirty))
+        self.dirty.clear()
+        self.screen.blits([(self.board_surface, rect, rect) for rect in rects],
+                          doreturn=False)
+        redraw_status = status != self._status or status_rect.collidelist(rects) != -1
+        if redraw_status:
+            # Restore the board under the status area, then draw the status on top
+            self.screen.fill(BLACK, status_rect)
+            self.screen.blit(self.board_surface, status_rect, status_rect)
+            self.draw_status()
+            rects.append(status_rect)
+            self._status = status
+        if rects:
+            pygame.display.update(rects)
+
+    def start_timer(self):
+        """
+        Start the timer, with a CLOCK_EVENT every second to refresh its display.
+        """
+        self.timer_started = True
+        self.start_time = pygame.time.get_ticks()
+        pygame.time.set_timer(CLOCK_EVENT, 1000)
+        self.clock_running = True
+
+    def stop_clock(self):
+        """
+        Stop posting CLOCK_EVENT, so that the loop sleeps until the next input.
+        """
+        pygame.time.set_timer(CLOCK_EVENT, 0)
+        self.clock_running = False
+
     def update_timer(self):
         """
         Update the elapsed time if the timer is running.
+
+        The time is taken once more when the game ends, then the clock stops.
         """
-        if self.timer_started and not self.game.game_over:
+        if self.timer_started and self.clock_running:
             # Calculate elapsed time in seconds
             self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
+            self.game.elapsed_time = self.elapsed_time  # Stored when the game is saved
+            if self.game.game_over:
+                self.stop_clock()  # Freeze the time at the end of the game
 
     def draw_timer(self):
         """
@@ -478,10 +949,21 @@ class MinesweeperGUI:
         timer_rect = pygame.Rect(10, self.screen.get_height() - 80, 250, 30)
         pygame.draw.rect(self.screen, BLACK, timer_rect)
         # Timer text with units
-        timer_text = self.font.render(f"Time: {self.elapsed_time} seconds", True, WHITE)
+        timer_text = self.render_text(f"Time: {self.elapsed_time} seconds", WHITE)
         # Draw the timer text
         self.screen.blit(timer_text, (15, self.screen.get_height() - 75))
 
+    def draw_mine_counter(self):
+        """
+        Draw the number of mines left to flag next to the timer.
+        """
+        counter_rect = pygame.Rect(self.screen.get_width() - 130,
+                                   self.screen.get_height() - 80, 120, 30)
+        pygame.draw.rect(self.screen, BLACK, counter_rect)
+        counter_text = self.render_text(f"Mines: {self.game.board.remaining_mines}",
+                                        WHITE)
+        self.screen.blit(counter_text, (counter_rect.x + 5, counter_rect.y + 5))
+
     def draw_reset_button(self):
         """
         Draw the "Reset" button on the screen.
@@ -490,7 +972,7 @@ class MinesweeperGUI:
             self.screen.get_width() // 2 - 120, self.screen.get_height() - 40, 100, 30
         )
         pygame.draw.rect(self.screen, DARK_GRAY, reset_button_rect)
-        reset_text = self.font.render("Reset", True, WHITE)
+        reset_text = self.render_text("Reset", WHITE)
         reset_text_rect = reset_text.get_rect(center=reset_button_rect.center)
         self.screen.blit(reset_text, reset_text_rect)
 
@@ -502,16 +984,37 @@ class MinesweeperGUI:
             self.screen.get_width() // 2 + 20, self.screen.get_height() - 40, 100, 30
         )
         pygame.draw.rect(self.screen, DARK_GRAY, home_button_rect)
-        home_text = self.font.render("Home", True, WHITE)
+        home_text = self.render_text("Home", WHITE)
         home_text_rect = home_text.get_rect(center=home_button_rect.center)
         self.screen.blit(home_text, home_text_rect)
 
+    def toggle_profiling(self):
+        """
+        Switch the profiler on or off, if instrumentation is enabled.
+        """
+        if self.instrumentation is None:
+            return
+        if self.instrumentation.profiler is None:
+            self.instrumentation.start_profiling()
+        else:
+            self.instrumentation.stop_profiling()
+
+    def log_instrumentation(self):
+        """
+        Write the instrumentation snapshot, and the profile if any, to stderr.
+        """
+        print(json.dumps(self.instrumentation.snapshot(), indent=2), file=sys.stderr)
+        report = self.instrumentation.profile_report()
+        if report:
+            print(report, file=sys.stderr)
+
     def reset_game(self):
         """
         Reset the game to the start menu.
         """
         self.difficulty_selected = False
         self.timer_started = False
+        self.stop_clock()
         self.elapsed_time = 0
         self.customizing = False  # Exit custom difficulty mode
         self.error_message = ''  # Clear any error messages
@@ -535,7 +1038,7 @@ class MinesweeperGUI:
             color = RED
 
         # Render the message text
-        text_surface = self.font.render(message, True, color)
+        text_surface = self.render_text(message, color)
         text_rect = text_surface.get_rect(center=message_rect.center)
         # Draw the message text
         self.screen.blit(text_surface, text_rect)
@@ -544,7 +1047,13 @@ def main():
     """
     The main entry point of the game.
     """
-    gui = MinesweeperGUI()
+    # MINESWEEPER_INSTRUMENT=1 records timings, MINESWEEPER_INSTRUMENT=profile
+    # also profiles
+    mode = os.environ.get('MINESWEEPER_INSTRUMENT')
+    instrumentation = Instrumentation() if mode else None
+    if mode == 'profile':
+        instrumentation.start_profiling()
+    gui = MinesweeperGUI(instrumentation)
     gui.run()
 
 if __name__ == '__main__':
@@ -0,0 +1,221 @@
+# history.py
+
+import sys  # Sizes of the journal entries, for the memory cap
+from array import array  # Compact storage of the run-length encoded cells
+from collections import deque  # Undo stack that drops its oldest moves
+from mem679_minesweeper.changes import PLAYING, WON  # Game statuses
+
+
+def encode_runs(indices):
+    """
+    Run-length encodes sorted linear indices as ranges of consecutive cells.
+
+    A flood fill reveals long runs of neighbouring cells in every row, so an
+    opening of thousands of cells is stored in a few hundred numbers.
+
+    Args:
+        indices (iterable of int): Sorted linear indices ``x * columns + y``.
+
+    Returns:
+        array.array: Alternating start index and length of every run.
+    """
+    runs = array('I')
+    start = previous = None
+    for index in indices:
+        if previous is not None and index == previous + 1:
+            previous = index
+            continue
+        if start is not None:
+            runs.append(start)
+            runs.append(previous - start + 1)
+        start = previous = index
+    if start is not None:
+        runs.append(start)
+        runs.append(previous - start + 1)
+    return runs
+
+
+def decode_runs(runs):
+    """
+    Expands the runs built by encode_runs back into linear indices.
+
+    Args:
+        runs (array.array): Alternating start index and length of every run.
+
+    Returns:
+        list of int: The sorted linear indices.
+    """
+    indices = []
+    for position in range(0, len(runs), 2):
+        start = runs[position]
+        indices.extend(range(start, start + runs[position + 1]))
+    return indices
+
+
+class JournalEntry:
+    """
+    One move in the journal, holding only the cells it changed.
+
+    The state of a cell before the move follows from the move itself: a reveal or
+    chord only uncovers covered, unflagged cells and a flag move toggles one flag,
+    so storing which cells changed is enough to undo and redo the move.
+
+    Attributes:
+        action (str): The move, one of 'reveal', 'flag' or 'chord'.
+        x (int): The row index of the cell the move was made on.
+        y (int): The column index of the cell the move was made on.
+        runs (array.array): The changed cells, see encode_runs.
+        status (tuple or None): ``(before, after)`` game statuses if the move
+            ended the game, else None.
+        exploded (int or None): Linear index of the mine that lost the game.
+        nbytes (int): Memory used by the entry.
+    """
+
+    __slots__ = ('action', 'x', 'y', 'runs', 'status', 'exploded', 'nbytes')
+
+    def __init__(self, change):
+        """
+        Builds the entry from the change set of a move.
+
+        Args:
+            change (ChangeSet): The changes made by the move.
+        """
+        self.action = change.action
+        self.x = change.x
+        self.y = change.y
+        self.runs = encode_runs(change.indices)
+        self.status = change.status
+        self.exploded = change.exploded
+        self.nbytes = sys.getsizeof(self) + sys.getsizeof(self.runs)
+
+
+class History:
+    """
+    Undo and redo for a game, kept as a journal of compact per-move deltas.
+
+    The history subscribes to the game's change sets, so every move is journaled
+    as it is made. Undoing or redoing a move touches only the cells that move
+    changed, and is reported to the game's other subscribers as an 'undo' or
+    'redo' change set. A new move clears the moves that could be redone.
+
+    The mine layout is not part of the journal: undoing the first click leaves
+    the mines where they were placed.
+
+    Attributes:
+        game (Game): The game whose moves are journaled.
+        capacity (int): Maximum number of moves that can be undone; the oldest
+            moves are dropped beyond it.
+        max_bytes (int or None): Maximum memory used by the journal, None for no
+            limit. The oldest moves are dropped to stay below it.
+        nbytes (int): Memory used by the journal.
+    """
+
+    def __init__(self, game, capacity=1000, max_bytes=None):
+        """
+        Starts journaling the moves of a game.
+
+        Args:
+            game (Game): The game to journal.
+            capacity (int): Maximum number of moves that can be undone.
+            max_bytes (int, optional): Maximum memory used by the journal.
+        """
+        self.game = game
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._undo = deque()
+        self._redo = []
+        game.subscribe(self.record)
+
+    @property
+    def can_undo(self):
+        """
+        bool: Indicates whether there is a move to undo.
+        """
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        """
+        bool: Indicates whether there is an undone move to redo.
+        """
+        return bool(self._redo)
+
+    def record(self, change):
+        """
+        Journals a move; subscribed to the game.
+
+        Args:
+            change (ChangeSet): The changes made by the move.
+        """
+        if change.action in ('undo', 'redo'):
+            return  # Changes made by this history
+        for entry in self._redo:
+            self.nbytes -= entry.nbytes
+        self._redo.clear()
+        entry = JournalEntry(change)
+        self._undo.append(entry)
+        self.nbytes += entry.nbytes
+        # Drop the oldest moves beyond the caps
+        while self._undo and (len(self._undo) > self.capacity or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            self.nbytes -= self._undo.popleft().nbytes
+
+    def _apply(self, entry, forward):
+        """
+        Replays a journaled move forwards or backwards.
+
+        Args:
+            entry (JournalEntry): The move.
+            forward (bool): True to redo the move, False to undo it.
+
+        Returns:
+            set of tuple: The (row, column) of the cells changed.
+        """
+        game = self.game
+        board = game.board
+        before = game.status
+        indices = decode_runs(entry.runs)
+        if entry.action == 'flag':
+            for index in indices:
+                board.toggle_flag(*divmod(index, board.columns))
+        else:
+            board.set_revealed(indices, forward)
+        exploded = None
+        if entry.status is not None:
+            status = entry.status[1] if forward else entry.status[0]
+            game.game_over = status != PLAYING
+            game.win = status == WON
+            if forward and entry.exploded is not None:
+                exploded = divmod(entry.exploded, board.columns)
+        game._publish('redo' if forward else 'undo', entry.x, entry.y, (), indices,
+                      exploded, before)
+        return {divmod(index, board.columns) for index in indices}
+
+    def undo(self):
+        """
+        Undoes the last move.
+
+        Returns:
+            set of tuple: The (row, column) of the cells changed, empty if there was
+            nothing to undo.
+        """
+        if not self._undo:
+            return set()
+        entry = self._undo.pop()
+        self._redo.append(entry)
+        return self._apply(entry, False)
+
+    def redo(self):
+        """
+        Redoes the last undone move.
+
+        Returns:
+            set of tuple: The (row, column) of the cells changed, empty if there was
+            nothing to redo.
+        """
+        if not self._redo:
+            return set()
+        entry = self._redo.pop()
+        self._undo.append(entry)
+        return self._apply(entry, True)
@@ -0,0 +1,269 @@
+# instrumentation.py
+
+import cProfile  # Deterministic profiler that can be switched on at runtime
+import io  # Collects the profiler report as text
+import pstats  # Formats the profiler report
+import time  # High-resolution timer for the latencies
+
+# Game methods that are timed, with the operation name they are recorded under.
+# The moves are the outermost calls, so the profiler is switched on around them
+GAME_OPERATIONS = {
+    'reveal_cell': 'reveal',
+    'toggle_flag': 'flag',
+    'chord_cell': 'chord',
+    '_place_mines': 'place_mines',
+}
+MOVE_OPERATIONS = ('reveal', 'flag', 'chord')
+
+# Board methods that are timed, with the operation name they are recorded under
+BOARD_OPERATIONS = {
+    'is_win': 'win_check',
+    'reveal_cell': 'flood_fill',
+}
+
+
+class Histogram:
+    """
+    A histogram of non-negative values with power-of-two buckets.
+
+    Bucket b counts the values whose integer part has b bits, i.e. the values in
+    ``[2 ** (b - 1), 2 ** b)``, and bucket 0 the values below 1. Recording a value
+    takes constant time and the memory does not grow with the number of values.
+
+    Attributes:
+        count (int): Number of values recorded.
+        total (float): Sum of the values.
+        minimum (float or None): Smallest value, None if empty.
+        maximum (float or None): Largest value, None if empty.
+        buckets (dict): Number of values per bucket.
+    """
+
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'buckets')
+
+    def __init__(self):
+        """
+        Initializes an empty histogram.
+        """
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.buckets = {}
+
+    def record(self, value):
+        """
+        Adds a value to the histogram.
+
+        Args:
+            value (float): The value, at least 0.
+        """
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        bucket = int(value).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """
+        Estimates a percentile as the upper bound of the bucket it falls in.
+
+        Args:
+            fraction (float): The percentile as a fraction, e.g. 0.99.
+
+        Returns:
+            float or None: The estimate, capped by the maximum, or None if empty.
+        """
+        if not self.count:
+            return None
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= fraction * self.count:
+                return min(2 ** bucket, self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        """
+        Returns the histogram as a plain dictionary for logging.
+
+        Returns:
+            dict: The count, total, mean, minimum, maximum, median and 99th
+            percentile, and the buckets keyed by their upper bound.
+        """
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            'p50': self.percentile(0.5),
+            'p99': self.percentile(0.99),
+            'buckets': {
+                2 ** bucket: self.buckets[bucket] for bucket in sorted(self.buckets)
+            },
+        }
+
+
+class Instrumentation:
+    """
+    Opt-in counters, latency histograms and profiling for games and boards.
+
+    attach wraps the timed methods of one Game and its board with instance
+    attributes that shadow the class methods; detach removes them again. Games
+    that are not attached run the plain methods, so instrumentation costs nothing
+    when it is disabled. One Instrumentation can be attached to several games in
+    turn, and accumulates over all of them.
+
+    Attributes:
+        counters (dict): Number of calls per operation, plus 'cells_revealed',
+            the total number of cells revealed by flood fills.
+        latencies (dict): Histogram of the latency in microseconds per operation.
+        flood_cells (Histogram): Number of cells revealed per flood fill.
+        profiler (cProfile.Profile or None): The profiler, while profiling is on.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.counters = {}
+        self.latencies = {}
+        self.flood_cells = Histogram()
+        self.profiler = None
+        self._profile = None  # Profile kept after profiling stops, for the report
+
+    def _record(self, operation, seconds):
+        """
+        Counts one call of an operation and records its latency.
+
+        Args:
+            operation (str): The operation name.
+            seconds (float): The latency of the call.
+        """
+        self.counters[operation] = self.counters.get(operation, 0) + 1
+        histogram = self.latencies.get(operation)
+        if histogram is None:
+            histogram = self.latencies[operation] = Histogram()
+        histogram.record(seconds * 1e6)
+
+    def _wrap(self, method, operation):
+        """
+        Returns a timed version of a bound method.
+
+        Args:
+            method (callable): The bound method.
+            operation (str): The operation name it is recorded under.
+
+        Returns:
+            callable: The wrapper.
+        """
+        timer = time.perf_counter
+        is_move = operation in MOVE_OPERATIONS
+        is_flood = operation == 'flood_fill'
+
+        def timed(*args, **kwargs):
+            profiler = self.profiler if is_move else None
+            if profiler is not None:
+                profiler.enable()
+            start = timer()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                self._record(operation, timer() - start)
+                if profiler is not None:
+                    profiler.disable()
+            if is_flood:
+                self.flood_cells.record(len(result))
+                revealed = self.counters.get('cells_revealed', 0) + len(result)
+                self.counters['cells_revealed'] = revealed
+            return result
+
+        timed.__wrapped__ = method
+        return timed
+
+    def attach(self, game):
+        """
+        Starts recording the operations of a game and its board.
+
+        Args:
+            game (Game): The game to instrument.
+        """
+        targets = ((game, GAME_OPERATIONS), (game.board, BOARD_OPERATIONS))
+        for target, operations in targets:
+            for name, operation in operations.items():
+                if name not in vars(target):  # Do not wrap twice
+                    setattr(target, name, self._wrap(getattr(target, name), operation))
+
+    @staticmethod
+    def detach(game):
+        """
+        Stops recording a game, restoring the plain methods.
+
+        Args:
+            game (Game): The instrumented game.
+        """
+        targets = ((game, GAME_OPERATIONS), (game.board, BOARD_OPERATIONS))
+        for target, operations in targets:
+            for name in operations:
+                vars(target).pop(name, None)
+
+    def start_profiling(self):
+        """
+        Switches the profiler on; it runs only inside the moves of attached games.
+        """
+        if self.profiler is None:
+            self.profiler = self._profile = cProfile.Profile()
+
+    def stop_profiling(self):
+        """
+        Switches the profiler off, keeping its data for profile_report.
+        """
+        self.profiler = None
+
+    def profile_report(self, limit=20, sort='cumulative'):
+        """
+        Returns the profiler's report of the most expensive functions.
+
+        Args:
+            limit (int): Number of functions to list.
+            sort (str): The pstats sort key.
+
+        Returns:
+            str: The report, empty if profiling was never switched on.
+        """
+        if self._profile is None:
+            return ''
+        stream = io.StringIO()
+        pstats.Stats(self._profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def reset(self):
+        """
+        Clears the statistics and the profile.
+        """
+        self.counters.clear()
+        self.latencies.clear()
+        self.flood_cells = Histogram()
+        if self.profiler is not None:
+            self.profiler = cProfile.Profile()
+        self._profile = self.profiler
+
+    def snapshot(self):
+        """
+        Returns the statistics as a plain dictionary, ready to be logged as JSON.
+
+        Returns:
+            dict: The counters, the latency histograms in microseconds per
+            operation, the flood-fill size histogram and whether profiling is on.
+        """
+        return {
+            'counters': dict(self.counters),
+            'latency_us': {
+                name: histogram.to_dict() for name, histogram in self.latencies.items()
+            },
+            'flood_cells': self.flood_cells.to_dict(),
+            'profiling': self.profiler is not None,
+        }
@@ -0,0 +1,309 @@
+# mapped_board.py
+
+import os  # Sizes the board file
+import struct  # Fixed-size header holding the dimensions and counters
+import numpy as np  # The state planes are NumPy views of the mapped file
+from mem679_minesweeper.array_board import ArrayBoard, ArrayGrid  # The extended engine
+from mem679_minesweeper.persistence import (  # Header fields shared with save files
+    SAFE_ZONE_NAMES, _header_seed, _safe_zone_code,
+)
+from mem679_minesweeper.placement import (
+    resolve_rng, safe_zone_indices, sample_mine_plane,
+)
+
+# File layout: a header block followed by the mine, revealed, flagged, adjacency
+# and flagged-neighbour planes, one byte per cell each. Numbers are little-endian
+MAGIC = b'MSWM'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBIIIqqqq')
+HEADER_SIZE = 4096  # The planes start on a page boundary
+PLANES = ('mines', 'revealed', 'flagged', 'adjacent', 'flagged_neighbors')
+
+# Bits of the header's flags byte
+HAS_SEED = 0x01
+MINES_PLACED = 0x02
+
+
+class MappedBoard(ArrayBoard):
+    """
+    An ArrayBoard whose state planes live in a memory-mapped file.
+
+    The five planes are NumPy views of one file, so the operating system pages in
+    only the parts of the board that are played or rendered, and boards far
+    larger than the available memory, e.g. 20000x20000, can be played. The file
+    is created sparse: untouched regions take no disk space. Reopening a board
+    maps the file and reads its header, whatever the board size.
+
+    MappedBoard offers the same methods as ArrayBoard, so Game and the GUI work
+    unchanged. It keeps no in-memory mine index; mine lookups read the mine
+    plane, and whole-board passes such as the adjacency counts and
+    reveal_all_mines run in bands of BAND_ROWS rows to bound their memory.
+
+    Attributes:
+        path (str): The board file.
+        mine_count (int): Number of cells that currently hold a mine.
+
+    Call flush to store the counters in the file, or close when done with the board.
+    """
+
+    BAND_ROWS = 1024  # Rows per band of the whole-board passes
+
+    def __init__(self, path, rows, columns, mines, safe_zone='cell', seed=None,
+                 rng=None):
+        """
+        Creates a new board file, replacing any existing file at path.
+
+        Args:
+            path (str or os.PathLike): The board file to create.
+            rows (int): Number of rows in the board.
+            columns (int): Number of columns in the board.
+            mines (int): Number of mines to be placed on the board.
+            safe_zone (str or array-like): Cells kept free of mines around the first
+                click: 'cell', '3x3' or a boolean mask, see safe_zone_indices.
+            seed (int, optional): Seed for mine placement. A fresh one is drawn when
+                neither seed nor rng is given.
+            rng (optional): Source of randomness used instead of a seed, see
+                resolve_rng.
+        """
+        self.path = os.fspath(path)
+        self.rows = rows
+        self.columns = columns
+        self.total_mines = mines
+        self.safe_zone = safe_zone
+        self.seed, self.rng = resolve_rng(seed, rng)  # Randomness for placement
+        self.mines_placed = False
+        self._mine_count = 0
+        self.revealed_safe = 0
+        self.flags_placed = 0
+        with open(self.path, 'wb') as file:
+            # Sparse, all zeros
+            file.truncate(HEADER_SIZE + len(PLANES) * rows * columns)
+        self._map_planes()
+        self.flush()
+
+    @classmethod
+    def open(cls, path):
+        """
+        Reopens a board file created by MappedBoard.
+
+        Only the header is read; the planes are mapped and paged in when used.
+
+        Args:
+            path (str or os.PathLike): The board file.
+
+        Returns:
+            MappedBoard: The board, as it was last flushed.
+
+        Raises:
+            ValueError: If the file is not a board file or has an unsupported version.
+        """
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError('Not a Minesweeper board file')
+        (magic, version, flags, safe_zone, rows, columns, mines,
+         mine_count, revealed_safe, flags_placed, seed) = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError('Not a Minesweeper board file')
+        if version != VERSION:
+            raise ValueError(f'Unsupported board file version: {version}')
+        if safe_zone not in SAFE_ZONE_NAMES:
+            raise ValueError('Not a Minesweeper board file')
+        board = cls.__new__(cls)
+        board.path = os.fspath(path)
+        board.rows = rows
+        board.columns = columns
+        board.total_mines = mines
+        board.safe_zone = SAFE_ZONE_NAMES[safe_zone]
+        board.seed, board.rng = resolve_rng(seed if flags & HAS_SEED else None)
+        board.mines_placed = bool(flags & MINES_PLACED)
+        board._mine_count = mine_count
+        board.revealed_safe = revealed_safe
+        board.flags_placed = flags_placed
+        board._map_planes()
+        return board
+
+    def _map_planes(self):
+        """
+        Maps the board file and creates the plane views.
+        """
+        cells = self.rows * self.columns
+        self._map = np.memmap(self.path, dtype=np.uint8, mode='r+')
+        for position, name in enumerate(PLANES):
+            start = HEADER_SIZE + position * cells
+            plane = self._map[start:start + cells].reshape(self.rows, self.columns)
+            if name not in ('adjacent', 'flagged_neighbors'):
+                plane = plane.view(bool)
+            setattr(self, name, plane)
+        self.grid = ArrayGrid(self)  # Cell views for Cell-style access
+
+    def flush(self):
+        """
+        Writes the counters to the header and the changed pages to disk.
+        """
+        seed = _header_seed(self.seed)
+        flags = ((HAS_SEED if seed is not None else 0)
+                 | (MINES_PLACED if self.mines_placed else 0))
+        self._map[:HEADER.size] = np.frombuffer(HEADER.pack(
+            MAGIC, VERSION, flags, _safe_zone_code(self.safe_zone), self.rows,
+            self.columns, self.total_mines, self._mine_count, self.revealed_safe,
+            self.flags_placed, 0 if seed is None else seed,
+        ), dtype=np.uint8)
+        self._map.flush()
+
+    def close(self):
+        """
+        Flushes the board and unmaps its file. The board cannot be used afterwards.
+        """
+        self.flush()
+        for name in PLANES:
+            delattr(self, name)
+        self._map = None
+        self.grid = None
+
+    @property
+    def mine_count(self):
+        """
+        int: Number of cells that currently hold a mine.
+        """
+        return self._mine_count
+
+    def _bands(self, x0=0, x1=None):
+        """
+        Splits a range of rows into bands of at most BAND_ROWS rows.
+
+        Args:
+            x0 (int): The first row.
+            x1 (int, optional): The row after the last one. Defaults to rows.
+
+        Returns:
+            list of tuple: Half-open ``(start, stop)`` row ranges.
+        """
+        x1 = self.rows if x1 is None else x1
+        return [(start, min(start + self.BAND_ROWS, x1))
+                for start in range(x0, x1, self.BAND_ROWS)]
+
+    def _set_mine(self, x, y, is_mine):
+        """
+        Adds or removes the mine at (x, y) and updates the counters.
+
+        Adjacency counts are not touched; callers recompute them afterwards.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+            is_mine (bool): True to place a mine, False to remove it.
+        """
+        if self.mines[x, y] == is_mine:
+            return  # Nothing changes
+        self.mines[x, y] = is_mine
+        delta = 1 if is_mine else -1
+        self._mine_count += delta
+        if self.revealed[x, y]:
+            self.revealed_safe -= delta  # The cell stopped or started being safe
+
+    def place_mines(self, exclude_x, exclude_y, safe_zone=None):
+        """
+        Places mines randomly on the board, excluding the cell at
+        (exclude_x, exclude_y).
+
+        Positions are drawn by sample_mine_plane straight into the mapped mine
+        plane, so no list of positions is built however many mines there are. The
+        draws are those of the other engines, so a seed and a first click give the
+        same layout on every engine. The board must not hold mines yet.
+
+        Args:
+            exclude_x (int): The row index of the cell to exclude from mine
+                placement.
+            exclude_y (int): The column index of the cell to exclude from mine
+                placement.
+            safe_zone (str or array-like, optional): Cells kept free of mines around
+                the excluded cell, see safe_zone_indices. Defaults to the board's
+                safe_zone.
+
+        Raises:
+            ValueError: If there are fewer available cells than mines.
+        """
+        excluded = safe_zone_indices(
+            self.rows, self.columns, exclude_x, exclude_y,
+            self.safe_zone if safe_zone is None else safe_zone,
+        )
+        sample_mine_plane(self.mines.reshape(-1), self.total_mines, excluded, self.rng)
+        self._mine_count += self.total_mines
+
+        # Calculate the number of adjacent mines for each cell
+        self._calculate_adjacent_mines()
+        self.mines_placed = True  # Set the flag indicating mines have been placed
+
+    def _calculate_adjacent_mines(self, region=None):
+        """
+        Calculates the number of adjacent mines for the cells of a region, band by band.
+
+        Args:
+            region (tuple, optional): Half-open bounds ``(x0, x1, y0, y1)`` of the cells
+                to recompute, e.g. after mines were moved. Defaults to the whole board.
+        """
+        if region is None:
+            region = (0, self.rows, 0, self.columns)
+        x0, x1, y0, y1 = region
+        for start, stop in self._bands(x0, x1):
+            ArrayBoard._calculate_adjacent_mines(self, (start, stop, y0, y1))
+
+    def is_mine(self, x, y):
+        """
+        Checks whether the cell at (x, y) holds a mine.
+
+        Args:
+            x (int): The row index of the cell.
+            y (int): The column index of the cell.
+
+        Returns:
+            bool: True if the cell holds a mine, False otherwise.
+        """
+        return bool(self.mines[x, y])
+
+    def mine_positions(self):
+        """
+        Lists the positions of all mines in row-major order.
+
+        The mine plane is scanned band by band.
+
+        Returns:
+            list of tuple: The (row, column) of every mine.
+        """
+        columns = self.columns
+        positions = []
+        for start, stop in self._bands():
+            base = start * columns
+            indices = np.flatnonzero(self.mines[start:stop]).tolist()
+            positions.extend(divmod(base + index, columns) for index in indices)
+        return positions
+
+    def is_lost(self):
+        """
+        Checks whether a mine has been revealed, i.e. the game on this board was lost.
+
+        The mine and revealed planes are scanned band by band.
+
+        Returns:
+            bool: True if a mine is revealed, False otherwise.
+        """
+        return any(bool((self.mines[start:stop] & self.revealed[start:stop]).any())
+                   for start, stop in self._bands())
+
+    def reveal_all_mines(self):
+        """
+        Reveals all unflagged mines on the board, band by band.
+
+        Returns:
+            list of int: The sorted linear indices of the mines revealed by this call;
+            flagged and already revealed mines are left out.
+        """
+        columns = self.columns
+        newly = []
+        for start, stop in self._bands():
+            band = (self.mines[start:stop] & ~self.revealed[start:stop]
+                    & ~self.flagged[start:stop])
+            self.revealed[start:stop] |= band
+            newly.extend((np.flatnonzero(band) + start * columns).tolist())
+        return newly
@@ -0,0 +1,216 @@
+# no_guess.py
+
+import multiprocessing  # Event telling the workers to stop
+import os  # Import os to count the available CPU cores
+import time  # Import time to bound and measure the search
+from concurrent.futures import (  # Parallel attempts
+    FIRST_COMPLETED, ProcessPoolExecutor, wait,
+)
+from mem679_minesweeper.game import Game  # Import the Game class used to test layouts
+from mem679_minesweeper.placement import new_seed, resolve_rng  # Seeds for the attempts
+from mem679_minesweeper.simulation import game_seed  # Derives one seed per attempt
+from mem679_minesweeper.solver import Solver  # Logic-only solver that vets layouts
+
+# Set inside the worker processes once the search is over
+_stop = None
+
+
+class NoGuessResult:
+    """
+    Outcome of a search for a board that can be solved without guessing.
+
+    Attributes:
+        seed (int): Seed whose layout, for the given first click and safe zone, can
+            be cleared by logic alone.
+        attempts (int): Number of layouts up to and including the winning one, the
+            same whatever the number of workers. Parallel searches may have tried
+            a few more layouts past it.
+        seconds (float): Wall-clock time of the search.
+    """
+
+    def __init__(self, seed, attempts, seconds):
+        """
+        Initializes the result.
+
+        Args:
+            seed (int): The winning seed.
+            attempts (int): Number of layouts tried.
+            seconds (float): Wall-clock time of the search.
+        """
+        self.seed = seed
+        self.attempts = attempts
+        self.seconds = seconds
+
+
+def is_solvable(rows, columns, mines, first_click, seed, safe_zone='3x3'):
+    """
+    Checks whether the layout for a seed can be cleared by the logic-only solver.
+
+    Args:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        first_click (tuple): The (row, column) of the first click.
+        seed (int): Seed of the layout.
+        safe_zone (str or array-like): Safe zone around the first click.
+
+    Returns:
+        bool: True if the solver wins from the first click without guessing.
+    """
+    game = Game(rows, columns, mines, safe_zone=safe_zone, seed=seed)
+    game.reveal_cell(*first_click)
+    return Solver(game).solve()
+
+
+def _init_worker(stop):
+    """
+    Stores the stop event in a worker process.
+
+    Args:
+        stop (multiprocessing.Event): Set when the search is over.
+    """
+    global _stop
+    _stop = stop
+
+
+def _search(rows, columns, mines, first_click, safe_zone, base_seed, start, stop):
+    """
+    Tries the attempts with indices in ``[start, stop)``; runs inside a worker.
+
+    Args:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        first_click (tuple): The (row, column) of the first click.
+        safe_zone (str or array-like): Safe zone around the first click.
+        base_seed (int): Seed the attempt seeds are derived from.
+        start (int): Index of the first attempt.
+        stop (int): Index after the last attempt.
+
+    Returns:
+        tuple: ``(seed, attempts)`` with seed the first solvable seed found, or None,
+        and attempts the number of layouts tried. The batch gives up early once
+        the search is over.
+    """
+    for index in range(start, stop):
+        if _stop is not None and _stop.is_set():
+            return None, index - start
+        seed = game_seed(base_seed, index)
+        if is_solvable(rows, columns, mines, first_click, seed, safe_zone):
+            return seed, index - start + 1
+    return None, stop - start
+
+
+def generate_no_guess(rows, columns, mines, first_click, safe_zone='3x3', seed=None,
+                      workers=None, batch_size=8, max_attempts=10000, timeout=None):
+    """
+    Searches for a layout that can be cleared from the first click by logic alone.
+
+    Candidate layouts are drawn from seeds derived from a base seed, tested with
+    the Solver, and retried until one is solved. Batches of attempts run in parallel
+    on a ProcessPoolExecutor. A success is accepted once every batch before it has
+    finished, so the lowest solvable attempt wins, exactly as in the serial search:
+    a base seed gives the same layout whatever the number of workers. Batches still
+    running then stop after their current attempt. With workers=1 the search runs
+    in the calling process.
+
+    Args:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        first_click (tuple): The (row, column) of the first click.
+        safe_zone (str or array-like): Safe zone around the first click. A '3x3'
+            zone makes solvable layouts much more common.
+        seed (int, optional): Base seed of the search. A fresh one is drawn if omitted.
+        workers (int, optional): Number of worker processes, defaults to the number of
+            CPU cores.
+        batch_size (int): Attempts per task handed to a worker.
+        max_attempts (int): Upper bound on the number of layouts tried.
+        timeout (float, optional): Upper bound on the search time in seconds.
+
+    Returns:
+        NoGuessResult: The winning seed with the search statistics.
+
+    Raises:
+        TimeoutError: If no solvable layout was found within the bounds.
+    """
+    if seed is None:
+        seed = new_seed()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    started = time.perf_counter()
+    deadline = None if timeout is None else started + timeout
+    args = (rows, columns, mines, tuple(first_click), safe_zone, seed)
+
+    if workers == 1:
+        attempts = 0
+        for start in range(0, max_attempts, batch_size):
+            found, tried = _search(*args, start, min(start + batch_size, max_attempts))
+            attempts += tried
+            if found is not None:
+                return NoGuessResult(found, attempts, time.perf_counter() - started)
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        raise TimeoutError(f"No solvable layout found in {attempts} attempts")
+
+    stop = multiprocessing.Event()
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(stop,))
+    try:
+        attempts = 0
+        next_start = 0
+        running = {}  # Start index of every batch in flight
+        found = {}  # Seed and attempts of every batch that succeeded
+        while True:
+            best = min(found, default=max_attempts)
+            # Keep every worker busy with a small queue of batches before any success
+            while len(running) < 2 * workers and next_start < best:
+                end = min(next_start + batch_size, max_attempts)
+                running[executor.submit(_search, *args, next_start, end)] = next_start
+                next_start = end
+            if found and all(start > best for start in running.values()):
+                seed, tried = found[best]
+                return NoGuessResult(seed, best + tried, time.perf_counter() - started)
+            if not running:
+                break
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.perf_counter(), 0)
+            done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                break  # Out of time
+            for future in done:
+                start = running.pop(future)
+                seed, tried = future.result()
+                attempts += tried
+                if seed is not None:
+                    found[start] = seed, tried
+        raise TimeoutError(f"No solvable layout found in {attempts} attempts")
+    finally:
+        stop.set()  # Batches still running give up after their current attempt
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def place_no_guess_mines(board, x, y, **options):
+    """
+    Places a layout on the board that can be cleared from (x, y) by logic alone.
+
+    The winning seed is recorded as the board's seed, so the layout can be
+    reproduced like any other.
+
+    Args:
+        board (Board or ArrayBoard): The board to place mines on.
+        x (int): The row index of the first click.
+        y (int): The column index of the first click.
+        **options: Further arguments for generate_no_guess, e.g. workers or timeout.
+
+    Returns:
+        NoGuessResult: The search statistics.
+    """
+    result = generate_no_guess(
+        board.rows, board.columns, board.total_mines, (x, y),
+        safe_zone=board.safe_zone, seed=board.seed, **options
+    )
+    board.seed, board.rng = resolve_rng(result.seed)
+    board.place_mines(x, y)
+    return result
@@ -0,0 +1,288 @@
+# persistence.py
+
+import struct  # Fixed-size header of the save format
+import numpy as np  # Bit-packs the state planes
+from mem679_minesweeper.array_board import ArrayBoard  # Default engine of loaded games
+from mem679_minesweeper.adjacency import count_adjacent_mines  # Counts are rebuilt
+from mem679_minesweeper.changes import LOST, PLAYING, WON  # Game statuses
+from mem679_minesweeper.game import ENGINES, Game
+
+# Save format. A file is the header followed by the mine, revealed and flagged
+# planes, each stored as a byte length and a payload. A plane is either a bit set
+# of rows * columns bits (numpy.packbits order) or, when that is smaller, the
+# sorted uint32 linear indices of its set cells. Numbers are little-endian
+MAGIC = b'MSWP'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBBBIIIqd')
+PLANE_LENGTH = struct.Struct('<I')
+
+# Bits of the header's flags byte
+HAS_SEED = 0x01
+MINES_PLACED = 0x02
+FIRST_CLICK = 0x04
+NO_GUESS = 0x08
+PREPARED = 0x10
+
+# Plane encodings, two bits per plane in the header's encodings byte
+BITSET = 0
+INDICES = 1
+
+# Codes of the game status and of the named safe zones; custom safe-zone masks
+# are not stored and load as 'cell'
+STATUS_CODES = {PLAYING: 0, WON: 1, LOST: 2}
+SAFE_ZONE_CODES = {'cell': 0, '3x3': 1}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+SAFE_ZONE_NAMES = {code: name for name, code in SAFE_ZONE_CODES.items()}
+
+
+def _header_seed(seed):
+    """
+    Returns the seed to store in a signed 64-bit header field.
+
+    Seeds that do not fit the header are dropped; the layout itself is stored.
+
+    Args:
+        seed (int or None): The board's seed.
+
+    Returns:
+        int or None: The seed, or None if there is none or it does not fit.
+    """
+    if seed is not None and -2 ** 63 <= seed < 2 ** 63:
+        return seed
+    return None
+
+
+def _safe_zone_code(safe_zone):
+    """
+    Returns the header code of a safe zone; custom masks are stored as 'cell'.
+
+    Args:
+        safe_zone (str or array-like): The board's safe zone.
+
+    Returns:
+        int: The code, see SAFE_ZONE_CODES.
+    """
+    if isinstance(safe_zone, str):
+        return SAFE_ZONE_CODES.get(safe_zone, 0)
+    return 0
+
+
+def board_planes(board):
+    """
+    Returns the mine, revealed and flagged planes of a board of any engine.
+
+    Every engine keeps these planes up to date as the game is played, so save
+    files and the probability engine read them without gathering the cells.
+
+    Args:
+        board (Board or ArrayBoard): The board.
+
+    Returns:
+        tuple of numpy.ndarray: Boolean arrays of shape ``(rows, columns)``,
+        returned as they are, not copied.
+    """
+    return board.mines, board.revealed, board.flagged
+
+
+def _encode_plane(plane):
+    """
+    Encodes a plane in whichever of the two encodings is smaller.
+
+    Args:
+        plane (numpy.ndarray): Boolean plane.
+
+    Returns:
+        tuple: ``(encoding, payload)`` with the encoding code and the bytes.
+    """
+    flat = plane.reshape(-1)
+    count = int(np.count_nonzero(flat))
+    if 4 * count < (flat.size + 7) // 8:
+        return INDICES, np.flatnonzero(flat).astype('<u4').tobytes()
+    return BITSET, np.packbits(flat).tobytes()
+
+
+def _decode_plane(encoding, payload, cells):
+    """
+    Decodes a plane written by _encode_plane.
+
+    Args:
+        encoding (int): The encoding code.
+        payload (bytes or memoryview): The encoded plane.
+        cells (int): Number of cells in the board.
+
+    Returns:
+        numpy.ndarray: The flat boolean plane.
+
+    Raises:
+        ValueError: If the encoding is unknown or the payload has the wrong size.
+    """
+    if encoding == BITSET:
+        if len(payload) != (cells + 7) // 8:
+            raise ValueError('Corrupt save file: bit set of the wrong size')
+        bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8), count=cells)
+        return bits.view(bool)
+    if encoding == INDICES:
+        indices = np.frombuffer(payload, dtype='<u4')
+        if len(indices) and indices.max() >= cells:
+            raise ValueError('Corrupt save file: cell index out of range')
+        plane = np.zeros(cells, dtype=bool)
+        plane[indices] = True
+        return plane
+    raise ValueError(f'Corrupt save file: unknown plane encoding {encoding}')
+
+
+def dumps(game):
+    """
+    Serializes a game, finished or in progress, into the compact save format.
+
+    The state takes about two bits per cell: a 1000x1000 board fits in about
+    250 KB. Adjacency counts are not stored; they follow from the mines.
+
+    Args:
+        game (Game): The game to save.
+
+    Returns:
+        bytes: The save data.
+    """
+    board = game.board
+    seed = _header_seed(board.seed)
+    flags = (
+        (HAS_SEED if seed is not None else 0)
+        | (MINES_PLACED if board.mines_placed else 0)
+        | (FIRST_CLICK if game.first_click else 0)
+        | (NO_GUESS if game.no_guess else 0)
+        | (PREPARED if game.prepared else 0)
+    )
+    encodings = 0
+    payloads = []
+    for position, plane in enumerate(board_planes(board)):
+        encoding, payload = _encode_plane(plane)
+        encodings |= encoding << (2 * position)
+        payloads.append(PLANE_LENGTH.pack(len(payload)))
+        payloads.append(payload)
+    header = HEADER.pack(
+        MAGIC, VERSION, flags, STATUS_CODES[game.status],
+        _safe_zone_code(board.safe_zone), encodings,
+        board.rows, board.columns, board.total_mines,
+        0 if seed is None else seed, game.elapsed_time,
+    )
+    return b''.join([header] + payloads)
+
+
+def _restore_board(board, mines, revealed, flagged):
+    """
+    Writes decoded planes into a new board and brings its counters up to date.
+
+    Args:
+        board (Board or ArrayBoard): An empty board of the right size.
+        mines (numpy.ndarray): Flat mine plane.
+        revealed (numpy.ndarray): Flat revealed plane.
+        flagged (numpy.ndarray): Flat flagged plane.
+    """
+    shape = (board.rows, board.columns)
+    if isinstance(board, ArrayBoard):
+        # Adopt the planes and rebuild the counters in a few vectorized passes
+        board.mines = mines.reshape(shape)
+        board.revealed = revealed.reshape(shape)
+        board.flagged = flagged.reshape(shape)
+        board.mine_indices = np.flatnonzero(mines)
+        board.revealed_safe = int(np.count_nonzero(revealed & ~mines))
+        board.flags_placed = int(np.count_nonzero(flagged))
+        if board.flags_placed:
+            board.flagged_neighbors = count_adjacent_mines(board.flagged)
+        board._calculate_adjacent_mines()
+        return
+    columns = board.columns
+    for index in np.flatnonzero(mines).tolist():
+        board.grid[index // columns][index % columns].set_mine()
+    board._calculate_adjacent_mines()
+    board.set_revealed(np.flatnonzero(revealed).tolist(), True)
+    for index in np.flatnonzero(flagged).tolist():
+        board.toggle_flag(index // columns, index % columns)
+
+
+def loads(data, engine='array'):
+    """
+    Restores a game from data written by dumps.
+
+    With the default array engine the planes are unpacked straight into the
+    board's NumPy arrays, and Cell-style views are only created when the grid is
+    accessed.
+
+    Args:
+        data (bytes or memoryview): The save data.
+        engine (str): Name of the board engine to load into, see ENGINES.
+
+    Returns:
+        Game: The restored game, ready to continue.
+
+    Raises:
+        ValueError: If the data is not a save file, has an unsupported version or is
+            corrupt, or if the engine name is unknown.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown board engine: {engine!r}")
+    data = memoryview(data)
+    if len(data) < HEADER.size:
+        raise ValueError('Not a Minesweeper save file')
+    (magic, version, flags, status, safe_zone, encodings, rows, columns, mines,
+     seed, elapsed_time) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Not a Minesweeper save file')
+    if version != VERSION:
+        raise ValueError(f'Unsupported save file version: {version}')
+    if safe_zone not in SAFE_ZONE_NAMES:
+        raise ValueError(f'Corrupt save file: unknown safe zone {safe_zone}')
+    cells = rows * columns
+    planes = []
+    offset = HEADER.size
+    for position in range(3):
+        if offset + PLANE_LENGTH.size > len(data):
+            raise ValueError('Corrupt save file: truncated')
+        (length,) = PLANE_LENGTH.unpack_from(data, offset)
+        offset += PLANE_LENGTH.size
+        if offset + length > len(data):
+            raise ValueError('Corrupt save file: truncated')
+        encoding = (encodings >> (2 * position)) & 0x03
+        planes.append(_decode_plane(encoding, data[offset:offset + length], cells))
+        offset += length
+
+    board = ENGINES[engine](rows, columns, mines, safe_zone=SAFE_ZONE_NAMES[safe_zone],
+                            seed=seed if flags & HAS_SEED else None)
+    _restore_board(board, *planes)
+    board.mines_placed = bool(flags & MINES_PLACED)
+
+    game = Game(board=board, no_guess=bool(flags & NO_GUESS))
+    game.first_click = bool(flags & FIRST_CLICK)
+    game.prepared = bool(flags & PREPARED)
+    game.game_over = status != STATUS_CODES[PLAYING]
+    game.win = status == STATUS_CODES[WON]
+    game.elapsed_time = elapsed_time
+    return game
+
+
+def save_game(game, path):
+    """
+    Saves a game to a file, see dumps.
+
+    Args:
+        game (Game): The game to save.
+        path (str or os.PathLike): The file to write.
+    """
+    with open(path, 'wb') as file:
+        file.write(dumps(game))
+
+
+def load_game(path, engine='array'):
+    """
+    Loads a game saved by save_game, see loads.
+
+    Args:
+        path (str or os.PathLike): The file to read.
+        engine (str): Name of the board engine to load into, see ENGINES.
+
+    Returns:
+        Game: The restored game.
+    """
+    with open(path, 'rb') as file:
+        return loads(file.read(), engine)
@@ -0,0 +1,244 @@
+# placement.py
+
+import random  # Import the random module for the default source of randomness
+from bisect import bisect_right  # Binary search over the excluded cells
+import numpy as np  # NumPy reads custom safe-zone masks and provides fast generators
+
+
+class NumpyRandom:
+    """
+    Adapts a NumPy Generator to the ``randrange`` interface used for mine placement.
+
+    Any bit generator can be used, including counter-based ones such as Philox, e.g.
+    ``NumpyRandom(numpy.random.Generator(numpy.random.Philox(seed)))``.
+
+    Attributes:
+        generator (numpy.random.Generator): The wrapped generator.
+    """
+
+    def __init__(self, generator):
+        """
+        Initializes the adapter.
+
+        Args:
+            generator (numpy.random.Generator): The generator to draw from.
+        """
+        self.generator = generator
+
+    def randrange(self, stop):
+        """
+        Draws an integer in ``[0, stop)``.
+
+        Args:
+            stop (int): The exclusive upper bound.
+
+        Returns:
+            int: The drawn integer.
+        """
+        return int(self.generator.integers(stop))
+
+
+def new_seed():
+    """
+    Draws a fresh seed from the operating system's entropy source.
+
+    Returns:
+        int: A 63-bit seed.
+    """
+    return random.SystemRandom().getrandbits(63)
+
+
+def resolve_rng(seed=None, rng=None):
+    """
+    Works out the seed and the source of randomness for a board.
+
+    An explicit RNG object wins over a seed. Without either, a fresh seed is drawn
+    so that every board can be reproduced from its recorded seed.
+
+    Args:
+        seed (int, optional): Seed for a ``random.Random`` generator.
+        rng (optional): A ``random.Random``, a ``numpy.random.Generator`` or any
+            object with a ``randrange`` method.
+
+    Returns:
+        tuple: ``(seed, rng)`` where seed is None when an RNG object was given and
+        rng provides ``randrange``.
+    """
+    if rng is not None:
+        if isinstance(rng, np.random.Generator):
+            rng = NumpyRandom(rng)
+        return None, rng
+    if seed is None:
+        seed = new_seed()
+    return seed, random.Random(seed)
+
+
+def safe_zone_indices(rows, columns, x, y, safe_zone='cell'):
+    """
+    Returns the cells that must stay free of mines around the first click.
+
+    Args:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        x (int): The row index of the first click.
+        y (int): The column index of the first click.
+        safe_zone (str or array-like): 'cell' keeps only the clicked cell free,
+            '3x3' also keeps its neighbours free so that the first click always
+            opens an area. A boolean mask of shape ``(rows, columns)`` keeps the
+            cells marked True free in addition to the clicked cell.
+
+    Returns:
+        list of int: The sorted linear indices ``x * columns + y`` to exclude.
+
+    Raises:
+        ValueError: If the safe zone is not recognised.
+    """
+    if isinstance(safe_zone, str):
+        if safe_zone == 'cell':
+            return [x * columns + y]
+        if safe_zone == '3x3':
+            return [
+                nx * columns + ny
+                for nx in range(max(x - 1, 0), min(x + 2, rows))
+                for ny in range(max(y - 1, 0), min(y + 2, columns))
+            ]
+        raise ValueError(f"Unknown safe zone: {safe_zone!r}")
+
+    mask = np.asarray(safe_zone, dtype=bool)
+    if mask.shape != (rows, columns):
+        raise ValueError(
+            f"Safe-zone mask has shape {mask.shape}, expected {(rows, columns)}")
+    excluded = set(np.flatnonzero(mask).tolist())
+    excluded.add(x * columns + y)  # The clicked cell is always safe
+    return sorted(excluded)
+
+
+def sample_mine_indices(cells, mines, excluded=(), rng=random):
+    """
+    Draws distinct mine positions without materialising the list of all cells.
+
+    Robert Floyd's sampling algorithm picks ``mines`` distinct ranks among the
+    cells that are not excluded in O(mines) time and memory. Each rank is then
+    mapped to its linear index by skipping the excluded cells with a binary
+    search, so the cost of placement does not depend on the board size.
+
+    Args:
+        cells (int): Number of cells on the board.
+        mines (int): Number of mines to place.
+        excluded (list of int): Sorted linear indices that must not get a mine.
+        rng: Source of randomness providing ``randrange``. Defaults to the
+            random module.
+
+    Returns:
+        list of int: The sorted linear indices of the mines.
+
+    Raises:
+        ValueError: If there are fewer available cells than mines.
+    """
+    available = cells - len(excluded)
+    if not 0 <= mines <= available:
+        raise ValueError(f"Cannot place {mines} mines in {available} available cells")
+
+    # Floyd's algorithm: one random draw per mine, never a duplicate
+    chosen = set()
+    for upper in range(available - mines, available):
+        rank = rng.randrange(upper + 1)
+        chosen.add(upper if rank in chosen else rank)
+
+    # The i-th excluded cell has excluded[i] - i available cells before it, so the
+    # number of those offsets not above a rank is how far the rank must shift
+    offsets = [index - i for i, index in enumerate(excluded)]
+    return sorted(rank + bisect_right(offsets, rank) for rank in chosen)
+
+
+def sample_mine_plane(plane, mines, excluded=(), rng=random):
+    """
+    Draws distinct mine positions straight into a flat boolean plane.
+
+    The draws are exactly those of sample_mine_indices, so the same source of
+    randomness gives the same mines, but Floyd's set of chosen cells is the plane
+    itself. No collection of positions is built, so the memory used does not grow
+    with the number of mines, which suits planes larger than memory such as the
+    memory-mapped ones of MappedBoard.
+
+    Args:
+        plane (numpy.ndarray): Contiguous flat boolean array with one entry per
+            cell and no mine set; the drawn cells are set to True.
+        mines (int): Number of mines to place.
+        excluded (list of int): Sorted linear indices that must not get a mine.
+        rng: Source of randomness providing ``randrange``. Defaults to the
+            random module.
+
+    Raises:
+        ValueError: If there are fewer available cells than mines.
+    """
+    available = len(plane) - len(excluded)
+    if not 0 <= mines <= available:
+        raise ValueError(f"Cannot place {mines} mines in {available} available cells")
+
+    cells = memoryview(plane)  # Item access is much cheaper than on the array
+    offsets = [index - i for i, index in enumerate(excluded)]
+    randrange = rng.randrange
+    for upper in range(available - mines, available):
+        rank = randrange(upper + 1)
+        index = rank + bisect_right(offsets, rank)
+        if cells[index]:
+            # Floyd's algorithm: a rank drawn before is replaced by the new upper end
+            index = upper + bisect_right(offsets, upper)
+        cells[index] = True
+
+
+def relocate_safe_zone(board, x, y, safe_zone=None):
+    """
+    Moves the mines out of the safe zone of a first click on a pre-generated board.
+
+    Each mine inside the zone is moved to a cell drawn uniformly among the cells
+    that hold no mine and lie outside the zone. If the layout was uniform, the
+    result is uniform among the layouts that keep the zone free, exactly as if the
+    mines had been placed after the click. Only the neighbourhoods of the moved
+    mines are recomputed, see move_mine.
+
+    Args:
+        board (Board or ArrayBoard): A board with mines placed.
+        x (int): The row index of the first click.
+        y (int): The column index of the first click.
+        safe_zone (str or array-like, optional): The zone to clear, see
+            safe_zone_indices. Defaults to the board's safe_zone.
+
+    Returns:
+        int: The number of mines moved.
+
+    Raises:
+        ValueError: If there are not enough free cells outside the zone.
+    """
+    columns = board.columns
+    cells = board.rows * columns
+    excluded = safe_zone_indices(
+        board.rows, columns, x, y, board.safe_zone if safe_zone is None else safe_zone
+    )
+    inside = [index for index in excluded if board.is_mine(*divmod(index, columns))]
+    if not inside:
+        return 0
+    # Every mine, including those about to move, needs a cell outside the zone;
+    # checked before any mine moves so that a refusal leaves the board intact
+    if board.mine_count + len(excluded) > cells:
+        raise ValueError(
+            f"Cannot keep {len(excluded)} cells free of {board.mine_count} mines")
+
+    excluded = set(excluded)
+    for index in inside:
+        # Rejection sampling is cheap while free cells are common; dense boards
+        # fall back to drawing from the list of free cells
+        for _ in range(64):
+            target = board.rng.randrange(cells)
+            if target not in excluded and not board.is_mine(*divmod(target, columns)):
+                break
+        else:
+            free = [
+                target for target in range(cells)
+                if target not in excluded
+                and not board.is_mine(*divmod(target, columns))
+            ]
+            target = free[board.rng.randrange(len(free))]
+        board.move_mine(*divmod(index, columns), *divmod(target, columns))
+    return len(inside)
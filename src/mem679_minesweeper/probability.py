@@ -0,0 +1,347 @@
+# probability.py
+
+from functools import lru_cache  # Memoizes component results by constraint signature
+from math import comb  # Binomial coefficients for the unconstrained cells
+import numpy as np  # NumPy gathers the board state and holds the probability map
+from mem679_minesweeper.adjacency import count_adjacent_mines  # Finds the frontier
+from mem679_minesweeper.array_board import ArrayBoard  # Board engine with state planes
+from mem679_minesweeper.persistence import board_planes  # Planes kept by every engine
+
+# Bounds of the exact count of one frontier component. Backtracking is
+# exponential in the component size; larger or harder components are estimated
+MAX_COMPONENT_CELLS = 40  # Components above this size are estimated outright
+MAX_COMPONENT_STEPS = 100000  # Backtracking steps before a component is estimated
+
+
+def _adjacency_plane(board, mines):
+    """
+    Returns the adjacency plane of a board as a NumPy array.
+
+    The cell engine has no adjacency plane; its counts are recomputed from the
+    mine plane in one vectorized pass rather than gathered from the cells.
+
+    Args:
+        board (Board or ArrayBoard): The board to read.
+        mines (numpy.ndarray): The board's boolean mine plane.
+
+    Returns:
+        numpy.ndarray: The number of adjacent mines of every cell, zero on mines.
+    """
+    if isinstance(board, ArrayBoard):
+        return board.adjacent
+    adjacent = count_adjacent_mines(mines)
+    adjacent *= ~mines  # Mine cells do not carry a count
+    return adjacent
+
+
+def _binomial(n, k):
+    """
+    Returns the binomial coefficient, zero when k is outside ``[0, n]``.
+
+    Args:
+        n (int): Size of the set.
+        k (int): Size of the subsets.
+
+    Returns:
+        int: The number of k-subsets of an n-set.
+    """
+    return comb(n, k) if 0 <= k <= n else 0
+
+
+class _TooComplex(Exception):
+    """
+    Raised when counting a component exceeds MAX_COMPONENT_STEPS.
+    """
+
+
+@lru_cache(maxsize=4096)
+def _solve_component(variables, constraints):
+    """
+    Counts the mine configurations of one frontier component.
+
+    Configurations are enumerated by backtracking over the variables, pruning as
+    soon as a constraint can no longer be met. The arguments form the component's
+    constraint signature, which depends only on the shape of the constraints and
+    not on their position, so identical components are solved once. Components
+    larger than MAX_COMPONENT_CELLS, or whose count takes more than
+    MAX_COMPONENT_STEPS steps, are not counted.
+
+    Args:
+        variables (int): Number of covered cells in the component.
+        constraints (tuple): Pairs ``(cells, mines)`` where cells is a tuple of
+            variable indices and mines the number of mines among them.
+
+    Returns:
+        tuple or None: ``(totals, per_cell)`` where totals[m] is the number of
+        configurations with m mines and per_cell[i][m] the number of those in which
+        variable i is a mine, or None if the component is too complex to count.
+    """
+    if variables > MAX_COMPONENT_CELLS:
+        return None
+    # Constraint bookkeeping: per variable the constraints it appears in, per
+    # constraint the mines still needed and the variables still unassigned
+    touching = [[] for _ in range(variables)]
+    needed = []
+    unassigned = []
+    for index, (cells, mines) in enumerate(constraints):
+        for cell in cells:
+            touching[cell].append(index)
+        needed.append(mines)
+        unassigned.append(len(cells))
+
+    totals = [0] * (variables + 1)
+    per_cell = [[0] * (variables + 1) for _ in range(variables)]
+    assignment = [0] * variables
+    steps = 0
+
+    def assign(variable, mines_so_far):
+        nonlocal steps
+        steps += 1
+        if steps > MAX_COMPONENT_STEPS:
+            raise _TooComplex
+        if variable == variables:
+            # Every constraint is met exactly; tally the configuration
+            totals[mines_so_far] += 1
+            for cell in range(variables):
+                if assignment[cell]:
+                    per_cell[cell][mines_so_far] += 1
+            return
+        for value in (0, 1):
+            feasible = True
+            for index in touching[variable]:
+                unassigned[index] -= 1
+                needed[index] -= value
+            for index in touching[variable]:
+                if needed[index] < 0 or needed[index] > unassigned[index]:
+                    feasible = False
+                    break
+            if feasible:
+                assignment[variable] = value
+                assign(variable + 1, mines_so_far + value)
+            for index in touching[variable]:
+                unassigned[index] += 1
+                needed[index] += value
+        assignment[variable] = 0
+
+    try:
+        assign(0, 0)
+    except _TooComplex:
+        return None
+    return tuple(totals), tuple(tuple(counts) for counts in per_cell)
+
+
+def _estimate_component(variables, constraints):
+    """
+    Estimates the mine probabilities of a component too complex to count.
+
+    Each cell gets the average mine density of the constraints it appears in.
+    For the rest of the board the component is taken to hold the rounded sum of
+    these estimates, so it is combined like a counted component with a single
+    mine count.
+
+    Args:
+        variables (int): Number of covered cells in the component.
+        constraints (tuple): Pairs ``(cells, mines)``, see _solve_component.
+
+    Returns:
+        tuple: ``(totals, estimates)`` with totals the single-count distribution and
+        estimates the probability of every variable.
+    """
+    density = [0.0] * variables
+    appearances = [0] * variables
+    for cells, mines in constraints:
+        for cell in cells:
+            density[cell] += mines / len(cells)
+            appearances[cell] += 1
+    estimates = [min(total / count, 1.0) for total, count in zip(density, appearances)]
+    expected = min(round(sum(estimates)), variables)
+    return tuple([0] * expected + [1]), estimates
+
+
+def _components(constraints):
+    """
+    Splits frontier constraints into independent connected components.
+
+    Two constraints belong to the same component when they share a covered cell.
+
+    Args:
+        constraints (list): Pairs ``(cells, mines)`` with cells a tuple of linear
+            indices.
+
+    Returns:
+        list: For each component, its sorted cells and its constraints.
+    """
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]  # Path halving
+            cell = parent[cell]
+        return cell
+
+    for cells, _ in constraints:
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        root = find(cells[0])
+        for cell in cells[1:]:
+            other = find(cell)
+            if other != root:
+                parent[other] = root
+
+    groups = {}
+    for cells, mines in constraints:
+        groups.setdefault(find(cells[0]), []).append((cells, mines))
+    result = []
+    for group in groups.values():
+        cells = sorted({cell for group_cells, _ in group for cell in group_cells})
+        result.append((cells, group))
+    return result
+
+
+def _convolve(left, right):
+    """
+    Convolves two mine-count distributions.
+
+    Args:
+        left (list of int): Configuration counts per number of mines.
+        right (list of int): Configuration counts per number of mines.
+
+    Returns:
+        list of int: Configuration counts of the combination per number of mines.
+    """
+    result = [0] * (len(left) + len(right) - 1)
+    for i, a in enumerate(left):
+        if a:
+            for j, b in enumerate(right):
+                result[i + j] += a * b
+    return result
+
+
+def mine_probabilities(board, trust_flags=False):
+    """
+    Computes the exact probability that each covered cell holds a mine.
+
+    The covered cells next to revealed numbers (the frontier) are split into
+    independent components. The configurations of each component are counted per
+    number of mines, memoized by constraint signature so that components left
+    unchanged by a move are not recounted. The components are then combined with
+    the cells away from the frontier, weighting every split of the remaining mines
+    by the binomial number of ways to place the rest among those cells.
+
+    Components too complex to count exactly, see MAX_COMPONENT_CELLS and
+    MAX_COMPONENT_STEPS, are estimated instead, so their probabilities, and to a
+    lesser degree those of the rest of the board, are approximate.
+
+    Args:
+        board (Board or ArrayBoard): A board with mines placed.
+        trust_flags (bool): Treat flagged cells as known mines. Faster, but only
+            correct when every flag is right; otherwise flags count as covered.
+
+    Returns:
+        numpy.ndarray: Float array of shape ``(rows, columns)`` with the mine
+        probability of every covered cell; revealed cells are NaN and trusted
+        flags 1.0.
+
+    Raises:
+        ValueError: If no layout is consistent with the revealed numbers.
+    """
+    mines, revealed, flagged = board_planes(board)
+    adjacent = _adjacency_plane(board, mines)
+    rows, columns = revealed.shape
+    known_mines = flagged if trust_flags else np.zeros_like(flagged)
+    unknown = ~revealed & ~known_mines
+
+    # Frontier constraints: revealed numbers with covered neighbours
+    constraints = []
+    touches_unknown = count_adjacent_mines(unknown) > 0
+    flags_around = count_adjacent_mines(known_mines)
+    unknown_flat = unknown.reshape(-1)
+    for x, y in zip(*np.nonzero(revealed & touches_unknown & (adjacent > 0))):
+        x, y = int(x), int(y)
+        cells = tuple(
+            nx * columns + ny
+            for nx in range(max(x - 1, 0), min(x + 2, rows))
+            for ny in range(max(y - 1, 0), min(y + 2, columns))
+            if unknown_flat[nx * columns + ny]
+        )
+        constraints.append((cells, int(adjacent[x, y]) - int(flags_around[x, y])))
+
+    # Count configurations per component, keyed by the component's signature
+    solved = []
+    for cells, group in _components(constraints):
+        position = {cell: i for i, cell in enumerate(cells)}
+        signature = tuple(sorted(
+            (tuple(position[cell] for cell in group_cells), mines)
+            for group_cells, mines in group
+        ))
+        counted = _solve_component(len(cells), signature)
+        if counted is None:
+            solved.append((cells, *_estimate_component(len(cells), signature), True))
+        else:
+            solved.append((cells, *counted, False))
+
+    frontier = sum(len(cells) for cells, *_ in solved)
+    interior = int(unknown.sum()) - frontier
+    remaining = board.total_mines - int(known_mines.sum())
+    # Ways to place k mines among the interior cells; the same few k recur often
+    interior_ways = lru_cache(maxsize=None)(lambda k: _binomial(interior, k))
+
+    # Distribution of the mines outside each component, by convolving the others
+    def others(skip):
+        distribution = [1]
+        for index, (_, totals, _, _) in enumerate(solved):
+            if index != skip:
+                distribution = _convolve(distribution, list(totals))
+        return distribution
+
+    everything = others(None)
+    weight = sum(count * interior_ways(remaining - m)
+                 for m, count in enumerate(everything))
+    if weight == 0:
+        raise ValueError("No mine layout is consistent with the board")
+
+    result = np.full((rows, columns), np.nan)
+    result[known_mines] = 1.0
+    flat = result.reshape(-1)
+    for index, (cells, totals, per_cell, estimated) in enumerate(solved):
+        if estimated:
+            flat[list(cells)] = per_cell  # The estimated probabilities
+            continue
+        rest = others(index)
+        # Weight of each mine count of this component given the rest of the board
+        factor = [
+            sum(count * interior_ways(remaining - m - s)
+                for s, count in enumerate(rest))
+            for m in range(len(totals))
+        ]
+        for cell, counts in zip(cells, per_cell):
+            flat[cell] = sum(c * f for c, f in zip(counts, factor)) / weight
+
+    if interior:
+        expected = sum(
+            count * interior_ways(remaining - m) * (remaining - m)
+            for m, count in enumerate(everything)
+        )
+        frontier_cells = np.zeros(rows * columns, dtype=bool)
+        for cells, *_ in solved:
+            frontier_cells[list(cells)] = True
+        flat[unknown_flat & ~frontier_cells] = expected / (interior * weight)
+    return result
+
+
+def safest_cell(board, trust_flags=False):
+    """
+    Returns the covered, unflagged cell least likely to hold a mine.
+
+    Args:
+        board (Board or ArrayBoard): A board with mines placed.
+        trust_flags (bool): Treat flagged cells as known mines, see mine_probabilities.
+
+    Returns:
+        tuple: The (row, column) of the safest cell.
+    """
+    probabilities = mine_probabilities(board, trust_flags)
+    # Never pick revealed or flagged cells
+    probabilities[board.revealed | board.flagged] = np.inf
+    x, y = np.unravel_index(np.argmin(probabilities), probabilities.shape)
+    return int(x), int(y)
@@ -0,0 +1,744 @@
+# replay.py
+
+import argparse  # Command-line interface of the verifier
+import os  # Number of CPU cores for the verifier's workers
+import struct  # Fixed-size header and trailer of a replay
+import sys  # Exit status for the command line
+import time  # Timestamps of the recorded moves
+from collections import deque  # Verifications in flight, in archive order
+from concurrent.futures import ProcessPoolExecutor  # Verifies replays in parallel
+import numpy as np  # Decodes the move records in bulk
+from mem679_minesweeper.changes import PLAYING  # Status of unverifiable replays
+from mem679_minesweeper.factory import lay_out  # Lays out prepared boards again
+from mem679_minesweeper.game import ENGINES, Game
+from mem679_minesweeper.history import History  # Replays undo and redo
+from mem679_minesweeper.persistence import (  # Keyframes are saved games
+    SAFE_ZONE_CODES, SAFE_ZONE_NAMES, STATUS_CODES, STATUS_NAMES, _header_seed, dumps,
+    loads,
+)
+
+# Replay format. A replay is a header, one 8-byte record per move and an end
+# record followed by a trailer; an archive is any number of replays one after the
+# other. A record holds ``index << 3 | action`` and the milliseconds since the
+# recording started, as two little-endian uint32. Since version 2 the moves are
+# interleaved with keyframes, a record holding ``length << 3 | KEYFRAME``
+# followed by a game saved with persistence.dumps, and the trailer is followed by
+# the keyframe index and a footer holding the keyframe count and the size of the
+# whole replay, so the start of the last replay of a file can be found from its end
+MAGIC = b'MSWR'
+VERSION = 2
+VERSIONS = (1, 2)  # Versions that can be read; version 1 has no keyframes
+HEADER = struct.Struct('<4sHBBIIIq')
+RECORD = np.dtype([('move', '<u4'), ('time', '<u4')])
+TRAILER = struct.Struct('<BxxxI')
+# Keyframe index entry: moves before the keyframe and its offset from the header
+INDEX_ENTRY = np.dtype([('move', '<u8'), ('offset', '<u8')])
+FOOTER = struct.Struct('<4sIQ')
+FOOTER_MAGIC = b'MSWI'
+
+# Action codes of the records; KEYFRAME precedes a saved game and END marks the
+# end of the moves of a replay
+ACTIONS = ('reveal', 'flag', 'chord', 'undo', 'redo')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+KEYFRAME = 6
+END = 7
+
+# Largest board that can be recorded: a record has 29 bits for the cell index or
+# the keyframe length, and a keyframe of such a board stays below 2**29 bytes
+MAX_CELLS = 1 << 29
+
+# Bits of the header's flags byte
+PREPARED = 0x01  # The board was laid out in advance, see lay_out
+
+
+class ReplayRecorder:
+    """
+    Records the moves of a game into a replay stream as they are made.
+
+    The recorder subscribes to the game's change sets, so every move that changes
+    the board is recorded, including undo and redo. Records are buffered and
+    written in blocks; close ends the replay. Several replays can be written one
+    after the other to the same file to build an archive.
+
+    Every keyframe_interval moves the whole game is saved as a keyframe, so a
+    ReplaySeeker can jump to any move by loading the nearest keyframe and
+    replaying at most keyframe_interval moves. A keyframe of a 1000x1000 board
+    takes about 250 KB and is written in about a millisecond on the array engine.
+
+    Only games whose layout can be derived again from the header are recorded:
+    the board must be seeded, use a named safe zone and one of the ENGINES, and
+    the game must not be a no-guess game. Boards are limited to MAX_CELLS cells.
+
+    Attributes:
+        game (Game): The recorded game.
+        file: The binary file the replay is written to.
+        moves (int): Number of moves recorded.
+        keyframe_interval (int): Moves between keyframes, 0 for no keyframes.
+    """
+
+    BUFFER_MOVES = 4096  # Records kept before they are written to the file
+
+    def __init__(self, game, file, clock=time.monotonic, keyframe_interval=1000):
+        """
+        Writes the replay header and starts recording.
+
+        Args:
+            game (Game): The game to record, before its first move.
+            file: A binary file opened for writing.
+            clock (callable): Returns the current time in seconds.
+            keyframe_interval (int): Moves between keyframes, 0 for no keyframes.
+
+        Raises:
+            ValueError: If the game has already started, its board has more than
+                MAX_CELLS cells or its layout cannot be derived from the header.
+        """
+        board = game.board
+        if board.rows * board.columns > MAX_CELLS:
+            raise ValueError(f'Replays are limited to boards of {MAX_CELLS} cells')
+        if not game.first_click or board.revealed_safe:
+            raise ValueError('Replays must be recorded from the first move')
+        if _header_seed(board.seed) is None:
+            raise ValueError('Replays need a board seeded with a 64-bit seed')
+        if type(board) not in ENGINES.values() or game.no_guess:
+            raise ValueError('The layout of this game cannot be replayed from its seed')
+        zone = board.safe_zone
+        if not isinstance(zone, str) or zone not in SAFE_ZONE_CODES:
+            raise ValueError('Replays need a named safe zone')
+        self.game = game
+        self.file = file
+        self.moves = 0
+        self.keyframe_interval = keyframe_interval
+        self._clock = clock
+        self._start = clock()
+        self._buffer = bytearray()
+        self._size = HEADER.size  # Bytes of the replay written or buffered
+        self._index = []  # (moves, offset) of every keyframe
+        file.write(HEADER.pack(
+            MAGIC, VERSION, PREPARED if game.prepared else 0, SAFE_ZONE_CODES[zone],
+            board.rows, board.columns, board.total_mines, board.seed,
+        ))
+        game.subscribe(self.record)
+
+    def _elapsed_ms(self):
+        """
+        Returns the milliseconds since the recording started.
+
+        Returns:
+            int: The elapsed time.
+        """
+        return int((self._clock() - self._start) * 1000)
+
+    def record(self, change):
+        """
+        Records a move; subscribed to the game.
+
+        Args:
+            change (ChangeSet): The changes made by the move.
+        """
+        index = change.x * self.game.board.columns + change.y
+        self._write(struct.pack('<II', index << 3 | ACTION_CODES[change.action],
+                                self._elapsed_ms()))
+        self.moves += 1
+        if self.keyframe_interval and self.moves % self.keyframe_interval == 0:
+            self._keyframe()
+        if len(self._buffer) >= self.BUFFER_MOVES * RECORD.itemsize:
+            self.flush()
+
+    def _write(self, data):
+        """
+        Appends bytes to the buffered part of the replay.
+
+        Args:
+            data (bytes): The bytes to append.
+        """
+        self._buffer += data
+        self._size += len(data)
+
+    def _keyframe(self):
+        """
+        Saves the game as it is after the last recorded move, and indexes it.
+        """
+        state = dumps(self.game)
+        self._index.append((self.moves, self._size))
+        self._write(struct.pack('<II', len(state) << 3 | KEYFRAME, self._elapsed_ms()))
+        self._write(state)
+
+    def flush(self):
+        """
+        Writes the buffered records to the file.
+        """
+        self.file.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        """
+        Ends the replay and stops recording.
+
+        The end record is followed by the trailer, the keyframe index and the
+        footer. The file itself is left open.
+        """
+        self.game.unsubscribe(self.record)
+        self._write(struct.pack('<II', END, self._elapsed_ms()))
+        self._write(TRAILER.pack(STATUS_CODES[self.game.status], self.moves))
+        self._write(np.array(self._index, dtype=INDEX_ENTRY).tobytes())
+        size = self._size + FOOTER.size
+        self._write(FOOTER.pack(FOOTER_MAGIC, len(self._index), size))
+        self.flush()
+
+
+class Replay:
+    """
+    One recorded game, as read from a replay stream.
+
+    Attributes:
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed of the board.
+        safe_zone (str): Safe zone around the first click.
+        prepared (bool): Indicates if the board was laid out before the first click.
+        records (numpy.ndarray): The move records, see RECORD.
+        elapsed_ms (int): Milliseconds from the start of the recording to its end.
+        status (str): The game status claimed at the end of the recording.
+        claimed_moves (int): The number of moves claimed by the trailer.
+        keyframes (numpy.ndarray): The keyframe index, see INDEX_ENTRY.
+        offset (int or None): Position of the replay in its file, None if the
+            stream could not tell.
+    """
+
+    def __init__(self, header, records, elapsed_ms, status, claimed_moves,
+                 keyframes=None, offset=None):
+        """
+        Initializes the replay.
+
+        Args:
+            header (tuple): The unpacked HEADER fields.
+            records (numpy.ndarray): The move records.
+            elapsed_ms (int): Time of the end record.
+            status (int): Status code of the trailer.
+            claimed_moves (int): Move count of the trailer.
+            keyframes (numpy.ndarray, optional): The keyframe index.
+            offset (int, optional): Position of the replay in its file.
+
+        Raises:
+            ValueError: If the header is not a supported replay header.
+        """
+        magic, version, flags, safe_zone, rows, columns, mines, seed = header
+        if magic != MAGIC:
+            raise ValueError('Not a Minesweeper replay')
+        if version not in VERSIONS:
+            raise ValueError(f'Unsupported replay version: {version}')
+        self.rows = rows
+        self.columns = columns
+        self.mines = mines
+        self.seed = seed
+        self.safe_zone = SAFE_ZONE_NAMES.get(safe_zone)
+        self.prepared = bool(flags & PREPARED)
+        self.records = records
+        self.elapsed_ms = elapsed_ms
+        self.status = STATUS_NAMES.get(status)
+        self.claimed_moves = claimed_moves
+        if keyframes is None:
+            keyframes = np.zeros(0, dtype=INDEX_ENTRY)
+        self.keyframes = keyframes
+        self.offset = offset
+
+    def __len__(self):
+        return len(self.records)
+
+    def moves(self):
+        """
+        Decodes the move records.
+
+        Returns:
+            list of tuple: ``(action, x, y, milliseconds)`` for every move.
+        """
+        moves = self.records['move']
+        return [
+            (ACTIONS[code], *divmod(index, self.columns), ms)
+            for code, index, ms in zip((moves & 7).tolist(), (moves >> 3).tolist(),
+                                       self.records['time'].tolist())
+        ]
+
+    def new_game(self, engine='cell'):
+        """
+        Creates the game as it was before the first recorded move.
+
+        Args:
+            engine (str): Name of the board engine, see ENGINES. Every engine gives
+                the same layout for the same seed.
+
+        Returns:
+            Game: The game, ready to replay.
+        """
+        board = ENGINES[engine](self.rows, self.columns, self.mines,
+                                safe_zone=self.safe_zone, seed=self.seed)
+        if self.prepared:
+            lay_out(board)
+        return Game(board=board)
+
+
+def read_replays(file, chunk_size=1 << 20):
+    """
+    Reads the replays of a stream one at a time.
+
+    The stream is read in chunks, so archives of any size can be processed while
+    only the replay being yielded is held in memory. Keyframes are skipped, and
+    checked against the keyframe index; a ReplaySeeker loads them when needed.
+
+    Args:
+        file: A binary file opened for reading.
+        chunk_size (int): Number of bytes read at a time.
+
+    Yields:
+        Replay: The replays, in the order they were written.
+
+    Raises:
+        ValueError: If the stream is not a replay archive, is truncated or has a
+            corrupt keyframe index.
+    """
+    origin = file.tell() if file.seekable() else None
+    buffer = bytearray()
+    position = 0
+    dropped = 0  # Bytes of the stream dropped from the buffer
+
+    def fill(size):
+        # Make at least size unread bytes available, False at the end of the file
+        nonlocal buffer, position, dropped
+        while len(buffer) - position < size:
+            data = file.read(chunk_size)
+            if not data:
+                return False
+            del buffer[:position]
+            dropped += position
+            position = 0
+            buffer += data
+        return True
+
+    while fill(HEADER.size):
+        start = dropped + position
+        header = HEADER.unpack_from(buffer, position)
+        if header[0] != MAGIC:
+            raise ValueError('Not a Minesweeper replay')
+        if header[1] not in VERSIONS:
+            raise ValueError(f'Unsupported replay version: {header[1]}')
+        stops = (KEYFRAME, END) if header[1] >= 2 else (END,)
+        position += HEADER.size
+        parts = []
+        moves = 0
+        keyframes = []
+        while True:
+            if not fill(RECORD.itemsize):
+                raise ValueError('Truncated replay')
+            usable = (len(buffer) - position) // RECORD.itemsize
+            # A view, copied only up to the next keyframe, so that keyframes cost
+            # no extra copies
+            records = np.frombuffer(buffer, dtype=RECORD, count=usable, offset=position)
+            found = np.flatnonzero(np.isin(records['move'] & 7, stops))
+            stop = int(found[0]) if len(found) else usable
+            parts.append(records[:stop].copy())
+            moves += stop
+            position += stop * RECORD.itemsize
+            if not len(found):
+                del records  # Release the buffer so that fill can resize it
+                continue
+            move, elapsed_ms = (int(value) for value in records[stop].tolist())
+            del records
+            if move & 7 == END:
+                position += RECORD.itemsize
+                break
+            # Skip the keyframe, remembering where it is
+            keyframes.append((moves, dropped + position - start))
+            length = RECORD.itemsize + (move >> 3)
+            if not fill(length):
+                raise ValueError('Truncated replay')
+            position += length
+        if not fill(TRAILER.size):
+            raise ValueError('Truncated replay')
+        status, claimed_moves = TRAILER.unpack_from(buffer, position)
+        position += TRAILER.size
+        index = np.array(keyframes, dtype=INDEX_ENTRY)
+        if header[1] >= 2:
+            size = len(keyframes) * INDEX_ENTRY.itemsize
+            if not fill(size + FOOTER.size):
+                raise ValueError('Truncated replay')
+            stored = np.frombuffer(bytes(buffer[position:position + size]),
+                                   dtype=INDEX_ENTRY)
+            magic, count, length = FOOTER.unpack_from(buffer, position + size)
+            position += size + FOOTER.size
+            if (magic != FOOTER_MAGIC or count != len(keyframes)
+                    or length != dropped + position - start
+                    or not np.array_equal(stored, index)):
+                raise ValueError('Corrupt replay keyframe index')
+        yield Replay(header, np.concatenate(parts), elapsed_ms, status, claimed_moves,
+                     index, None if origin is None else origin + start)
+    if len(buffer) > position:
+        raise ValueError('Truncated replay')
+
+
+def open_replay(file):
+    """
+    Reads the last replay of a seekable file, located from its footer.
+
+    Replays appended to a large archive can be opened without reading the ones
+    before them.
+
+    Args:
+        file: A seekable binary file opened for reading.
+
+    Returns:
+        Replay: The last replay of the file.
+
+    Raises:
+        ValueError: If the file does not end with a replay of version 2 or later.
+    """
+    end = file.seek(0, os.SEEK_END)
+    if end < FOOTER.size:
+        raise ValueError('Not a Minesweeper replay')
+    file.seek(end - FOOTER.size)
+    magic, _, size = FOOTER.unpack(file.read(FOOTER.size))
+    if magic != FOOTER_MAGIC or size > end:
+        raise ValueError('Not a Minesweeper replay')
+    file.seek(end - size)
+    return next(read_replays(file))
+
+
+def _history(game, replay):
+    """
+    Creates the history that replays the undo and redo records of a replay.
+
+    Args:
+        game (Game): The game the replay is applied to.
+        replay (Replay): The replay.
+
+    Returns:
+        History or None: A history able to undo every move of the replay, or None
+        if the replay never undoes a move.
+    """
+    moves = replay.records['move']
+    if not len(moves) or (moves & 7).max() < ACTION_CODES['undo']:
+        return None
+    return History(game, capacity=len(moves))
+
+
+def _play_moves(game, history, codes, indices):
+    """
+    Applies decoded move records to a game.
+
+    Args:
+        game (Game): The game.
+        history (History or None): Its history, for the undo and redo records.
+        codes (list of int): The action codes.
+        indices (list of int): The linear indices of the cells played.
+
+    Returns:
+        int: Number of moves applied; a move made after the end of the game stops
+        the replay before it.
+    """
+    columns = game.board.columns
+    methods = (game.reveal_cell, game.toggle_flag, game.chord_cell)
+    played = 0
+    for code, index in zip(codes, indices):
+        if code < 3:
+            if game.game_over:
+                break
+            methods[code](index // columns, index % columns)
+        elif code == 3:
+            history.undo()
+        else:
+            history.redo()
+        played += 1
+    return played
+
+
+def _replayable(codes):
+    """
+    Checks that a run of moves never undoes or redoes a move made before it.
+
+    Such a run can be replayed from a keyframe, whose history is empty.
+
+    Args:
+        codes (list of int): The action codes of the run.
+
+    Returns:
+        bool: True if the run can be replayed from a keyframe.
+    """
+    undoable = redoable = 0
+    for code in codes:
+        if code < 3:
+            undoable += 1
+            redoable = 0
+        elif code == 3:
+            if not undoable:
+                return False
+            undoable -= 1
+            redoable += 1
+        else:
+            if not redoable:
+                return False
+            redoable -= 1
+            undoable += 1
+    return True
+
+
+class ReplaySeeker:
+    """
+    Jumps to any move of a replay, e.g. to scrub through it.
+
+    A seek loads the nearest keyframe at or before the move and replays the moves
+    after it, so it costs one keyframe load and at most one keyframe interval of
+    moves, however long the replay is. Seeking forwards from the current
+    position just plays on. Moves that undo or redo a move made before a
+    keyframe are replayed from an earlier keyframe, or from the start.
+
+    Attributes:
+        replay (Replay): The replay.
+        game (Game or None): The game at the current position, None before the
+            first seek. The seeker keeps playing it, so copy it to keep a state.
+        position (int): Number of moves played on game.
+    """
+
+    def __init__(self, file, replay, engine='array'):
+        """
+        Prepares to seek in a replay.
+
+        Args:
+            file: The seekable binary file the replay was read from.
+            replay (Replay): The replay, as read by read_replays or open_replay.
+            engine (str): Name of the board engine to replay on, see ENGINES.
+
+        Raises:
+            ValueError: If the replay has keyframes but its position in the file is
+                unknown.
+        """
+        if len(replay.keyframes) and replay.offset is None:
+            raise ValueError('Seeking needs the position of the replay in its file')
+        self.file = file
+        self.replay = replay
+        self.engine = engine
+        self.game = None
+        self.position = 0
+        self._origin = 0  # Move the game was started or loaded at
+        self._history = None
+        moves = replay.records['move']
+        self._codes = (moves & 7).tolist()
+        self._indices = (moves >> 3).tolist()
+        self._undoes = any(code >= ACTION_CODES['undo'] for code in self._codes)
+
+    def _anchor(self, move):
+        """
+        Finds the keyframe to replay a move from.
+
+        Args:
+            move (int): The target move.
+
+        Returns:
+            tuple: ``(moves, offset)`` of the keyframe, ``(0, None)`` for the start.
+        """
+        keyframes = self.replay.keyframes
+        position = int(np.searchsorted(keyframes['move'], move, side='right')) - 1
+        while position >= 0:
+            start, offset = (int(value) for value in keyframes[position].tolist())
+            if not self._undoes or _replayable(self._codes[start:move]):
+                return start, offset
+            position -= 1
+        return 0, None
+
+    def _load(self, offset):
+        """
+        Loads a keyframe.
+
+        Args:
+            offset (int): Position of the keyframe record from the start of the replay.
+
+        Returns:
+            Game: The saved game.
+        """
+        self.file.seek(self.replay.offset + offset)
+        move, _ = struct.unpack('<II', self.file.read(RECORD.itemsize))
+        return loads(self.file.read(move >> 3), self.engine)
+
+    def seek(self, move):
+        """
+        Brings the game to the state after a number of moves.
+
+        Args:
+            move (int): Number of moves to have played, from 0 to len(replay).
+
+        Returns:
+            Game: The game after that many moves.
+
+        Raises:
+            ValueError: If the move is out of range.
+        """
+        if not 0 <= move <= len(self.replay):
+            raise ValueError(
+                f"Move {move} is outside the replay's {len(self.replay)} moves")
+        start, offset = self._anchor(move)
+        if self.game is None or not start <= self.position <= move or (
+                self._origin and self._undoes
+                and not _replayable(self._codes[self._origin:move])):
+            if offset is None:
+                self.game = self.replay.new_game(self.engine)
+            else:
+                self.game = self._load(offset)
+            self._history = _history(self.game, self.replay)
+            self.position = self._origin = start
+        _play_moves(self.game, self._history, self._codes[self.position:move],
+                    self._indices[self.position:move])
+        self.position = move
+        return self.game
+
+
+class VerificationResult:
+    """
+    The outcome of re-executing a replay.
+
+    Attributes:
+        valid (bool): Indicates if the replay re-executes to the claimed result.
+        reason (str): Why the replay is invalid, empty if it is valid.
+        status (str): The status the game actually reached.
+        moves (int): Number of moves re-executed.
+        elapsed_ms (int): The recorded duration of the game.
+    """
+
+    def __init__(self, valid, reason, status, moves, elapsed_ms):
+        """
+        Initializes the result.
+
+        Args:
+            valid (bool): Indicates if the replay is valid.
+            reason (str): Why the replay is invalid.
+            status (str): The status the game reached.
+            moves (int): Number of moves re-executed.
+            elapsed_ms (int): The recorded duration of the game.
+        """
+        self.valid = valid
+        self.reason = reason
+        self.status = status
+        self.moves = moves
+        self.elapsed_ms = elapsed_ms
+
+    def __repr__(self):
+        return (f"VerificationResult(valid={self.valid}, status={self.status!r},"
+                f" moves={self.moves}, reason={self.reason!r})")
+
+
+def verify_replay(replay, engine='cell'):
+    """
+    Re-executes a replay headlessly and checks it against its claims.
+
+    The records are decoded in bulk and the moves applied to a fresh game. The
+    only subscriber is the History that replays undo and redo records, and it is
+    attached only when the replay contains some; otherwise nothing but the game
+    logic runs per move. A replay is valid if every record is well formed and in
+    time order, no move follows the end of the game, and the final status and
+    move count match the trailer.
+
+    Args:
+        replay (Replay): The replay to verify.
+        engine (str): Name of the board engine to replay on, see ENGINES.
+
+    Returns:
+        VerificationResult: The outcome.
+    """
+    def result(reason, status, moves):
+        return VerificationResult(not reason, reason, status, moves, replay.elapsed_ms)
+
+    if replay.safe_zone is None or replay.status is None:
+        return result('unknown header or trailer code', PLAYING, 0)
+    if replay.claimed_moves != len(replay):
+        return result('move count does not match the trailer', PLAYING, 0)
+    moves = replay.records['move']
+    times = replay.records['time']
+    codes = moves & 7
+    indices = moves >> 3
+    cells = replay.rows * replay.columns
+    if len(moves) and (codes.max() >= len(ACTIONS) or indices.max() >= cells):
+        return result('malformed move record', PLAYING, 0)
+    if np.any(np.diff(times.astype(np.int64)) < 0) or (
+            len(times) and times[-1] > replay.elapsed_ms):
+        return result('timestamps out of order', PLAYING, 0)
+
+    game = replay.new_game(engine)
+    history = _history(game, replay)
+    played = _play_moves(game, history, codes.tolist(), indices.tolist())
+    if played < len(moves):
+        return result('move after the end of the game', game.status, played)
+    if game.status != replay.status:
+        return result(f'claimed {replay.status} but the game is {game.status}',
+                      game.status, played)
+    return result('', game.status, played)
+
+
+def verify_archive(file, engine='cell', workers=1):
+    """
+    Verifies every replay of an archive, streaming it one replay at a time.
+
+    With several workers the replays are verified in parallel on a
+    ProcessPoolExecutor. Only a few replays per worker are in flight at a time,
+    so memory stays bounded however large the archive is.
+
+    Args:
+        file: A binary file opened for reading.
+        engine (str): Name of the board engine to replay on, see ENGINES.
+        workers (int): Number of worker processes; 1 verifies in the calling process.
+
+    Yields:
+        VerificationResult: The outcome of every replay, in order.
+    """
+    if workers == 1:
+        for replay in read_replays(file):
+            yield verify_replay(replay, engine)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for replay in read_replays(file):
+            pending.append(executor.submit(verify_replay, replay, engine))
+            if len(pending) >= 4 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    """
+    Verifies replay archives from the command line.
+
+    Example::
+
+        python -m mem679_minesweeper.replay submissions.replay
+
+    Args:
+        argv (list of str, optional): The arguments, defaults to sys.argv.
+
+    Returns:
+        int: 0 if every replay is valid, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description='Verify Minesweeper replays.')
+    parser.add_argument('archives', nargs='+', help='replay archives to verify')
+    parser.add_argument('--engine', default='cell', choices=list(ENGINES),
+                        help='board engine to replay on')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes verifying replays in parallel')
+    args = parser.parse_args(argv)
+
+    failures = total = moves = 0
+    start = time.perf_counter()
+    for path in args.archives:
+        with open(path, 'rb') as file:
+            outcomes = verify_archive(file, args.engine, args.workers)
+            for number, outcome in enumerate(outcomes):
+                total += 1
+                moves += outcome.moves
+                if not outcome.valid:
+                    failures += 1
+                    print(f"{path}#{number}: INVALID, {outcome.reason}", flush=True)
+    seconds = time.perf_counter() - start
+    print(f"{total} replays, {failures} invalid, {moves} moves in {seconds:.2f} s"
+          f" ({moves / seconds if seconds else 0:,.0f} moves/s)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# simulation.py
+
+import os  # Import os to count the available CPU cores
+import random  # Import the random module for per-game strategy randomness
+import time  # Import time to measure how long each game takes
+from concurrent.futures import ProcessPoolExecutor  # Spreads games across processes
+import numpy as np  # NumPy derives independent per-game seeds
+from mem679_minesweeper.game import Game  # The Game class driven by the strategies
+
+
+class SimulationResult:
+    """
+    Aggregated outcome of a batch of simulated games.
+
+    Attributes:
+        games (int): Number of games played.
+        wins (int): Number of games won.
+        moves (int): Total number of moves over all games.
+        game_seconds (float): Total time spent inside games, summed over workers.
+        wall_seconds (float): Wall-clock time of the whole batch.
+    """
+
+    def __init__(self, games=0, wins=0, moves=0, game_seconds=0.0, wall_seconds=0.0):
+        """
+        Initializes the result with the given totals.
+
+        Args:
+            games (int): Number of games played.
+            wins (int): Number of games won.
+            moves (int): Total number of moves over all games.
+            game_seconds (float): Total time spent inside games.
+            wall_seconds (float): Wall-clock time of the whole batch.
+        """
+        self.games = games
+        self.wins = wins
+        self.moves = moves
+        self.game_seconds = game_seconds
+        self.wall_seconds = wall_seconds
+
+    def add(self, other):
+        """
+        Adds the per-game totals of another result to this one.
+
+        Args:
+            other (SimulationResult): The result to merge in.
+        """
+        self.games += other.games
+        self.wins += other.wins
+        self.moves += other.moves
+        self.game_seconds += other.game_seconds
+
+    @property
+    def win_rate(self):
+        """float: Fraction of games won."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def moves_per_game(self):
+        """float: Average number of moves per game."""
+        return self.moves / self.games if self.games else 0.0
+
+    @property
+    def seconds_per_game(self):
+        """float: Average time spent inside one game."""
+        return self.game_seconds / self.games if self.games else 0.0
+
+    def to_dict(self):
+        """
+        Returns the totals and averages as a plain dictionary for logging.
+
+        Returns:
+            dict: The result fields.
+        """
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'win_rate': self.win_rate,
+            'moves': self.moves,
+            'moves_per_game': self.moves_per_game,
+            'seconds_per_game': self.seconds_per_game,
+            'wall_seconds': self.wall_seconds,
+        }
+
+
+def game_seed(base_seed, index):
+    """
+    Derives the seed of one game in a batch.
+
+    Seeds depend only on the batch seed and the game index, so a batch gives the
+    same games however it is split into chunks or spread over workers.
+
+    Args:
+        base_seed (int): Seed of the whole batch.
+        index (int): Index of the game in the batch.
+
+    Returns:
+        int: A 63-bit seed for the game.
+    """
+    sequence = np.random.SeedSequence(base_seed, spawn_key=(index,))
+    state = sequence.generate_state(2, np.uint32)
+    return (int(state[0]) << 31) ^ int(state[1])
+
+
+def random_strategy(game, rng):
+    """
+    A baseline strategy that reveals a random covered, unflagged cell.
+
+    Args:
+        game (Game): The game being played.
+        rng (random.Random): Source of randomness for the strategy.
+
+    Returns:
+        tuple: The move ``('reveal', x, y)``.
+    """
+    board = game.board
+    # Sample until a covered cell turns up; fall back to a scan near the end
+    for _ in range(32):
+        x, y = rng.randrange(board.rows), rng.randrange(board.columns)
+        cell = board.grid[x][y]
+        if not cell.is_revealed and not cell.is_flagged:
+            return 'reveal', x, y
+    covered = [
+        (x, y)
+        for x, row in enumerate(board.grid)
+        for y, cell in enumerate(row)
+        if not cell.is_revealed and not cell.is_flagged
+    ]
+    x, y = rng.choice(covered)
+    return 'reveal', x, y
+
+
+def play_game(strategy, rows, columns, mines, seed, engine='cell', safe_zone='cell',
+              max_moves=None, instrumentation=None):
+    """
+    Plays one game headlessly with the given strategy.
+
+    The strategy is called with the game and a random.Random seeded from the game
+    seed, and returns a move ``(action, x, y)`` that is applied with Game.play.
+    Moves are applied until the game is over or max_moves is reached.
+
+    Args:
+        strategy (callable): The move-picking strategy.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        seed (int): Seed for the board and the strategy.
+        engine (str): Board engine, see ENGINES.
+        safe_zone (str or array-like): Safe zone around the first click.
+        max_moves (int, optional): Move limit, guarding against strategies that never
+            finish. Defaults to three moves per cell.
+        instrumentation (Instrumentation, optional): Records the game's operations,
+            see Instrumentation.snapshot.
+
+    Returns:
+        tuple: ``(won, moves, seconds)`` for the game.
+    """
+    if max_moves is None:
+        max_moves = 3 * rows * columns
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    game = Game(rows, columns, mines, engine=engine, safe_zone=safe_zone, seed=seed,
+                instrumentation=instrumentation)
+    moves = 0
+    while not game.game_over and moves < max_moves:
+        action, x, y = strategy(game, rng)
+        game.play(action, x, y)
+        moves += 1
+    return game.win, moves, time.perf_counter() - start
+
+
+def _play_chunk(strategy, start, stop, base_seed, settings):
+    """
+    Plays the games with indices in ``[start, stop)``; runs inside a worker.
+
+    Args:
+        strategy (callable): The move-picking strategy.
+        start (int): Index of the first game of the chunk.
+        stop (int): Index after the last game of the chunk.
+        base_seed (int): Seed of the whole batch.
+        settings (dict): Keyword arguments for play_game.
+
+    Returns:
+        SimulationResult: Totals for the chunk.
+    """
+    result = SimulationResult()
+    for index in range(start, stop):
+        won, moves, seconds = play_game(strategy, seed=game_seed(base_seed, index),
+                                        **settings)
+        result.add(SimulationResult(1, int(won), moves, seconds))
+    return result
+
+
+def simulate(strategy, games, rows=16, columns=16, mines=40, engine='cell',
+             safe_zone='cell', seed=None, workers=None, chunk_size=None,
+             max_moves=None):
+    """
+    Plays a batch of games headlessly and aggregates the results.
+
+    Games are split into chunks of consecutive indices that are handed to a
+    ProcessPoolExecutor. Each game gets its own seed derived from the batch seed
+    and its index, so results are reproducible and independent of the number of
+    workers. The strategy must be picklable, e.g. a module-level function.
+
+    Args:
+        strategy (callable): The move-picking strategy, see play_game.
+        games (int): Number of games to play.
+        rows (int): Number of rows in the board.
+        columns (int): Number of columns in the board.
+        mines (int): Number of mines on the board.
+        engine (str): Board engine, see ENGINES.
+        safe_zone (str or array-like): Safe zone around the first click.
+        seed (int, optional): Seed of the batch. A fresh one is drawn if omitted.
+        workers (int, optional): Number of worker processes. Defaults to the number
+            of CPU cores; 1 plays every game in the calling process.
+        chunk_size (int, optional): Games per chunk. Defaults to about four chunks
+            per worker to balance the load.
+        max_moves (int, optional): Move limit per game, see play_game.
+
+    Returns:
+        SimulationResult: The aggregated results.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-games // (4 * workers)))
+    settings = {
+        'rows': rows, 'columns': columns, 'mines': mines,
+        'engine': engine, 'safe_zone': safe_zone, 'max_moves': max_moves,
+    }
+    chunks = [(start, min(start + chunk_size, games))
+              for start in range(0, games, chunk_size)]
+
+    wall_start = time.perf_counter()
+    result = SimulationResult()
+    if workers == 1:
+        for start, stop in chunks:
+            result.add(_play_chunk(strategy, start, stop, seed, settings))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_play_chunk, strategy, start, stop, seed, settings)
+                for start, stop in chunks
+            ]
+            for future in futures:
+                result.add(future.result())
+    result.wall_seconds = time.perf_counter() - wall_start
+    return result
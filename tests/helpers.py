@@ -0,0 +1,16 @@
+# tests/helpers.py
+
+from mem679_minesweeper.game import Game
+
+
+def mined_game(engine='cell'):
+    """
+    Returns a 4x4 game with mines at (0, 0) and (3, 3), past the first click.
+    """
+    game = Game(rows=4, columns=4, mines=2, engine=engine)
+    game.board.grid[0][0].set_mine()
+    game.board.grid[3][3].set_mine()
+    game.board._calculate_adjacent_mines()
+    game.board.mines_placed = True
+    game.first_click = False
+    return game
@@ -0,0 +1,40 @@
+# tests/test_adjacency.py
+
+import unittest
+import numpy as np
+from mem679_minesweeper.adjacency import count_adjacent_mines, neighborhood_region
+
+def naive_counts(mines):
+    rows, columns = mines.shape
+    counts = np.zeros((rows, columns), dtype=int)
+    for x in range(rows):
+        for y in range(columns):
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    nx, ny = x + dx, y + dy
+                    if (dx or dy) and 0 <= nx < rows and 0 <= ny < columns:
+                        counts[x, y] += mines[nx, ny]
+    return counts
+
+class TestAdjacency(unittest.TestCase):
+    def setUp(self):
+        self.mines = np.random.default_rng(7).random((11, 13)) < 0.3
+
+    def test_full_board_matches_naive_count(self):
+        counts = count_adjacent_mines(self.mines)
+        np.testing.assert_array_equal(counts, naive_counts(self.mines))
+
+    def test_region_matches_full_board(self):
+        full = count_adjacent_mines(self.mines)
+        for region in [(0, 3, 0, 4), (4, 9, 5, 13), (10, 11, 12, 13), (2, 11, 0, 13)]:
+            x0, x1, y0, y1 = region
+            np.testing.assert_array_equal(count_adjacent_mines(self.mines, region),
+                                          full[x0:x1, y0:y1])
+
+    def test_neighborhood_region_is_clipped(self):
+        self.assertEqual(neighborhood_region(0, 0, 5, 5), (0, 2, 0, 2))
+        self.assertEqual(neighborhood_region(2, 3, 5, 5), (1, 4, 2, 5))
+        self.assertEqual(neighborhood_region(4, 4, 5, 5), (3, 5, 3, 5))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# tests/test_array_board.py
+
+import unittest
+from mem679_minesweeper.array_board import ArrayBoard
+from mem679_minesweeper.board import Board
+from mem679_minesweeper.game import Game
+
+class TestArrayBoard(unittest.TestCase):
+    def setUp(self):
+        self.board = ArrayBoard(rows=5, columns=5, mines=5)
+
+    def test_board_initialization(self):
+        self.assertEqual(self.board.rows, 5)
+        self.assertEqual(self.board.columns, 5)
+        self.assertEqual(self.board.total_mines, 5)
+        self.assertFalse(self.board.mines_placed)
+        self.assertEqual(len(self.board.grid), 5)
+        self.assertEqual(len(self.board.grid[0]), 5)
+        self.assertEqual(self.board.mines.shape, (5, 5))
+
+    def test_place_mines(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        self.assertTrue(self.board.mines_placed)
+        self.assertEqual(int(self.board.mines.sum()), 5)
+        self.assertFalse(self.board.grid[0][0].is_mine)
+
+    def test_adjacent_counts_match_cell_board(self):
+        self.board.place_mines(exclude_x=2, exclude_y=2)
+        reference = Board(rows=5, columns=5, mines=5)
+        for x, y in zip(*self.board.mines.nonzero()):
+            reference.grid[x][y].set_mine()
+        reference._calculate_adjacent_mines()
+        for x in range(5):
+            for y in range(5):
+                self.assertEqual(
+                    self.board.grid[x][y].adjacent_mines,
+                    reference.grid[x][y].adjacent_mines,
+                )
+
+    def test_move_mine_updates_counts(self):
+        self.board.grid[0][0].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.move_mine(0, 0, 4, 4)
+        self.assertFalse(self.board.mines[0, 0])
+        self.assertTrue(self.board.mines[4, 4])
+        self.assertEqual(self.board.adjacent[1, 1], 0)
+        self.assertEqual(self.board.adjacent[3, 3], 1)
+
+    def test_reveal_opening(self):
+        self.board.grid[4][4].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.reveal_cell(0, 0)
+        self.assertEqual(int(self.board.revealed.sum()), 24)
+        self.assertTrue(self.board.is_win())
+
+    def test_reveal_large_sparse_board(self):
+        board = ArrayBoard(rows=400, columns=400, mines=1)
+        board.place_mines(exclude_x=0, exclude_y=0)
+        board.reveal_cell(0, 0)
+        self.assertTrue(board.is_win())
+
+    def test_mine_index(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        positions = self.board.mine_positions()
+        self.assertEqual(len(positions), 5)
+        self.assertEqual(positions, sorted(positions))
+        for x in range(5):
+            for y in range(5):
+                self.assertEqual(self.board.is_mine(x, y), (x, y) in positions)
+                self.assertEqual(self.board.grid[x][y].is_mine, (x, y) in positions)
+        x, y = positions[0]
+        self.board.grid[x][y].clear_mine()
+        self.assertFalse(self.board.is_mine(x, y))
+        self.assertEqual(self.board.mine_count, 4)
+
+    def test_toggle_flag(self):
+        self.board.toggle_flag(2, 2)
+        self.assertTrue(self.board.grid[2][2].is_flagged)
+        self.board.toggle_flag(2, 2)
+        self.assertFalse(self.board.grid[2][2].is_flagged)
+
+    def test_counters(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        self.assertEqual(self.board.mine_count, 5)
+        self.board.toggle_flag(2, 2)
+        self.assertEqual(self.board.remaining_mines, 4)
+        self.assertEqual(self.board.flagged_neighbors[1, 1], 1)
+        self.assertEqual(self.board.flagged_neighbors[2, 2], 0)
+        self.board.grid[2][2].toggle_flag()
+        self.assertEqual(self.board.flags_placed, 0)
+        self.assertFalse(self.board.flagged_neighbors.any())
+        revealed = self.board.reveal_cell(0, 0)
+        self.assertEqual(self.board.revealed_safe, len(revealed))
+        self.board.reveal_all_mines()
+        self.assertEqual(self.board.revealed_safe, len(revealed))
+
+    def test_reveal_all_mines(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        revealed = self.board.reveal_all_mines()
+        self.assertEqual(revealed, self.board.mine_indices.tolist())
+        self.assertTrue(self.board.revealed[self.board.mines].all())
+        self.assertEqual(self.board.reveal_all_mines(), [])
+
+    def test_chord_cell_mine_triggered(self):
+        self.board.grid[1][2].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.grid[2][2].reveal()
+        self.board.toggle_flag(3, 3)  # Wrong flag
+        self.assertTrue(self.board.chord_cell(2, 2))
+
+class TestArrayEngineGame(unittest.TestCase):
+    def test_game_runs_on_array_engine(self):
+        game = Game(rows=9, columns=9, mines=10, engine='array')
+        self.assertIsInstance(game.board, ArrayBoard)
+        game.reveal_cell(4, 4)
+        self.assertTrue(game.board.grid[4][4].is_revealed)
+        self.assertFalse(game.board.grid[4][4].is_mine)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Game(engine='abacus')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# tests/test_benchmark.py
+
+import json
+import os
+import tempfile
+import unittest
+from mem679_minesweeper.benchmark import (
+    OPERATIONS, find_regressions, load_baseline, main, result_key, run_benchmarks,
+    save_baseline,
+)
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.results = run_benchmarks(sizes=[(9, 9)], densities=[0.12], repeat=1)
+
+    def test_every_operation_measured(self):
+        self.assertEqual(len(self.results), 2 * len(OPERATIONS))
+        for result in self.results:
+            self.assertGreaterEqual(result['seconds'], 0)
+            self.assertGreaterEqual(result['peak_bytes'], 0)
+            self.assertEqual(result['mines'], 10)
+
+    def test_solver_games_skipped_on_large_boards(self):
+        results = run_benchmarks(sizes=[(9, 9)], densities=[0.12], engines=['array'],
+                                 operations=['is_win', 'solver_game'], repeat=1,
+                                 solver_cells=50)
+        self.assertEqual([result['operation'] for result in results], ['is_win'])
+
+    def test_baseline_round_trip_and_regressions(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            save_baseline(self.results, path)
+            baseline = load_baseline(path)
+            self.assertEqual(set(baseline),
+                             {result_key(result) for result in self.results})
+            self.assertEqual(find_regressions(self.results, baseline), [])
+
+            # Make one measurement look much slower and bigger than its baseline
+            first = self.results[0]
+            slower = dict(first, seconds=baseline[result_key(first)]['seconds'] + 1,
+                          peak_bytes=10 * first['peak_bytes'] + 100)
+            metrics = {regression['metric']
+                       for regression in find_regressions([slower], baseline)}
+            self.assertEqual(metrics, {'seconds', 'peak_bytes'})
+
+            with open(path, 'w') as handle:
+                json.dump({'version': 0, 'results': {}}, handle)
+            with self.assertRaises(ValueError):
+                load_baseline(path)
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            arguments = ['--sizes', '9x9', '--densities', '0.12', '--engines', 'array',
+                         '--operations', 'init,is_win', '--repeat', '1']
+            self.assertEqual(main(arguments + ['--save', path]), 0)
+            # A baseline of impossibly fast, tiny operations flags a regression
+            with open(path) as handle:
+                baseline = json.load(handle)
+            for entry in baseline['results'].values():
+                entry['peak_bytes'] = 1
+            with open(path, 'w') as handle:
+                json.dump(baseline, handle)
+            self.assertEqual(main(arguments + ['--compare', path]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,11 +30,36 @@ class TestBoard(unittest.TestCase):
                 self.assertGreaterEqual(cell.adjacent_mines, 0)
                 self.assertLessEqual(cell.adjacent_mines, 5)
 
+    def test_move_mine_updates_counts(self):
+        self.board.grid[0][0].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.move_mine(0, 0, 4, 4)
+        self.assertFalse(self.board.grid[0][0].is_mine)
+        self.assertTrue(self.board.grid[4][4].is_mine)
+        self.assertEqual(self.board.grid[1][1].adjacent_mines, 0)
+        self.assertEqual(self.board.grid[3][3].adjacent_mines, 1)
+
     def test_reveal_cell(self):
         self.board.place_mines(exclude_x=0, exclude_y=0)
         self.board.reveal_cell(0, 0)
         self.assertTrue(self.board.grid[0][0].is_revealed)
 
+    def test_reveal_cell_returns_opening(self):
+        self.board.grid[4][4].set_mine()
+        self.board._calculate_adjacent_mines()
+        revealed = self.board.reveal_cell(0, 0)
+        self.assertEqual(len(revealed), 24)
+        self.assertNotIn((4, 4), revealed)
+        self.assertEqual(self.board.reveal_cell(0, 0), set())  # Already revealed
+
+    def test_reveal_large_opening_without_recursion(self):
+        board = Board(rows=200, columns=200, mines=1)
+        board.grid[199][199].set_mine()
+        board._calculate_adjacent_mines()
+        revealed = board.reveal_cell(0, 0)
+        self.assertEqual(len(revealed), 200 * 200 - 1)
+        self.assertTrue(board.is_win())
+
     def test_reveal_mine(self):
         # Force a mine at position (1,1)
         self.board.grid[1][1].set_mine()
@@ -43,6 +68,22 @@ class TestBoard(unittest.TestCase):
         self.assertTrue(self.board.grid[1][1].is_revealed)
         self.assertTrue(self.board.grid[1][1].is_mine)
 
+    def test_mine_index(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        positions = self.board.mine_positions()
+        self.assertEqual(len(positions), 5)
+        self.assertEqual(positions, sorted(positions))
+        for x in range(5):
+            for y in range(5):
+                self.assertEqual(self.board.is_mine(x, y), (x, y) in positions)
+                self.assertEqual(self.board.grid[x][y].is_mine, (x, y) in positions)
+                self.assertEqual(self.board.mines[x, y], (x, y) in positions)
+        x, y = positions[0]
+        self.board.grid[x][y].clear_mine()
+        self.assertFalse(self.board.is_mine(x, y))
+        self.assertFalse(self.board.mines[x, y])
+        self.assertEqual(self.board.mine_count, 4)
+
     def test_toggle_flag(self):
         self.board.toggle_flag(2, 2)
         self.assertTrue(self.board.grid[2][2].is_flagged)
@@ -58,13 +99,32 @@ class TestBoard(unittest.TestCase):
                     cell.reveal()
         self.assertTrue(self.board.is_win())
 
+    def test_counters_follow_cell_changes(self):
+        self.board.place_mines(exclude_x=0, exclude_y=0)
+        self.assertEqual(self.board.mine_count, 5)
+        self.assertEqual(self.board.remaining_mines, 5)
+        self.board.toggle_flag(2, 2)
+        self.assertEqual(self.board.flags_placed, 1)
+        self.assertEqual(self.board.remaining_mines, 4)
+        self.assertEqual(self.board.flagged_neighbors[1 * 5 + 1], 1)
+        self.assertEqual(self.board.flagged_neighbors[2 * 5 + 2], 0)
+        self.board.grid[2][2].toggle_flag()
+        self.assertEqual(self.board.flags_placed, 0)
+        self.assertEqual(self.board.flagged_neighbors[1 * 5 + 1], 0)
+        revealed = self.board.reveal_cell(0, 0)
+        self.assertEqual(self.board.revealed_safe, len(revealed))
+
     def test_reveal_all_mines(self):
         self.board.place_mines(exclude_x=0, exclude_y=0)
-        self.board.reveal_all_mines()
+        flagged = min(self.board.mine_indices)
+        self.board.toggle_flag(*divmod(flagged, 5))
+        revealed = self.board.reveal_all_mines()
+        self.assertEqual(revealed, sorted(self.board.mine_indices - {flagged}))
         for row in self.board.grid:
             for cell in row:
-                if cell.is_mine:
+                if cell.is_mine and not cell.is_flagged:
                     self.assertTrue(cell.is_revealed)
+        self.assertEqual(self.board.reveal_all_mines(), [])
 
     def test_chord_cell(self):
         # Set up a cell with adjacent mines
@@ -91,5 +151,38 @@ class TestBoard(unittest.TestCase):
                     if not neighbor.is_mine and not neighbor.is_flagged:
                         self.assertTrue(neighbor.is_revealed)
 
+    def test_chord_reveal_reports_revealed_cells(self):
+        self.board.grid[0][0].set_mine()
+        self.board.grid[4][4].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.grid[1][0].reveal()
+        self.board.toggle_flag(0, 0)
+        mine_triggered, revealed = self.board.chord_reveal(1, 0)
+        self.assertFalse(mine_triggered)
+        self.assertIn((0, 1), revealed)
+        self.assertNotIn((0, 0), revealed)  # Flagged
+        self.assertNotIn((1, 0), revealed)  # Already revealed
+        for x, y in revealed:
+            self.assertTrue(self.board.grid[x][y].is_revealed)
+        # Chording again reveals nothing new
+        self.assertEqual(self.board.chord_reveal(1, 0), (False, set()))
+
+    def test_chord_reveal_reports_triggered_mine(self):
+        self.board.grid[0][0].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.grid[1][1].reveal()
+        self.board.toggle_flag(2, 2)  # A wrong flag
+        mine_triggered, revealed = self.board.chord_reveal(1, 1)
+        self.assertTrue(mine_triggered)
+        self.assertIn((0, 0), revealed)
+
+    def test_chord_cell_opens_empty_area(self):
+        self.board.grid[0][0].set_mine()
+        self.board._calculate_adjacent_mines()
+        self.board.grid[1][1].reveal()
+        self.board.toggle_flag(0, 0)
+        self.assertFalse(self.board.chord_cell(1, 1))
+        self.assertTrue(self.board.is_win())
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,7 @@ src_dir = os.path.join(current_dir, '..', 'src')
 sys.path.append(src_dir)
 
 import unittest
-from mem679_minesweeper.cell import Cell
+from mem679_minesweeper.cell import Cell, measure_cell_bytes
 
 class TestCell(unittest.TestCase):
     def test_cell_initialization(self):
@@ -50,5 +50,16 @@ class TestCell(unittest.TestCase):
         cell.set_adjacent_mines(3)
         self.assertEqual(cell.adjacent_mines, 3)
 
+    def test_cell_has_no_instance_dict(self):
+        cell = Cell(0, 0)
+        self.assertFalse(hasattr(cell, '__dict__'))
+        with self.assertRaises(AttributeError):
+            cell.colour = 'red'
+
+    def test_measure_cell_bytes(self):
+        size = measure_cell_bytes(rows=50, columns=50)
+        self.assertGreater(size, 0)
+        self.assertLess(size, 150)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+# tests/test_changes.py
+
+import unittest
+from mem679_minesweeper.changes import (
+    ADJACENT_SHIFT, FLAGGED, LOST, MINE, PLAYING, REVEALED, WON, cell_state,
+)
+from tests.helpers import mined_game
+
+
+class TestChangeSets(unittest.TestCase):
+    def setUp(self):
+        self.changes = []
+
+    def test_reveal_reports_flood(self):
+        for engine in ('cell', 'array'):
+            game = mined_game(engine)
+            game.subscribe(self.changes.append)
+            game.reveal_cell(1, 1)
+            self.assertEqual(self.changes[-1].indices, [5])
+            self.assertIsNone(self.changes[-1].status)
+            revealed = game.reveal_cell(3, 0)
+            change = self.changes[-1]
+            self.assertEqual(change.action, 'reveal')
+            self.assertEqual(set(change.positions(4)), revealed)
+            self.assertEqual(change.indices, sorted(change.indices))
+            self.assertEqual(change.status, (PLAYING, WON))
+            for index, state in zip(change.indices, change.states):
+                cell = game.board.grid[index // 4][index % 4]
+                self.assertEqual(state,
+                                 REVEALED | (cell.adjacent_mines << ADJACENT_SHIFT))
+
+    def test_flag_and_noop(self):
+        game = mined_game()
+        game.subscribe(self.changes.append)
+        game.toggle_flag(0, 0)
+        self.assertEqual(self.changes[-1].states, bytes([FLAGGED]))
+        game.reveal_cell(0, 0)  # Flagged cells cannot be revealed
+        self.assertEqual(len(self.changes), 1)
+
+    def test_loss_reports_mines_and_status(self):
+        game = mined_game()
+        game.subscribe(self.changes.append)
+        game.reveal_cell(0, 0)
+        change = self.changes[-1]
+        self.assertEqual(change.indices, [0, 15])
+        self.assertEqual(change.states, bytes([REVEALED | MINE] * 2))
+        self.assertEqual(change.status, (PLAYING, LOST))
+        self.assertEqual(change.exploded, 0)
+        self.assertEqual(game.status, LOST)
+
+    def test_chord_loss_reports_exploded_mine(self):
+        game = mined_game()
+        game.reveal_cell(1, 1)
+        game.toggle_flag(1, 0)  # Wrong flag
+        game.subscribe(self.changes.append)
+        game.chord_cell(1, 1)
+        change = self.changes[-1]
+        self.assertEqual(change.action, 'chord')
+        self.assertEqual(change.exploded, 0)
+        self.assertEqual(change.status, (PLAYING, LOST))
+        self.assertIn(15, change.indices)
+
+    def test_win_status(self):
+        game = mined_game()
+        game.subscribe(self.changes.append)
+        game.reveal_cell(0, 3)
+        self.assertEqual(self.changes[-1].status, (PLAYING, WON))
+        game.reveal_cell(3, 0)  # Moves after the game ended change nothing
+        self.assertEqual(len(self.changes), 1)
+        self.assertEqual(game.status, WON)
+
+    def test_covered_mines_stay_hidden(self):
+        game = mined_game()
+        self.assertEqual(cell_state(game.board.grid[0][0]), 0)
+
+    def test_unsubscribe(self):
+        game = mined_game()
+        game.unsubscribe(game.subscribe(self.changes.append))
+        game.toggle_flag(0, 0)
+        self.assertEqual(self.changes, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# tests/test_factory.py
+
+import time
+import unittest
+from mem679_minesweeper.factory import BoardFactory
+from mem679_minesweeper.game import Game
+
+class TestBoardFactory(unittest.TestCase):
+    def test_take_builds_board_with_mines(self):
+        factory = BoardFactory(presets=[])
+        board = factory.take(9, 9, 10)
+        self.assertTrue(board.mines_placed)
+        self.assertEqual(board.mine_count, 10)
+
+    def test_first_click_on_prepared_board_is_safe(self):
+        for engine in ('cell', 'array'):
+            factory = BoardFactory(presets=[], engine=engine, safe_zone='3x3')
+            for _ in range(20):
+                game = Game(board=factory.take(9, 9, 30))
+                game.reveal_cell(4, 4)
+                self.assertFalse(game.game_over and not game.win)
+                self.assertEqual(game.board.mine_count, 30)
+                for x in range(3, 6):
+                    for y in range(3, 6):
+                        self.assertTrue(game.board.grid[x][y].is_revealed)
+
+    def test_background_thread_fills_queue(self):
+        factory = BoardFactory(presets=[(9, 9, 10)], capacity=3)
+        factory.start()
+        try:
+            deadline = time.monotonic() + 10
+            while factory.ready(9, 9, 10) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(factory.ready(9, 9, 10), 3)
+            factory.take(9, 9, 10)
+            factory.add_preset(5, 5, 3)
+            deadline = time.monotonic() + 10
+            while factory.ready(5, 5, 3) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(factory.ready(5, 5, 3), 3)
+            self.assertEqual(factory.ready(9, 9, 10), 3)
+        finally:
+            factory.stop()
+
+if __name__ == '__main__':
+    unittest.main()
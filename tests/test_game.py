@@ -20,8 +20,11 @@ class TestGame(unittest.TestCase):
         self.assertFalse(self.game.board.grid[0][0].is_mine)
 
     def test_reveal_cell(self):
-        self.game.reveal_cell(0, 0)
+        revealed = self.game.reveal_cell(0, 0)
         self.assertTrue(self.game.board.grid[0][0].is_revealed)
+        self.assertIn((0, 0), revealed)
+        for x, y in revealed:
+            self.assertTrue(self.game.board.grid[x][y].is_revealed)
 
     def test_game_over_on_mine(self):
         # Force a mine at position (1,1)
@@ -47,10 +50,13 @@ class TestGame(unittest.TestCase):
         self.assertTrue(self.game.win)
 
     def test_toggle_flag(self):
-        self.game.toggle_flag(2, 2)
+        self.assertEqual(self.game.toggle_flag(2, 2), {(2, 2)})
         self.assertTrue(self.game.board.grid[2][2].is_flagged)
         self.game.toggle_flag(2, 2)
         self.assertFalse(self.game.board.grid[2][2].is_flagged)
+        # Revealed cells cannot be flagged, so nothing changes
+        self.game.reveal_cell(2, 2)
+        self.assertEqual(self.game.toggle_flag(2, 2), set())
 
     def test_chord_cell_no_mine_triggered(self):
         self.game.board.place_mines(exclude_x=2, exclude_y=2)
@@ -104,6 +110,16 @@ class TestGame(unittest.TestCase):
         self.assertTrue(self.game.game_over)
         self.assertFalse(self.game.win)
 
+    def test_resume_lost_board(self):
+        for engine in ('cell', 'array'):
+            game = Game(9, 9, 10, engine=engine, seed=2)
+            game.reveal_cell(4, 4)
+            self.assertFalse(Game(board=game.board).game_over)
+            game.reveal_cell(*game.board.mine_positions()[0])
+            resumed = Game(board=game.board)
+            self.assertTrue(resumed.game_over)
+            self.assertFalse(resumed.win)
+
 
 if __name__ == '__main__':
     unittest.main()
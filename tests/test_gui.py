@@ -0,0 +1,136 @@
+# tests/test_gui.py
+
+import unittest
+import pygame
+from mem679_minesweeper.gui import (
+    BLACK, BLUE, CELL_SIZE, DARK_GRAY, GRAY, MARGIN, RED, YELLOW, ZOOM_LEVELS,
+    TileAtlas, Viewport,
+)
+
+
+class TestViewport(unittest.TestCase):
+    def setUp(self):
+        # A 100x100 board seen through a 300x200 view, 32 pixels per cell
+        self.view = Viewport(100, 100, 300, 200)
+
+    def test_visible_range(self):
+        self.assertEqual(self.view.visible_range(), (0, 7, 0, 10))
+        self.view.pan(50, 40)
+        self.assertEqual(self.view.visible_range(), (1, 8, 1, 11))
+
+    def test_visible_range_of_a_small_board(self):
+        view = Viewport(3, 4, 300, 200)
+        self.assertEqual(view.visible_range(), (0, 3, 0, 4))
+
+    def test_cell_at(self):
+        pitch = CELL_SIZE + MARGIN
+        self.assertEqual(self.view.cell_at(0, 0), (0, 0))
+        self.assertEqual(self.view.cell_at(pitch + 1, 2 * pitch + 1), (2, 1))
+        self.view.pan(pitch, 0)
+        self.assertEqual(self.view.cell_at(pitch + 1, 2 * pitch + 1), (2, 2))
+        rect = self.view.cell_rect(3, 5)
+        self.assertEqual(self.view.cell_at(*rect.center), (3, 5))
+
+    def test_cell_at_outside(self):
+        self.assertIsNone(self.view.cell_at(-1, 0))
+        self.assertIsNone(self.view.cell_at(300, 0))
+        self.assertIsNone(self.view.cell_at(0, 200))
+        view = Viewport(3, 3, 300, 200)
+        self.assertIsNone(view.cell_at(150, 150))
+
+    def test_zoom_keeps_the_cell_under_the_cursor(self):
+        self.view.pan(1000, 1000)
+        for steps in (1, 1, -3, -2, 4):
+            for px, py in ((150, 100), (17, 183)):
+                before = self.view.cell_at(px, py)
+                self.assertTrue(self.view.zoom(steps, px, py))
+                self.assertEqual(self.view.cell_at(px, py), before)
+                self.view.zoom(-steps, px, py)
+
+    def test_zoom_stops_at_the_last_level(self):
+        view = Viewport(100, 100, 300, 200, cell_size=ZOOM_LEVELS[-1])
+        self.assertFalse(view.zoom(1, 0, 0))
+        self.assertTrue(view.zoom(-100, 0, 0))
+        self.assertEqual(view.cell_size, ZOOM_LEVELS[0])
+        self.assertFalse(view.zoom(-1, 0, 0))
+
+    def test_pan_is_clamped_at_the_edges(self):
+        self.assertFalse(self.view.pan(-10, -10))
+        self.assertEqual((self.view.x, self.view.y), (0, 0))
+        self.assertTrue(self.view.pan(10 ** 6, 10 ** 6))
+        pitch = self.view.pitch
+        self.assertEqual(self.view.x, 100 * pitch + MARGIN - 300)
+        self.assertEqual(self.view.y, 100 * pitch + MARGIN - 200)
+        self.assertEqual(self.view.visible_range()[1::2], (100, 100))
+        self.assertFalse(self.view.pan(1, 1))
+
+    def test_zoom_out_is_clamped_at_the_edges(self):
+        view = Viewport(10, 10, 300, 200)
+        view.pan(10 ** 6, 10 ** 6)
+        view.zoom(-1, 300, 200)
+        # The board is now narrower than the view but still taller
+        self.assertEqual(view.x, 0)
+        self.assertLessEqual(view.y, 10 * view.pitch + MARGIN - 200)
+        view.zoom(-10, 300, 200)
+        self.assertEqual((view.x, view.y), (0, 0))
+
+
+class TestTileAtlas(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        cls.font = pygame.font.Font(None, 24)
+
+    def setUp(self):
+        self.atlas = TileAtlas(CELL_SIZE, self.font)
+
+    def color(self, key, x, y):
+        """
+        Returns the RGB colour of a pixel of a tile.
+        """
+        area = self.atlas.areas[key]
+        return tuple(self.atlas.surface.get_at((area.left + x, area.top + y)))[:3]
+
+    def colors(self, key):
+        """
+        Returns the set of RGB colours used by a tile.
+        """
+        area = self.atlas.areas[key]
+        return {tuple(self.atlas.surface.get_at((x, y)))[:3]
+                for x in range(area.left, area.right)
+                for y in range(area.top, area.bottom)}
+
+    def test_one_tile_per_key(self):
+        atlas = self.atlas
+        self.assertEqual(set(atlas.areas), set(TileAtlas.KEYS))
+        self.assertEqual(atlas.surface.get_size(),
+                         (CELL_SIZE * len(TileAtlas.KEYS), CELL_SIZE))
+        areas = list(atlas.areas.values())
+        for i, area in enumerate(areas):
+            self.assertEqual(area.size, (CELL_SIZE, CELL_SIZE))
+            self.assertTrue(atlas.surface.get_rect().contains(area))
+            self.assertEqual(area.collidelist(areas[:i] + areas[i + 1:]), -1)
+
+    def test_tile_contents(self):
+        centre = CELL_SIZE // 2
+        self.assertEqual(self.colors('covered'), {DARK_GRAY})
+        self.assertEqual(self.color('flag', 0, 0), DARK_GRAY)
+        self.assertEqual(self.color('flag', centre, centre), RED)
+        self.assertEqual(self.color('mine', 0, 0), RED)
+        self.assertEqual(self.color('mine', centre, centre), BLACK)
+        self.assertEqual(self.color('exploded', 0, 0), YELLOW)
+        self.assertEqual(self.color('exploded', centre, centre), BLACK)
+        self.assertEqual(self.colors(0), {GRAY})
+        for count in range(1, 9):
+            self.assertEqual(self.color(count, 0, 0), GRAY)
+            self.assertIn(BLUE, self.colors(count))
+
+    def test_tiles_scale_with_the_cell_size(self):
+        for size in ZOOM_LEVELS:
+            atlas = TileAtlas(size, self.font)
+            self.assertEqual(atlas.areas[8].size, (size, size))
+            self.assertEqual(atlas.surface.get_width(), size * len(TileAtlas.KEYS))
+
+
+if __name__ == '__main__':
+    unittest.main()
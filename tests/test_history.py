@@ -0,0 +1,107 @@
+# tests/test_history.py
+
+import unittest
+from mem679_minesweeper.changes import LOST, PLAYING, WON
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.history import History, decode_runs, encode_runs
+from tests.helpers import mined_game
+
+
+def snapshot(game):
+    """
+    Returns the visible state of every cell and the counters of a game.
+    """
+    board = game.board
+    cells = [(cell.is_revealed, cell.is_flagged) for row in board.grid for cell in row]
+    return cells, board.revealed_safe, board.flags_placed, game.game_over, game.win
+
+
+class TestRuns(unittest.TestCase):
+    def test_round_trip(self):
+        indices = [0, 1, 2, 5, 7, 8, 100]
+        runs = encode_runs(indices)
+        self.assertEqual(list(runs), [0, 3, 5, 1, 7, 2, 100, 1])
+        self.assertEqual(decode_runs(runs), indices)
+        self.assertEqual(len(encode_runs([])), 0)
+
+
+class TestHistory(unittest.TestCase):
+    def test_undo_redo_restores_states(self):
+        for engine in ('cell', 'array'):
+            game = mined_game(engine)
+            history = History(game)
+            states = [snapshot(game)]
+            game.toggle_flag(0, 0)
+            states.append(snapshot(game))
+            game.reveal_cell(1, 1)
+            states.append(snapshot(game))
+            game.reveal_cell(3, 0)  # Floods the board and wins
+            states.append(snapshot(game))
+            self.assertEqual(game.status, WON)
+            for state in reversed(states[:-1]):
+                history.undo()
+                self.assertEqual(snapshot(game), state)
+            self.assertFalse(history.can_undo)
+            for state in states[1:]:
+                history.redo()
+                self.assertEqual(snapshot(game), state)
+            self.assertFalse(history.can_redo)
+
+    def test_undo_loss_resumes_game(self):
+        game = mined_game()
+        history = History(game)
+        changes = []
+        game.subscribe(changes.append)
+        game.reveal_cell(3, 3)
+        self.assertEqual(game.status, LOST)
+        changed = history.undo()
+        self.assertEqual(changed, {(0, 0), (3, 3)})
+        self.assertEqual(game.status, PLAYING)
+        self.assertFalse(game.board.grid[0][0].is_revealed)
+        self.assertEqual(changes[-1].action, 'undo')
+        self.assertEqual(changes[-1].status, (LOST, PLAYING))
+        history.redo()
+        self.assertEqual(changes[-1].status, (PLAYING, LOST))
+        self.assertEqual(changes[-1].exploded, 15)
+
+    def test_new_move_clears_redo(self):
+        game = mined_game()
+        history = History(game)
+        game.toggle_flag(0, 0)
+        history.undo()
+        self.assertTrue(history.can_redo)
+        game.reveal_cell(1, 1)
+        self.assertFalse(history.can_redo)
+        self.assertEqual(history.redo(), set())
+
+    def test_caps(self):
+        game = mined_game()
+        history = History(game, capacity=2)
+        for _ in range(5):
+            game.toggle_flag(0, 0)
+        self.assertEqual(len(history._undo), 2)
+        history.undo()
+        history.undo()
+        self.assertEqual(history.undo(), set())
+        entry_bytes = history.nbytes // 2
+        history = History(game, max_bytes=3 * entry_bytes)
+        for _ in range(5):
+            game.toggle_flag(0, 0)
+        self.assertLessEqual(history.nbytes, 3 * entry_bytes)
+        self.assertEqual(len(history._undo), 3)
+
+    def test_flood_is_run_length_encoded(self):
+        game = Game(rows=100, columns=100, mines=1)
+        game.board.grid[99][99].set_mine()
+        game.board._calculate_adjacent_mines()
+        game.board.mines_placed = True
+        game.first_click = False
+        history = History(game)
+        game.reveal_cell(0, 0)
+        # Every cell but the mine, the last one, is a single run
+        self.assertEqual(list(history._undo[-1].runs), [0, 9999])
+        history.undo()
+        self.assertEqual(game.board.revealed_safe, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# tests/test_instrumentation.py
+
+import json
+import unittest
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.instrumentation import Histogram, Instrumentation
+from mem679_minesweeper.simulation import play_game
+from mem679_minesweeper.solver import solver_strategy
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_and_percentiles(self):
+        histogram = Histogram()
+        for value in (0.5, 1, 3, 3, 100):
+            histogram.record(value)
+        self.assertEqual(histogram.buckets, {0: 1, 1: 1, 2: 2, 7: 1})
+        self.assertEqual(histogram.percentile(0.5), 4)
+        self.assertEqual(histogram.percentile(1.0), 100)  # Capped by the maximum
+        self.assertEqual(histogram.to_dict()['count'], 5)
+        self.assertIsNone(Histogram().percentile(0.5))
+
+class TestInstrumentation(unittest.TestCase):
+    def test_disabled_game_is_untouched(self):
+        game = Game(9, 9, 10, seed=1)
+        self.assertNotIn('reveal_cell', vars(game))
+        self.assertNotIn('is_win', vars(game.board))
+
+    def test_counts_moves_and_flood_fills(self):
+        for engine in ('cell', 'array'):
+            instrumentation = Instrumentation()
+            game = Game(9, 9, 10, engine=engine, safe_zone='3x3', seed=4,
+                        instrumentation=instrumentation)
+            revealed = game.reveal_cell(4, 4)
+            game.play('flag', *game.board.mine_positions()[0])
+            snapshot = instrumentation.snapshot()
+            counters = snapshot['counters']
+            self.assertEqual(counters['reveal'], 1)
+            self.assertEqual(counters['flag'], 1)
+            self.assertEqual(counters['place_mines'], 1)
+            self.assertEqual(counters['win_check'], 1)
+            self.assertEqual(counters['cells_revealed'], len(revealed))
+            self.assertEqual(snapshot['flood_cells']['max'], len(revealed))
+            self.assertEqual(snapshot['latency_us']['reveal']['count'], 1)
+            json.dumps(snapshot)  # Ready to be logged
+
+            Instrumentation.detach(game)
+            self.assertNotIn('reveal_cell', vars(game))
+            self.assertNotIn('reveal_cell', vars(game.board))
+
+    def test_profiling_and_headless_runs(self):
+        instrumentation = Instrumentation()
+        self.assertEqual(instrumentation.profile_report(), '')
+        instrumentation.start_profiling()
+        play_game(solver_strategy, 9, 9, 10, seed=2, instrumentation=instrumentation)
+        instrumentation.stop_profiling()
+        self.assertFalse(instrumentation.snapshot()['profiling'])
+        self.assertIn('reveal_cell', instrumentation.profile_report())
+        self.assertGreater(instrumentation.counters['reveal'], 0)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot()['counters'], {})
+
+if __name__ == '__main__':
+    unittest.main()
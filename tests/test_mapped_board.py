@@ -0,0 +1,107 @@
+# tests/test_mapped_board.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from mem679_minesweeper.array_board import ArrayBoard
+from mem679_minesweeper.changes import LOST
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.mapped_board import MappedBoard
+
+
+class TestMappedBoard(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'board.msb')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_matches_array_engine(self):
+        board = MappedBoard(self.path, 30, 20, 60, seed=4)
+        board.BAND_ROWS = 7  # Several bands on a small board
+        board.place_mines(15, 10)
+        self.assertEqual(board.mine_count, 60)
+        self.assertFalse(board.mines[15, 10])
+        # The same seed gives the same layout on the array engine
+        reference = ArrayBoard(30, 20, 60, seed=4)
+        reference.place_mines(15, 10)
+        for target in (board, reference):
+            target.toggle_flag(0, 0)
+            target.reveal_cell(15, 10)
+        for name in ('mines', 'revealed', 'flagged', 'adjacent', 'flagged_neighbors'):
+            self.assertTrue((getattr(board, name) == getattr(reference, name)).all(),
+                            name)
+        self.assertEqual(board.mine_count, 60)
+        self.assertEqual(board.revealed_safe, reference.revealed_safe)
+        self.assertEqual(board.mine_positions(), reference.mine_positions())
+        self.assertEqual(board.reveal_all_mines(), reference.reveal_all_mines())
+        board.close()
+
+    def test_seed_gives_the_layout_of_every_engine(self):
+        game = Game(board=MappedBoard(self.path, 16, 16, 40, safe_zone='3x3', seed=11))
+        game.reveal_cell(3, 8)
+        for engine in ('cell', 'array'):
+            reference = Game(16, 16, 40, engine=engine, safe_zone='3x3', seed=11)
+            reference.reveal_cell(3, 8)
+            self.assertEqual(game.board.mine_positions(),
+                             reference.board.mine_positions())
+        game.board.close()
+
+    def test_reopen_resumes_game(self):
+        game = Game(board=MappedBoard(self.path, 12, 12, 20, seed=9))
+        revealed = game.reveal_cell(6, 6)
+        game.toggle_flag(*game.board.mine_positions()[0])
+        snapshot = game.board.revealed.copy()
+        game.board.close()
+
+        board = MappedBoard.open(self.path)
+        self.assertEqual((board.rows, board.columns, board.seed), (12, 12, 9))
+        self.assertEqual(board.revealed_safe, len(revealed))
+        self.assertEqual(board.flags_placed, 1)
+        self.assertTrue((board.revealed == snapshot).all())
+        resumed = Game(board=board)
+        self.assertFalse(resumed.first_click)
+        x, y = board.mine_positions()[1]
+        resumed.reveal_cell(x, y)
+        self.assertTrue(resumed.game_over)
+        board.close()
+
+    def test_reopen_lost_game(self):
+        game = Game(board=MappedBoard(self.path, 12, 12, 20, seed=9))
+        game.reveal_cell(6, 6)
+        game.reveal_cell(*game.board.mine_positions()[0])
+        self.assertEqual(game.status, LOST)
+        game.board.close()
+
+        resumed = Game(board=MappedBoard.open(self.path))
+        self.assertEqual(resumed.status, LOST)
+        x, y = next((x, y) for x in range(12) for y in range(12)
+                    if not resumed.board.revealed[x, y])
+        self.assertEqual(resumed.reveal_cell(x, y), set())
+        self.assertFalse(resumed.board.revealed[x, y])
+        resumed.board.close()
+
+    def test_file_layout(self):
+        board = MappedBoard(self.path, 200, 200, 10, seed=1)
+        self.assertEqual(os.path.getsize(self.path), 4096 + 5 * 200 * 200)
+        self.assertFalse(np.asarray(board.revealed).any())
+        board.close()
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'x' * 100)
+        with self.assertRaises(ValueError):
+            MappedBoard.open(self.path)
+
+    def test_rejects_unknown_safe_zone(self):
+        MappedBoard(self.path, 10, 10, 10, seed=1).close()
+        with open(self.path, 'r+b') as file:
+            file.seek(7)  # The safe-zone code
+            file.write(b'\xff')
+        with self.assertRaises(ValueError):
+            MappedBoard.open(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# tests/test_no_guess.py
+
+import unittest
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.no_guess import generate_no_guess, is_solvable
+from mem679_minesweeper.solver import Solver
+
+class TestNoGuess(unittest.TestCase):
+    def test_serial_search_is_deterministic_and_solvable(self):
+        first = generate_no_guess(9, 9, 10, (4, 4), seed=3, workers=1)
+        second = generate_no_guess(9, 9, 10, (4, 4), seed=3, workers=1)
+        self.assertEqual(first.seed, second.seed)
+        self.assertGreaterEqual(first.attempts, 1)
+        self.assertTrue(is_solvable(9, 9, 10, (4, 4), first.seed))
+
+    def test_parallel_search_finds_solvable_layout(self):
+        result = generate_no_guess(16, 16, 40, (0, 0), seed=5, workers=2, timeout=60)
+        self.assertTrue(is_solvable(16, 16, 40, (0, 0), result.seed))
+        self.assertGreater(result.seconds, 0)
+
+    def test_parallel_search_matches_serial_search(self):
+        serial = generate_no_guess(16, 16, 40, (0, 0), seed=5, workers=1)
+        for workers in (2, 4):
+            parallel = generate_no_guess(16, 16, 40, (0, 0), seed=5, workers=workers,
+                                         batch_size=2)
+            self.assertEqual((parallel.seed, parallel.attempts),
+                             (serial.seed, serial.attempts))
+
+    def test_bounded_search(self):
+        # A full board leaves nothing but guesses
+        with self.assertRaises(TimeoutError):
+            generate_no_guess(4, 4, 7, (0, 0), safe_zone='cell', seed=1, workers=1,
+                              max_attempts=5)
+
+    def test_no_guess_game(self):
+        game = Game(rows=9, columns=9, mines=10, safe_zone='3x3', seed=8, no_guess=True)
+        game.reveal_cell(2, 6)
+        self.assertTrue(Solver(game).solve())
+        # The recorded seed reproduces the layout
+        replay = Game(rows=9, columns=9, mines=10, safe_zone='3x3',
+                      seed=game.board.seed)
+        replay.reveal_cell(2, 6)
+        self.assertEqual(replay.board.mine_positions(), game.board.mine_positions())
+
+    def test_no_guess_game_defaults_to_3x3_safe_zone(self):
+        self.assertEqual(Game(9, 9, 10, no_guess=True).board.safe_zone, '3x3')
+        self.assertEqual(Game(9, 9, 10).board.safe_zone, 'cell')
+
+    def test_failed_search_falls_back_to_random_layout(self):
+        # Too dense to be cleared without guessing
+        game = Game(rows=8, columns=8, mines=40, safe_zone='cell', seed=1,
+                    no_guess=True)
+        game.reveal_cell(0, 0)
+        self.assertFalse(game.no_guess)
+        self.assertEqual(len(game.board.mine_positions()), 40)
+        self.assertFalse(game.board.is_mine(0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# tests/test_persistence.py
+
+import os
+import tempfile
+import unittest
+from mem679_minesweeper.changes import LOST, PLAYING
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.persistence import HEADER, dumps, load_game, loads, save_game
+
+
+def state(game):
+    """
+    Returns everything a save file should preserve about a game.
+    """
+    board = game.board
+    cells = [(cell.is_mine, cell.is_revealed, cell.is_flagged, cell.adjacent_mines)
+             for row in board.grid for cell in row]
+    return (cells, board.revealed_safe, board.flags_placed, board.mine_count,
+            bytes(board.flagged_neighbors), game.status, game.first_click,
+            game.elapsed_time)
+
+
+class TestPersistence(unittest.TestCase):
+    def test_round_trip_in_progress(self):
+        for engine in ('cell', 'array'):
+            game = Game(rows=12, columns=9, mines=15, engine=engine, seed=5)
+            game.reveal_cell(6, 4)
+            game.toggle_flag(0, 0)
+            game.elapsed_time = 42
+            for target in ('cell', 'array'):
+                restored = loads(dumps(game), engine=target)
+                self.assertEqual(state(restored), state(game))
+                self.assertEqual(restored.board.seed, 5)
+
+    def test_restored_game_plays_on(self):
+        game = Game(rows=8, columns=8, mines=10, seed=3)
+        game.reveal_cell(4, 4)
+        restored = loads(dumps(game))
+        for x, y in game.board.mine_positions()[:1]:
+            game.reveal_cell(x, y)
+            restored.reveal_cell(x, y)
+        self.assertEqual(restored.status, LOST)
+        self.assertEqual(state(restored)[:-1], state(game)[:-1])
+
+    def test_unplaced_board_keeps_seed(self):
+        game = Game(rows=8, columns=8, mines=10, seed=11)
+        restored = loads(dumps(game))
+        self.assertTrue(restored.first_click)
+        self.assertEqual(restored.status, PLAYING)
+        game.reveal_cell(2, 2)
+        restored.reveal_cell(2, 2)
+        self.assertEqual(restored.board.mine_positions(), game.board.mine_positions())
+
+    def test_large_board_size(self):
+        game = Game(rows=1000, columns=1000, mines=150000, engine='array', seed=1)
+        game.reveal_cell(500, 500)
+        game.board.revealed[:500] = True  # A board half played
+        data = dumps(game)
+        self.assertLessEqual(len(data), 250 * 1024)
+        restored = loads(data)
+        self.assertTrue((restored.board.adjacent == game.board.adjacent).all())
+
+    def test_file_round_trip(self):
+        game = Game(rows=5, columns=5, mines=3, seed=2)
+        game.reveal_cell(0, 0)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'game.msw')
+            save_game(game, path)
+            self.assertEqual(state(load_game(path, engine='cell')), state(game))
+
+    def test_rejects_bad_data(self):
+        data = bytearray(dumps(Game(rows=5, columns=5, mines=3, seed=2)))
+        with self.assertRaises(ValueError):
+            loads(b'not a save file at all, just some bytes')
+        with self.assertRaises(ValueError):
+            loads(bytes(data[:HEADER.size + 2]))
+        data[4] = 99  # Unknown version
+        with self.assertRaises(ValueError):
+            loads(bytes(data))
+
+    def test_rejects_unknown_safe_zone(self):
+        data = bytearray(dumps(Game(rows=5, columns=5, mines=3, seed=2)))
+        data[8] = 99  # The safe-zone code
+        with self.assertRaises(ValueError):
+            loads(bytes(data))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# tests/test_placement.py
+
+import random
+import unittest
+import numpy as np
+from mem679_minesweeper.placement import (
+    NumpyRandom, relocate_safe_zone, resolve_rng, safe_zone_indices,
+    sample_mine_indices, sample_mine_plane,
+)
+from mem679_minesweeper.board import Board
+from mem679_minesweeper.array_board import ArrayBoard
+from mem679_minesweeper.game import Game
+
+class TestSafeZone(unittest.TestCase):
+    def test_single_cell(self):
+        self.assertEqual(safe_zone_indices(5, 5, 2, 3, 'cell'), [13])
+
+    def test_three_by_three_is_clipped(self):
+        self.assertEqual(safe_zone_indices(5, 5, 0, 0, '3x3'), [0, 1, 5, 6])
+        self.assertEqual(len(safe_zone_indices(5, 5, 2, 2, '3x3')), 9)
+
+    def test_custom_mask_includes_click(self):
+        mask = np.zeros((4, 4), dtype=bool)
+        mask[3, :] = True
+        self.assertEqual(safe_zone_indices(4, 4, 0, 0, mask), [0, 12, 13, 14, 15])
+
+    def test_invalid_safe_zone(self):
+        with self.assertRaises(ValueError):
+            safe_zone_indices(5, 5, 0, 0, '5x5')
+        with self.assertRaises(ValueError):
+            safe_zone_indices(5, 5, 0, 0, np.zeros((4, 4), dtype=bool))
+
+class TestSampleMineIndices(unittest.TestCase):
+    def test_distinct_and_never_excluded(self):
+        excluded = [0, 1, 5, 6, 17, 24]
+        for seed in range(50):
+            picks = sample_mine_indices(25, 10, excluded, random.Random(seed))
+            self.assertEqual(len(set(picks)), 10)
+            self.assertEqual(picks, sorted(picks))
+            self.assertTrue(all(0 <= p < 25 for p in picks))
+            self.assertFalse(set(picks) & set(excluded))
+
+    def test_fill_every_available_cell(self):
+        picks = sample_mine_indices(9, 8, [4])
+        self.assertEqual(picks, [0, 1, 2, 3, 5, 6, 7, 8])
+
+    def test_too_many_mines(self):
+        with self.assertRaises(ValueError):
+            sample_mine_indices(9, 9, [4])
+
+    def test_huge_sparse_board(self):
+        picks = sample_mine_indices(10 ** 12, 100, [0])
+        self.assertEqual(len(set(picks)), 100)
+
+    def test_plane_matches_indices(self):
+        excluded = [0, 1, 5, 6, 17, 24]
+        for mines in (0, 10, 19):
+            for seed in range(20):
+                plane = np.zeros(25, dtype=bool)
+                sample_mine_plane(plane, mines, excluded, random.Random(seed))
+                self.assertEqual(np.flatnonzero(plane).tolist(),
+                                 sample_mine_indices(25, mines, excluded,
+                                                     random.Random(seed)))
+        with self.assertRaises(ValueError):
+            sample_mine_plane(np.zeros(9, dtype=bool), 9, [4])
+
+class TestBoardSafeZone(unittest.TestCase):
+    def test_three_by_three_opening_on_both_engines(self):
+        for engine in (Board, ArrayBoard):
+            board = engine(rows=9, columns=9, mines=30, safe_zone='3x3')
+            board.place_mines(4, 4)
+            self.assertEqual(board.mine_count, 30)
+            for x in range(3, 6):
+                for y in range(3, 6):
+                    self.assertFalse(board.is_mine(x, y))
+            self.assertEqual(board.grid[4][4].adjacent_mines, 0)
+
+class TestSeeding(unittest.TestCase):
+    def test_resolve_rng(self):
+        seed, rng = resolve_rng()
+        self.assertIsInstance(seed, int)
+        self.assertIsInstance(rng, random.Random)
+        seed, rng = resolve_rng(rng=np.random.default_rng(1))
+        self.assertIsNone(seed)
+        self.assertIsInstance(rng, NumpyRandom)
+
+    def test_same_seed_same_layout_on_every_engine(self):
+        layouts = []
+        for engine in ('cell', 'array'):
+            game = Game(rows=16, columns=30, mines=99, engine=engine, seed=1234)
+            game.reveal_cell(7, 12)
+            layouts.append(game.board.mine_positions())
+        self.assertEqual(layouts[0], layouts[1])
+        other = Game(rows=16, columns=30, mines=99, seed=1235)
+        other.reveal_cell(7, 12)
+        self.assertNotEqual(other.board.mine_positions(), layouts[0])
+
+    def test_unseeded_board_records_its_seed(self):
+        board = Board(rows=9, columns=9, mines=10)
+        board.place_mines(0, 0)
+        replay = ArrayBoard(rows=9, columns=9, mines=10, seed=board.seed)
+        replay.place_mines(0, 0)
+        self.assertEqual(board.mine_positions(), replay.mine_positions())
+
+    def test_counter_based_numpy_generator(self):
+        layouts = []
+        for engine in (Board, ArrayBoard):
+            generator = np.random.Generator(np.random.Philox(99))
+            board = engine(rows=30, columns=30, mines=200, rng=generator)
+            board.place_mines(0, 0)
+            layouts.append(board.mine_positions())
+        self.assertEqual(layouts[0], layouts[1])
+        self.assertEqual(len(layouts[0]), 200)
+
+class TestRelocateSafeZone(unittest.TestCase):
+    def test_zone_cleared_and_counts_consistent(self):
+        for engine in (Board, ArrayBoard):
+            for seed in range(10):
+                board = engine(8, 8, 40, safe_zone='3x3', seed=seed)
+                board.place_mines(0, 0, safe_zone='cell')
+                moved = relocate_safe_zone(board, 4, 4)
+                self.assertEqual(board.mine_count, 40)
+                zone = safe_zone_indices(8, 8, 4, 4, '3x3')
+                self.assertFalse(any(board.is_mine(*divmod(i, 8)) for i in zone))
+                # Adjacency counts match a recount from scratch
+                counts = [[cell.adjacent_mines for cell in row] for row in board.grid]
+                board._calculate_adjacent_mines()
+                self.assertEqual(counts, [[cell.adjacent_mines for cell in row]
+                                          for row in board.grid])
+                self.assertGreaterEqual(moved, 0)
+
+    def test_too_dense(self):
+        board = Board(3, 3, 8, safe_zone='3x3', seed=1)
+        board.place_mines(0, 0, safe_zone='cell')
+        with self.assertRaises(ValueError):
+            relocate_safe_zone(board, 1, 1)
+
+    def test_zone_covering_the_board_is_refused_untouched(self):
+        for engine in (Board, ArrayBoard):
+            board = engine(3, 3, 1, safe_zone='3x3', seed=1)
+            board.place_mines(0, 0, safe_zone='cell')
+            mines = [i for i in range(9) if board.is_mine(*divmod(i, 3))]
+            with self.assertRaisesRegex(ValueError, 'Cannot keep'):
+                relocate_safe_zone(board, 1, 1)
+            self.assertEqual(
+                [i for i in range(9) if board.is_mine(*divmod(i, 3))], mines)
+
+if __name__ == '__main__':
+    unittest.main()
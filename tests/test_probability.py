@@ -0,0 +1,94 @@
+# tests/test_probability.py
+
+import itertools
+import unittest
+import numpy as np
+from mem679_minesweeper.board import Board
+from mem679_minesweeper.array_board import ArrayBoard
+from mem679_minesweeper.adjacency import count_adjacent_mines
+from mem679_minesweeper.probability import mine_probabilities, safest_cell
+
+def brute_force(board, revealed, adjacent):
+    # Average over every layout of total_mines that matches the revealed numbers
+    rows, columns = revealed.shape
+    covered = [i for i in range(rows * columns) if not revealed.flat[i]]
+    totals = np.zeros(rows * columns)
+    layouts = 0
+    for mines in itertools.combinations(covered, board.total_mines):
+        mask = np.zeros(rows * columns, dtype=bool)
+        mask[list(mines)] = True
+        mask = mask.reshape(rows, columns)
+        counts = count_adjacent_mines(mask)
+        if np.array_equal(counts[revealed], adjacent[revealed]):
+            totals += mask.reshape(-1)
+            layouts += 1
+    return (totals / layouts).reshape(rows, columns)
+
+class TestMineProbabilities(unittest.TestCase):
+    def check_against_brute_force(self, engine, seed):
+        board = engine(rows=4, columns=5, mines=4, seed=seed)
+        board.place_mines(0, 0)
+        board.reveal_cell(0, 0)
+        probabilities = mine_probabilities(board)
+        revealed = np.array([[c.is_revealed for c in row] for row in board.grid])
+        adjacent = np.array([[c.adjacent_mines for c in row] for row in board.grid])
+        expected = brute_force(board, revealed, adjacent)
+        self.assertTrue(np.isnan(probabilities[revealed]).all())
+        np.testing.assert_allclose(probabilities[~revealed], expected[~revealed])
+
+    def test_matches_brute_force_on_both_engines(self):
+        for seed in range(8):
+            self.check_against_brute_force(Board, seed)
+            self.check_against_brute_force(ArrayBoard, seed)
+
+    def test_probabilities_sum_to_mine_count(self):
+        board = Board(rows=9, columns=9, mines=10, seed=4)
+        board.place_mines(4, 4)
+        board.reveal_cell(4, 4)
+        probabilities = mine_probabilities(board)
+        self.assertAlmostEqual(float(np.nansum(probabilities)), 10.0)
+
+    def test_trusted_flags_are_certain_mines(self):
+        board = Board(rows=9, columns=9, mines=10, seed=4)
+        board.place_mines(4, 4)
+        board.reveal_cell(4, 4)
+        x, y = board.mine_positions()[0]
+        board.toggle_flag(x, y)
+        probabilities = mine_probabilities(board, trust_flags=True)
+        self.assertEqual(probabilities[x, y], 1.0)
+        self.assertAlmostEqual(float(np.nansum(probabilities)), 10.0)
+
+    def test_inconsistent_flags(self):
+        board = Board(rows=3, columns=3, mines=1, seed=0)
+        board.grid[0][0].set_mine()
+        board._calculate_adjacent_mines()
+        board.grid[1][1].reveal()
+        board.toggle_flag(2, 2)
+        board.toggle_flag(2, 1)
+        with self.assertRaises(ValueError):
+            mine_probabilities(board, trust_flags=True)
+
+    def test_large_component_is_estimated(self):
+        for engine in (Board, ArrayBoard):
+            # Revealing the top row makes the second row one 60-cell component
+            board = engine(rows=3, columns=60, mines=30, seed=0)
+            for y in range(0, 60, 3):
+                board.grid[1][y].set_mine()
+                board.grid[2][y + 1].set_mine()
+            board._calculate_adjacent_mines()
+            for y in range(60):
+                board.grid[0][y].reveal()
+            probabilities = mine_probabilities(board)
+            self.assertTrue(((probabilities[1:] >= 0) & (probabilities[1:] <= 1)).all())
+            self.assertAlmostEqual(float(probabilities[1].sum()), 20, delta=3)
+            self.assertAlmostEqual(float(np.nansum(probabilities)), 30, delta=3)
+
+    def test_safest_cell_is_covered(self):
+        board = ArrayBoard(rows=9, columns=9, mines=10, seed=5)
+        board.place_mines(0, 0)
+        board.reveal_cell(0, 0)
+        x, y = safest_cell(board)
+        self.assertFalse(board.revealed[x, y])
+
+if __name__ == '__main__':
+    unittest.main()
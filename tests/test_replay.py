@@ -0,0 +1,206 @@
+# tests/test_replay.py
+
+import io
+import random
+import unittest
+from mem679_minesweeper.factory import BoardFactory
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.history import History
+from mem679_minesweeper.persistence import dumps
+from mem679_minesweeper.replay import (
+    FOOTER, TRAILER, ReplayRecorder, ReplaySeeker, open_replay, read_replays,
+    verify_archive, verify_replay,
+)
+from mem679_minesweeper.simulation import random_strategy
+
+
+class FakeClock:
+    """
+    A clock that advances by a quarter of a second every time it is read.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.25
+        return self.now
+
+
+def play_recorded(game, archive, seed, keyframe_interval=1000):
+    """
+    Plays a game with the random strategy while recording it, and returns the
+    recorder.
+    """
+    recorder = ReplayRecorder(game, archive, clock=FakeClock(),
+                              keyframe_interval=keyframe_interval)
+    rng = random.Random(seed)
+    while not game.game_over:
+        game.play(*random_strategy(game, rng))
+    recorder.close()
+    return recorder
+
+
+def play_long(game, archive, seed, keyframe_interval):
+    """
+    Records a long game of safe reveals, flags and unflags, and returns the
+    recorder.
+    """
+    recorder = ReplayRecorder(game, archive, clock=FakeClock(),
+                              keyframe_interval=keyframe_interval)
+    rng = random.Random(seed)
+    board = game.board
+    game.reveal_cell(board.rows // 2, board.columns // 2)
+    while not game.game_over and recorder.moves < 60:
+        x, y = rng.randrange(board.rows), rng.randrange(board.columns)
+        if board.grid[x][y].is_revealed:
+            continue
+        if rng.random() < 0.7:
+            game.toggle_flag(x, y)
+        elif not board.grid[x][y].is_flagged and not board.grid[x][y].is_mine:
+            game.reveal_cell(x, y)
+    recorder.close()
+    return recorder
+
+
+class TestReplay(unittest.TestCase):
+    def test_round_trip_verifies(self):
+        archive = io.BytesIO()
+        statuses = [play_recorded(Game(9, 9, 10, seed=seed), archive, seed).game.status
+                    for seed in range(10)]
+        archive.seek(0)
+        results = list(verify_archive(archive))
+        self.assertEqual([result.status for result in results], statuses)
+        self.assertTrue(all(result.valid for result in results))
+
+    def test_archive_is_streamed_in_chunks(self):
+        archive = io.BytesIO()
+        moves = [play_recorded(Game(9, 9, 10, seed=seed), archive, seed).moves
+                 for seed in range(5)]
+        archive.seek(0)
+        replays = list(read_replays(archive, chunk_size=7))
+        self.assertEqual([len(replay) for replay in replays], moves)
+        action, x, y, milliseconds = replays[0].moves()[0]
+        self.assertEqual(action, 'reveal')
+        self.assertEqual(milliseconds, 250)
+
+    def test_prepared_board_and_undo(self):
+        factory = BoardFactory(presets=[])
+        game = Game(board=factory.build(9, 9, 10))
+        archive = io.BytesIO()
+        recorder = ReplayRecorder(game, archive)
+        history = History(game)
+        game.reveal_cell(4, 4)
+        # The board is unseeded, so flag a cell the opening left covered
+        board = game.board
+        x, y = next((x, y) for x in range(9) for y in range(9)
+                    if not board.grid[x][y].is_revealed)
+        game.toggle_flag(x, y)
+        history.undo()
+        history.redo()
+        recorder.close()
+        archive.seek(0)
+        (replay,) = read_replays(archive)
+        self.assertTrue(replay.prepared)
+        self.assertEqual([move[0] for move in replay.moves()],
+                         ['reveal', 'flag', 'undo', 'redo'])
+        result = verify_replay(replay, engine='array')
+        self.assertTrue(result.valid, result.reason)
+
+    def test_tampered_claims_fail(self):
+        archive = io.BytesIO()
+        recorder = play_recorded(Game(9, 9, 10, seed=3), archive, 3)
+        data = bytearray(archive.getvalue())
+        # Claim the other outcome; the trailer precedes the empty index and the footer
+        trailer = slice(-FOOTER.size - TRAILER.size, -FOOTER.size)
+        status = 2 if recorder.game.win else 1
+        data[trailer] = TRAILER.pack(status, recorder.moves)
+        (replay,) = read_replays(io.BytesIO(bytes(data)))
+        result = verify_replay(replay)
+        self.assertFalse(result.valid)
+        self.assertIn('claimed', result.reason)
+        # Drop the last move
+        data[trailer] = TRAILER.pack(status, recorder.moves + 1)
+        (replay,) = read_replays(io.BytesIO(bytes(data)))
+        self.assertFalse(verify_replay(replay).valid)
+
+    def test_truncated_stream(self):
+        archive = io.BytesIO()
+        play_recorded(Game(9, 9, 10, seed=1), archive, 1)
+        with self.assertRaises(ValueError):
+            list(read_replays(io.BytesIO(archive.getvalue()[:-3])))
+
+    def test_recorder_refuses_unreplayable_games(self):
+        started = Game(9, 9, 10, seed=1)
+        started.reveal_cell(0, 0)
+        huge = Game(9, 9, 10, seed=1)
+        huge.board.rows = huge.board.columns = 1 << 15  # Too many cells for a record
+        for game in (started, Game(9, 9, 10, rng=random.Random(1)), huge):
+            with self.assertRaises(ValueError):
+                ReplayRecorder(game, io.BytesIO())
+
+    def test_seek_matches_replaying_from_the_start(self):
+        archive = io.BytesIO()
+        play_recorded(Game(9, 9, 10, seed=0), archive, 0)
+        recorder = play_long(Game(30, 30, 150, seed=2), archive, 2,
+                             keyframe_interval=4)
+        archive.seek(0)
+        replay = list(read_replays(archive, chunk_size=100))[1]
+        self.assertEqual(len(replay.keyframes), recorder.moves // 4)
+        self.assertGreater(len(replay.keyframes), 5)
+        self.assertTrue(verify_replay(replay).valid)
+        moves = replay.moves()
+        seeker = ReplaySeeker(archive, replay)
+        for move in random.Random(0).sample(range(len(replay) + 1), len(replay) + 1):
+            expected = replay.new_game('array')
+            for action, x, y, _ in moves[:move]:
+                expected.play(action, x, y)
+            game = seeker.seek(move)
+            self.assertEqual(game.status, expected.status)
+            self.assertEqual(dumps(game), dumps(expected))
+
+    def test_seek_across_undo(self):
+        game = Game(9, 9, 10, seed=4)
+        archive = io.BytesIO()
+        recorder = ReplayRecorder(game, archive, keyframe_interval=2)
+        history = History(game)
+        states = [dumps(game)]
+        actions = ('reveal', 'flag', 'flag', 'undo', 'undo', 'undo', 'redo', 'flag')
+        for action in actions:
+            if action == 'reveal':
+                game.reveal_cell(4, 4)
+            elif action == 'flag':
+                x, y = next((x, y) for x in range(9) for y in range(9)
+                            if not game.board.grid[x][y].is_revealed
+                            and not game.board.grid[x][y].is_flagged)
+                game.toggle_flag(x, y)
+            else:
+                getattr(history, action)()
+            states.append(dumps(game))
+        recorder.close()
+        replay = open_replay(archive)
+        seeker = ReplaySeeker(archive, replay)
+        for move in (8, 0, 5, 6, 4, 7, 3, 1, 2):
+            self.assertEqual(dumps(seeker.seek(move)), states[move], move)
+
+    def test_corrupt_keyframe_index(self):
+        archive = io.BytesIO()
+        play_long(Game(30, 30, 150, seed=2), archive, 2, keyframe_interval=4)
+        data = bytearray(archive.getvalue())
+        data[-FOOTER.size - 1] ^= 0xFF  # The last byte of the index
+        with self.assertRaises(ValueError):
+            list(read_replays(io.BytesIO(bytes(data))))
+
+    def test_version_1_is_still_read(self):
+        archive = io.BytesIO()
+        recorder = play_recorded(Game(9, 9, 10, seed=1), archive, 1,
+                                 keyframe_interval=0)
+        data = bytearray(archive.getvalue()[:-FOOTER.size])
+        data[4] = 1  # The version
+        (replay,) = read_replays(io.BytesIO(bytes(data)))
+        self.assertEqual(len(replay), recorder.moves)
+        self.assertTrue(verify_replay(replay).valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
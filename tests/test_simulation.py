@@ -0,0 +1,61 @@
+# tests/test_simulation.py
+
+import random
+import unittest
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.simulation import (
+    SimulationResult, game_seed, play_game, random_strategy, simulate,
+)
+
+def first_cell_strategy(game, rng):
+    # Reveals covered cells in row-major order
+    for x, row in enumerate(game.board.grid):
+        for y, cell in enumerate(row):
+            if not cell.is_revealed and not cell.is_flagged:
+                return 'reveal', x, y
+
+def flag_forever_strategy(game, rng):
+    return 'flag', 0, 0
+
+class TestSimulation(unittest.TestCase):
+    def test_game_seed_is_stable_and_distinct(self):
+        self.assertEqual(game_seed(5, 3), game_seed(5, 3))
+        self.assertNotEqual(game_seed(5, 3), game_seed(5, 4))
+        self.assertNotEqual(game_seed(5, 3), game_seed(6, 3))
+
+    def test_random_strategy_picks_covered_cell(self):
+        game = Game(rows=5, columns=5, mines=3, seed=1)
+        game.reveal_cell(0, 0)
+        action, x, y = random_strategy(game, random.Random(0))
+        self.assertEqual(action, 'reveal')
+        self.assertFalse(game.board.grid[x][y].is_revealed)
+
+    def test_play_game_finishes(self):
+        won, moves, seconds = play_game(first_cell_strategy, 9, 9, 10, seed=3)
+        self.assertGreater(moves, 0)
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_move_limit(self):
+        won, moves, _ = play_game(flag_forever_strategy, 5, 5, 3, seed=3, max_moves=7)
+        self.assertFalse(won)
+        self.assertEqual(moves, 7)
+
+    def test_results_independent_of_chunking_and_workers(self):
+        serial = simulate(random_strategy, 24, 9, 9, 10, seed=11, workers=1,
+                          chunk_size=5)
+        parallel = simulate(random_strategy, 24, 9, 9, 10, seed=11, workers=2,
+                            chunk_size=3)
+        self.assertEqual(serial.games, 24)
+        self.assertEqual((serial.wins, serial.moves), (parallel.wins, parallel.moves))
+        self.assertEqual(set(serial.to_dict()), {
+            'games', 'wins', 'win_rate', 'moves', 'moves_per_game', 'seconds_per_game',
+            'wall_seconds',
+        })
+
+    def test_empty_result_averages(self):
+        result = SimulationResult()
+        self.assertEqual(result.win_rate, 0.0)
+        self.assertEqual(result.moves_per_game, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
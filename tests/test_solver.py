@@ -0,0 +1,61 @@
+# tests/test_solver.py
+
+import unittest
+from mem679_minesweeper.game import Game
+from mem679_minesweeper.solver import Solver, solver_strategy
+from mem679_minesweeper.simulation import simulate
+
+class TestSolver(unittest.TestCase):
+    def test_never_steps_on_a_mine(self):
+        for engine in ('cell', 'array'):
+            for seed in range(40):
+                game = Game(rows=9, columns=9, mines=10, engine=engine, seed=seed,
+                            safe_zone='3x3')
+                won = Solver(game).solve()
+                self.assertEqual(won, game.win)
+                self.assertFalse(game.game_over and not game.win)
+                for x, y in game.board.mine_positions():
+                    self.assertFalse(game.board.grid[x][y].is_revealed)
+
+    def test_solves_logic_only_board(self):
+        # Mines packed in a corner behind a wall of numbers the rules can read
+        game = Game(rows=6, columns=6, mines=3, seed=0)
+        game.first_click = False
+        for x, y in [(0, 0), (0, 1), (1, 0)]:
+            game.board.grid[x][y].set_mine()
+        game.board._calculate_adjacent_mines()
+        game.board.mines_placed = True
+        game.reveal_cell(5, 5)
+        self.assertTrue(Solver(game).solve())
+        self.assertTrue(game.win)
+
+    def test_subset_rule(self):
+        # The covered neighbours of (1, 0) are a subset of those of (1, 1), and both
+        # see one mine, so the rest of the neighbours of (1, 1) are safe
+        game = Game(rows=2, columns=3, mines=1, seed=0)
+        game.first_click = False
+        game.board.grid[0][0].set_mine()
+        game.board._calculate_adjacent_mines()
+        game.board.mines_placed = True
+        game.reveal_cell(1, 0)
+        game.reveal_cell(1, 1)
+        solver = Solver(game)
+        self.assertIn(solver.next_move(), [('reveal', 0, 2), ('reveal', 1, 2)])
+
+    def test_stuck_returns_none(self):
+        game = Game(rows=1, columns=3, mines=1, seed=0)
+        game.first_click = False
+        game.board.grid[0][0].set_mine()
+        game.board._calculate_adjacent_mines()
+        game.board.mines_placed = True
+        game.board.grid[0][1].reveal()  # Number 1 with two covered neighbours
+        solver = Solver(game)
+        self.assertIsNone(solver.next_move())
+
+    def test_solver_strategy_in_simulation(self):
+        result = simulate(solver_strategy, 30, 9, 9, 10, seed=2, workers=1)
+        self.assertEqual(result.games, 30)
+        self.assertGreater(result.win_rate, 0.3)
+
+if __name__ == '__main__':
+    unittest.main()